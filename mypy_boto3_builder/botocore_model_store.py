@@ -0,0 +1,151 @@
+"""
+On-disk store of decoded botocore data files.
+"""
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple
+
+from boto3.session import Session
+from botocore.loaders import JSONFileLoader
+
+from mypy_boto3_builder.utils.disk_cache import evict_least_recently_used, write_atomic
+
+__all__ = ("BotocoreModelStore", "StoreFileLoader")
+
+
+class BotocoreModelStore:
+    """
+    On-disk store of decoded botocore data files shared by all sessions, workers and runs.
+
+    Data files are decoded from JSON once and stored as pickles keyed by file path,
+    modification time and size. Disabled until `BotocoreModelStore.enable` is called.
+    """
+
+    path: Optional[Path] = None
+    suffix = ".pickle"
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def enable(cls, path: Path) -> None:
+        """
+        Store decoded data files in `path`.
+
+        Arguments:
+            path -- Store directory.
+        """
+        cls.path = path
+
+    @classmethod
+    def install(cls, session: Session) -> None:
+        """
+        Make `session` loader read data files through the store.
+
+        Arguments:
+            session -- boto3 session.
+        """
+        session._loader.file_loader = StoreFileLoader()  # type: ignore
+
+    @classmethod
+    def get_entry_path(cls, file_path: str) -> Optional[Path]:
+        """
+        Get store entry path for current version of data file.
+
+        Returns:
+            None if store is disabled or data file does not exist.
+        """
+        if cls.path is None:
+            return None
+
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        key = f"{file_path}\0{stat.st_mtime_ns}\0{stat.st_size}"
+        return cls.path / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}{cls.suffix}"
+
+    @classmethod
+    def load(cls, file_path: str, decode: Callable[[], Any]) -> Any:
+        """
+        Get decoded data file from store or decode and store it.
+
+        Arguments:
+            file_path -- Full path to data file.
+            decode -- Data file decoder.
+
+        Returns:
+            Decoded data or None if data file does not exist.
+        """
+        entry_path = cls.get_entry_path(file_path)
+        if entry_path is None:
+            return decode()
+
+        try:
+            data = pickle.loads(entry_path.read_bytes())
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        else:
+            entry_path.touch()
+            cls.hits += 1
+            return data
+
+        cls.misses += 1
+        data = decode()
+        if data is not None:
+            write_atomic(entry_path, pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        return data
+
+    @classmethod
+    def evict(cls, max_size: int) -> None:
+        """
+        Remove least recently used entries until store fits `max_size` bytes.
+        """
+        if cls.path is None or not cls.path.exists():
+            return
+
+        evict_least_recently_used(cls.path, f"*{cls.suffix}", max_size)
+
+    @classmethod
+    def get_counters(cls) -> Tuple[int, int]:
+        """
+        Get store hits and misses.
+        """
+        return cls.hits, cls.misses
+
+    @classmethod
+    def add_counters(cls, hits: int, misses: int) -> None:
+        """
+        Add store hits and misses from worker processes.
+        """
+        cls.hits += hits
+        cls.misses += misses
+
+
+class StoreFileLoader(JSONFileLoader):
+    """
+    Botocore file loader that reads data files through `BotocoreModelStore`.
+    """
+
+    # data file extensions checked by `JSONFileLoader.load_file` in order
+    EXTENSIONS = (".json", ".json.gz")
+
+    def load_file(self, file_path: str) -> Any:
+        """
+        Load decoded data file from store or decode it with `JSONFileLoader`.
+
+        Arguments:
+            file_path -- Data file path without extension.
+
+        Returns:
+            Decoded data or None if data file does not exist.
+        """
+        for extension in self.EXTENSIONS:
+            full_path = f"{file_path}{extension}"
+            if os.path.isfile(full_path):
+                return BotocoreModelStore.load(
+                    full_path, lambda: super(StoreFileLoader, self).load_file(file_path)
+                )
+        return super().load_file(file_path)
@@ -0,0 +1,122 @@
+"""
+Manifest of generated service packages for incremental builds.
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable
+
+from mypy_boto3_builder.constants import BUILD_MANIFEST_NAME
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+__all__ = ("BuildManifest", "get_builder_hash")
+
+# File types that affect generated output
+BUILDER_SOURCE_SUFFIXES = (".py", ".pyi", ".jinja2")
+
+# File types that affect parsed service packages
+PARSER_SOURCE_SUFFIXES = (".py", ".pyi")
+
+
+def get_builder_hash(*parts: str, suffixes: Iterable[str] = BUILDER_SOURCE_SUFFIXES) -> str:
+    """
+    Get hash of builder sources, templates and build settings.
+
+    Arguments:
+        parts -- Build settings, e.g. builder and boto3 versions.
+        suffixes -- Builder source file types to include.
+
+    Returns:
+        SHA256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    for part in parts:
+        hasher.update(part.encode())
+        hasher.update(b"\0")
+
+    builder_path = Path(__file__).parent
+    suffixes = tuple(suffixes)
+    source_paths = [i for i in builder_path.glob("**/*") if i.suffix in suffixes and i.is_file()]
+    for source_path in sorted(source_paths):
+        hasher.update(source_path.relative_to(builder_path).as_posix().encode())
+        hasher.update(source_path.read_bytes())
+    return hasher.hexdigest()
+
+
+class BuildManifest:
+    """
+    Manifest of generated service packages for incremental builds.
+
+    Stores botocore model hash for every generated service.
+    All records are dropped if `builder_hash` has changed.
+
+    Arguments:
+        path -- Manifest file path.
+        builder_hash -- Hash of builder sources and build settings.
+        services -- Map of service name to botocore model hash.
+    """
+
+    def __init__(self, path: Path, builder_hash: str, services: Dict[str, str]) -> None:
+        self.path = path
+        self.builder_hash = builder_hash
+        self.services = dict(services)
+
+    @classmethod
+    def load(cls, output_path: Path, builder_hash: str) -> "BuildManifest":
+        """
+        Load manifest from `output_path` or create an empty one.
+
+        Arguments:
+            output_path -- Output path.
+            builder_hash -- Hash of builder sources and build settings.
+        """
+        logger = get_logger()
+        path = output_path / BUILD_MANIFEST_NAME
+        result = cls(path, builder_hash, {})
+        if not path.exists():
+            return result
+
+        try:
+            data = json.loads(path.read_text())
+        except ValueError:
+            logger.warning(f"Invalid build manifest {NicePath(path)}, ignoring")
+            return result
+
+        if data.get("builder_hash") != builder_hash:
+            logger.info("Builder or build settings changed, rebuilding all services")
+            return result
+
+        result.services.update(data.get("services", {}))
+        return result
+
+    def is_changed(self, service_name: ServiceName, model_hash: str) -> bool:
+        """
+        Whether service has to be generated.
+
+        Arguments:
+            service_name -- Target service name.
+            model_hash -- Current botocore model hash.
+        """
+        return self.services.get(service_name.name) != model_hash
+
+    def add(self, service_name: ServiceName, model_hash: str) -> None:
+        """
+        Set botocore model hash for generated service.
+
+        Arguments:
+            service_name -- Generated service name.
+            model_hash -- Botocore model hash used for generation.
+        """
+        self.services[service_name.name] = model_hash
+
+    def save(self) -> None:
+        """
+        Write manifest to disk.
+        """
+        data = {
+            "builder_hash": self.builder_hash,
+            "services": dict(sorted(self.services.items())),
+        }
+        self.path.write_text(json.dumps(data, indent=4))
@@ -5,10 +5,12 @@ import argparse
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Sequence
+from typing import List, Optional, Sequence
 
 import pkg_resources
 
+from mypy_boto3_builder.constants import SERVICE_PACKAGE_CACHE_SIZE
+
 
 def get_absolute_path(path: str) -> Path:
     """
@@ -23,6 +25,25 @@ def get_absolute_path(path: str) -> Path:
     return Path(path).absolute()
 
 
+def get_positive_int(value: str) -> int:
+    """
+    Get positive integer from a string.
+
+    Arguments:
+        value -- String containing integer.
+
+    Returns:
+        Integer greater than zero.
+    """
+    try:
+        result = int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from e
+    if result < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {value!r}")
+    return result
+
+
 @dataclass
 class Namespace:
     """
@@ -39,6 +60,13 @@ class Namespace:
     builder_version: str
     generate_docs: bool
     list_services: bool
+    jobs: int = 1
+    incremental: bool = False
+    cache_dir: Optional[Path] = None
+    cache_size: int = SERVICE_PACKAGE_CACHE_SIZE
+    format_once: bool = False
+    skip_isort: bool = False
+    profile_path: Optional[Path] = None
 
 
 def parse_args(args: Sequence[str]) -> Namespace:
@@ -97,6 +125,48 @@ def parse_args(args: Sequence[str]) -> Namespace:
         action="store_true",
         help="List supported boto3 service names.",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=get_positive_int,
+        default=1,
+        metavar="N",
+        help="Generate service packages in N worker processes.",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Skip service modules with unchanged botocore models since the last build.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=get_absolute_path,
+        metavar="CACHE_DIR",
+        help="Cache parsed service packages in CACHE_DIR between runs.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=SERVICE_PACKAGE_CACHE_SIZE,
+        metavar="MB",
+        help=f"Size limit of each cache in megabytes, default {SERVICE_PACKAGE_CACHE_SIZE}.",
+    )
+    parser.add_argument(
+        "--format-once",
+        action="store_true",
+        help="Format service stubs once and write the same content to .py and .pyi files.",
+    )
+    parser.add_argument(
+        "--skip-isort",
+        action="store_true",
+        help="Do not run isort on service modules, imports are rendered pre-sorted.",
+    )
+    parser.add_argument(
+        "--profile",
+        type=get_absolute_path,
+        metavar="REPORT_PATH",
+        help="Save time spent in build phases of each service to REPORT_PATH (.json or .csv).",
+    )
     result = parser.parse_args(args)
     result.builder_version = version
     return Namespace(
@@ -110,4 +180,11 @@ def parse_args(args: Sequence[str]) -> Namespace:
         builder_version=result.builder_version,
         generate_docs=result.docs,
         list_services=result.list_services,
+        jobs=result.jobs,
+        incremental=result.incremental,
+        cache_dir=result.cache_dir,
+        cache_size=result.cache_size,
+        format_once=result.format_once,
+        skip_isort=result.skip_isort,
+        profile_path=result.profile,
     )
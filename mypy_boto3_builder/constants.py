@@ -34,3 +34,39 @@ LINE_LENGTH = 100
 TYPE_DEFS_NAME = "type_defs"
 
 LOGGER_NAME = "mypy_boto3_builder"
+
+# Botocore data types used to build service packages
+SERVICE_MODEL_TYPES = ("service-2", "paginators-1", "waiters-2", "resources-1")
+
+# Incremental build manifest file name in output path
+BUILD_MANIFEST_NAME = ".mypy_boto3_builder.json"
+
+# Format version of on-disk ServicePackage cache, bump on incompatible structure changes
+SERVICE_PACKAGE_CACHE_VERSION = 1
+
+# Default ServicePackage cache size limit in megabytes
+SERVICE_PACKAGE_CACHE_SIZE = 1024
+
+# Formatted content cache directory name in `--cache-dir`
+FORMATTER_CACHE_NAME = "formatted"
+
+# Decoded botocore data files store directory name in `--cache-dir`
+BOTOCORE_MODEL_CACHE_NAME = "botocore"
+
+# Compiled Jinja2 templates cache directory name in `--cache-dir`
+JINJA_BYTECODE_CACHE_NAME = "jinja"
+
+# Service metadata index file name in `--cache-dir`
+SERVICE_METADATA_INDEX_NAME = "services.json"
+
+# pyparsing packrat cache size, smallest size with the best docstring parsing time
+PACKRAT_CACHE_SIZE = 64
+
+# Typed dicts rendered and formatted at once by streaming `type_defs` writer
+TYPE_DEFS_CHUNK_SIZE = 100
+
+# Manifests of written output files directory name in `--cache-dir`
+OUTPUT_MANIFEST_CACHE_NAME = "outputs"
+
+# Slowest phases and services listed in `--profile` summary
+PROFILE_TOP_SIZE = 10
@@ -0,0 +1,120 @@
+"""
+Group of import records from the same source.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from mypy_boto3_builder.constants import LINE_LENGTH, MODULE_NAME
+from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_string import ImportString
+
+
+class ImportRecordGroup:
+    """
+    Group of import records from the same source rendered as one statement.
+
+    Sections and order match `isort` output with `black` profile,
+    so rendered imports do not need to be sorted.
+
+    Arguments:
+        source -- Source of imports.
+        import_records -- Import records in render order.
+    """
+
+    third_party_names = ("boto3", "botocore", "typing_extensions")
+
+    def __init__(self, source: ImportString, import_records: Iterable[ImportRecord]) -> None:
+        self.source = source
+        self.import_records = list(import_records)
+
+    def render(self) -> str:
+        """
+        Render import statement, wrapped `black`-style if it is too long.
+        """
+        if len(self.import_records) == 1:
+            return self.import_records[0].render()
+
+        names = [i.name for i in self.import_records]
+        result = f"from {self.source} import {', '.join(names)}"
+        if len(result) <= LINE_LENGTH:
+            return result
+
+        lines = [f"from {self.source} import ("]
+        lines.extend(f"    {name}," for name in names)
+        lines.append(")")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _get_name_key(name: str) -> Tuple[int, str]:
+        if name.isupper() and len(name) > 1:
+            return (0, name.lower())
+        if name[:1].isupper():
+            return (1, name.lower())
+        return (2, name.lower())
+
+    @classmethod
+    def _get_section_index(cls, source: ImportString, module_name: str) -> int:
+        master_name = source.master_name
+        if not master_name:
+            return 3
+        if master_name == module_name:
+            return 2
+        if master_name in cls.third_party_names or master_name.startswith(MODULE_NAME):
+            return 1
+        return 0
+
+    @classmethod
+    def get_sections(
+        cls, import_records: Iterable[ImportRecord], module_name: str
+    ) -> List[List["ImportRecordGroup"]]:
+        """
+        Group import records into sorted non-empty sections.
+
+        Sections are stdlib, third-party, first-party and local imports.
+        Records with fallback are skipped, they are rendered separately.
+
+        Arguments:
+            import_records -- Import records to group.
+            module_name -- First-party module name.
+
+        Returns:
+            A list of sections with groups in render order.
+        """
+        straight_records: Dict[str, ImportRecord] = {}
+        from_records: Dict[str, Dict[str, ImportRecord]] = {}
+        alias_records: Dict[str, Dict[str, ImportRecord]] = {}
+        sources: Dict[str, ImportString] = {}
+        for import_record in import_records:
+            if import_record.fallback or not import_record:
+                continue
+            source_str = import_record.source.render()
+            sources[source_str] = import_record.source
+            if not import_record.name:
+                straight_records[str(import_record)] = import_record
+            elif import_record.alias:
+                alias_records.setdefault(source_str, {})[str(import_record)] = import_record
+            else:
+                from_records.setdefault(source_str, {})[import_record.name] = import_record
+
+        sections: List[List[Tuple[Tuple[int, str], ImportRecordGroup]]] = [[], [], [], []]
+        for import_record in straight_records.values():
+            section = sections[cls._get_section_index(import_record.source, module_name)]
+            key = (0, import_record.source.render().lower())
+            section.append((key, cls(import_record.source, [import_record])))
+
+        for source_str, source in sources.items():
+            section = sections[cls._get_section_index(source, module_name)]
+            key = (1, source_str.lower())
+            records = from_records.get(source_str, {})
+            if records:
+                sorted_records = sorted(records.values(), key=lambda x: cls._get_name_key(x.name))
+                section.append((key, cls(source, sorted_records)))
+            aliased = alias_records.get(source_str, {})
+            for import_record in sorted(aliased.values(), key=lambda x: cls._get_name_key(x.name)):
+                section.append((key, cls(source, [import_record])))
+
+        result: List[List[ImportRecordGroup]] = []
+        for section in sections:
+            if section:
+                section.sort(key=lambda x: x[0])
+                result.append([group for _, group in section])
+        return result
@@ -1,7 +1,8 @@
 """
 Jinja2 `Environment` manager.
 """
-from typing import Any
+from pathlib import Path
+from typing import Any, Optional
 
 import jinja2
 
@@ -13,11 +14,15 @@ __all__ = ["JinjaManager"]
 class JinjaManager:
     """
     Jinja2 `Environment` manager.
+
+    Templates are not reloaded on changes, they are shipped with the package.
     """
 
+    bytecode_cache_path: Optional[Path] = None
     _environment = jinja2.Environment(
         loader=jinja2.FileSystemLoader(TEMPLATES_PATH.as_posix()),
         undefined=jinja2.StrictUndefined,
+        auto_reload=False,
     )
 
     @classmethod
@@ -30,6 +35,20 @@ class JinjaManager:
         """
         cls._environment.globals.update(kwargs)
 
+    @classmethod
+    def enable_bytecode_cache(cls, path: Path) -> None:
+        """
+        Store compiled templates in `path` to skip compilation in new processes.
+
+        Cached bytecode is checked against template source checksum.
+
+        Arguments:
+            path -- Cache directory.
+        """
+        path.mkdir(exist_ok=True, parents=True)
+        cls.bytecode_cache_path = path
+        cls._environment.bytecode_cache = jinja2.FileSystemBytecodeCache(path.as_posix())
+
     @classmethod
     def get_environment(cls) -> jinja2.Environment:
         """
@@ -2,28 +2,46 @@
 Main entrypoint for builder.
 """
 import sys
-from typing import List
+from pathlib import Path
+from typing import Dict, List, Optional
 
 from boto3 import __version__ as boto3_version
 from boto3.session import Session
 from botocore import __version__ as botocore_version
 
+from mypy_boto3_builder.botocore_model_store import BotocoreModelStore
+from mypy_boto3_builder.build_manifest import (
+    PARSER_SOURCE_SUFFIXES,
+    BuildManifest,
+    get_builder_hash,
+)
 from mypy_boto3_builder.cli_parser import Namespace, parse_args
 from mypy_boto3_builder.constants import (
     BOTO3_STUBS_NAME,
+    BOTOCORE_MODEL_CACHE_NAME,
     BOTOCORE_STUBS_NAME,
     DUMMY_REGION,
+    FORMATTER_CACHE_NAME,
+    JINJA_BYTECODE_CACHE_NAME,
     MODULE_NAME,
+    OUTPUT_MANIFEST_CACHE_NAME,
+    PROFILE_TOP_SIZE,
     PYPI_NAME,
+    SERVICE_METADATA_INDEX_NAME,
 )
 from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parallel import process_services_parallel
+from mypy_boto3_builder.parsers.method_memo import MethodMemo
+from mypy_boto3_builder.parsers.service_package_registry import ServicePackageRegistry
+from mypy_boto3_builder.service_metadata_index import ServiceMetadataIndex
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
-from mypy_boto3_builder.utils.strings import (
-    get_anchor_link,
-    get_botocore_class_name,
-    get_min_build_version,
-)
+from mypy_boto3_builder.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.utils.botocore_models import get_service_model_hash
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.profiler import Profiler
+from mypy_boto3_builder.utils.strings import get_anchor_link, get_min_build_version
+from mypy_boto3_builder.writers.output_sink import OutputSink
 from mypy_boto3_builder.writers.processors import (
     process_boto3_stubs,
     process_boto3_stubs_docs,
@@ -32,27 +50,29 @@ from mypy_boto3_builder.writers.processors import (
     process_service,
     process_service_docs,
 )
+from mypy_boto3_builder.writers.utils import FormatterCache
 
 
-def get_available_service_names(session: Session) -> List[ServiceName]:
+def get_available_service_names(
+    session: Session, index_path: Optional[Path] = None
+) -> List[ServiceName]:
     """
     Get a list of boto3 supported service names.
 
     Arguments:
         session -- Boto3 session
+        index_path -- Service metadata index path, keep index in memory if not set.
 
     Returns:
         A list of supported services.
     """
-    available_services = session.get_available_services()
-    botocore_session = session._session  # type: ignore
+    index = ServiceMetadataIndex(session, index_path)
     result = []
-    for name in available_services:
-        service_data = botocore_session.get_service_data(name)
-        metadata = service_data["metadata"]
-        class_name = get_botocore_class_name(metadata)
-        service_name = ServiceNameCatalog.add(name, class_name)
+    for name in session.get_available_services():
+        record = index.get_record(name)
+        service_name = ServiceNameCatalog.add(name, record.class_name)
         result.append(service_name)
+    index.save()
     return result
 
 
@@ -62,9 +82,16 @@ def main() -> None:
     """
     args = parse_args(sys.argv[1:])
     logger = get_logger(level=args.log_level)
+    if args.profile_path:
+        Profiler.enable()
     session = Session(region_name=DUMMY_REGION)
+    if args.cache_dir:
+        BotocoreModelStore.enable(args.cache_dir / BOTOCORE_MODEL_CACHE_NAME)
+        BotocoreModelStore.install(session)
     args.output_path.mkdir(exist_ok=True)
-    available_service_names = get_available_service_names(session)
+    available_service_names = get_available_service_names(
+        session, args.cache_dir / SERVICE_METADATA_INDEX_NAME if args.cache_dir else None
+    )
     available_service_names_set = {i.name for i in available_service_names}
     service_names: List[ServiceName] = []
 
@@ -107,6 +134,11 @@ def main() -> None:
         hasattr=hasattr,
     )
 
+    if args.cache_dir:
+        FormatterCache.enable(args.cache_dir / FORMATTER_CACHE_NAME)
+        JinjaManager.enable_bytecode_cache(args.cache_dir / JINJA_BYTECODE_CACHE_NAME)
+        OutputSink.enable(args.cache_dir / OUTPUT_MANIFEST_CACHE_NAME)
+
     logger.info(f"Bulding version {build_version}")
 
     if args.generate_docs:
@@ -114,9 +146,39 @@ def main() -> None:
     else:
         generate_stubs(args, service_names, session)
 
+    if args.cache_dir:
+        FormatterCache.evict(args.cache_size * 1024 * 1024)
+        hits, misses = FormatterCache.get_counters()
+        logger.info(f"Formatter cache: {hits} hits, {misses} misses")
+        BotocoreModelStore.evict(args.cache_size * 1024 * 1024)
+        hits, misses = BotocoreModelStore.get_counters()
+        logger.info(f"Botocore model store: {hits} hits, {misses} misses")
+
+    hits, misses = MethodMemo.get_counters()
+    logger.info(f"Method memo: {hits} hits, {misses} misses")
+
+    if args.profile_path:
+        report_profile(args.profile_path)
+
     logger.info("Completed")
 
 
+def report_profile(report_path: Path) -> None:
+    """
+    Save `Profiler` report and log the slowest phases.
+
+    Arguments:
+        report_path -- JSON or CSV report path.
+    """
+    logger = get_logger()
+    Profiler.write_report(report_path)
+    logger.info(f"Profile report saved to {NicePath(report_path)}")
+    for stats in Profiler.get_phase_totals()[:PROFILE_TOP_SIZE]:
+        logger.info(f"Profile: {stats.render()}")
+    for stats in Profiler.get_top(PROFILE_TOP_SIZE):
+        logger.info(f"Profile: {stats.render()}")
+
+
 def generate_stubs(args: Namespace, service_names: List[ServiceName], session: Session) -> None:
     """
     Generate service and master stubs.
@@ -127,19 +189,9 @@ def generate_stubs(args: Namespace, service_names: List[ServiceName], session: S
         session -- Botocore session
     """
     logger = get_logger()
+    registry = ServicePackageRegistry()
     if not args.skip_services:
-        total_str = f"{len(service_names)}"
-        for index, service_name in enumerate(service_names):
-            current_str = f"{{:0{len(total_str)}}}".format(index + 1)
-            logger.info(f"[{current_str}/{total_str}] Generating {service_name.module_name} module")
-            service_name.boto3_version = boto3_version
-            process_service(
-                session=session,
-                output_path=args.output_path,
-                service_name=service_name,
-                generate_setup=not args.installed,
-            )
-            service_name.boto3_version = ServiceName.LATEST
+        generate_service_stubs(args, service_names, session, registry)
 
     if not args.skip_master:
         if not args.installed:
@@ -149,6 +201,7 @@ def generate_stubs(args: Namespace, service_names: List[ServiceName], session: S
                 args.output_path,
                 service_names,
                 generate_setup=not args.installed,
+                registry=registry,
             )
 
         logger.info(f"Generating {BOTO3_STUBS_NAME} module")
@@ -157,6 +210,7 @@ def generate_stubs(args: Namespace, service_names: List[ServiceName], session: S
             args.output_path,
             service_names,
             generate_setup=not args.installed,
+            registry=registry,
         )
 
         logger.info(f"Generating {BOTOCORE_STUBS_NAME} module")
@@ -166,6 +220,92 @@ def generate_stubs(args: Namespace, service_names: List[ServiceName], session: S
         )
 
 
+def generate_service_stubs(
+    args: Namespace,
+    service_names: List[ServiceName],
+    session: Session,
+    registry: ServicePackageRegistry,
+) -> None:
+    """
+    Generate service stubs.
+
+    Skips services with unchanged botocore models in incremental mode.
+
+    Arguments:
+        args -- Config namespace
+        service_names -- Enabled service names
+        session -- Botocore session
+        registry -- Registry to add parsed service packages to
+    """
+    logger = get_logger()
+    manifest: Optional[BuildManifest] = None
+    model_hashes: Dict[str, str] = {}
+    if args.incremental:
+        builder_hash = get_builder_hash(
+            args.builder_version,
+            str(args.build_version),
+            str(args.installed),
+            str(args.format_once),
+            str(args.skip_isort),
+            boto3_version,
+            botocore_version,
+        )
+        manifest = BuildManifest.load(args.output_path, builder_hash)
+        model_hashes = {i.name: get_service_model_hash(session, i) for i in service_names}
+        changed_service_names = [
+            i for i in service_names if manifest.is_changed(i, model_hashes[i.name])
+        ]
+        skipped_count = len(service_names) - len(changed_service_names)
+        logger.info(f"Skipping {skipped_count} services with unchanged botocore models")
+        service_names = changed_service_names
+
+    cache: Optional[ServicePackageCache] = None
+    if args.cache_dir:
+        parser_hash = get_builder_hash(
+            args.builder_version,
+            boto3_version,
+            botocore_version,
+            suffixes=PARSER_SOURCE_SUFFIXES,
+        )
+        cache = ServicePackageCache(args.cache_dir, parser_hash, args.cache_size * 1024 * 1024)
+
+    if args.jobs > 1:
+        logger.info(f"Generating {len(service_names)} service modules in {args.jobs} processes")
+        service_packages = process_services_parallel(
+            service_names,
+            output_path=args.output_path,
+            generate_setup=not args.installed,
+            jobs=args.jobs,
+            cache=cache,
+            format_once=args.format_once,
+            skip_isort=args.skip_isort,
+        )
+        for service_package in service_packages:
+            registry.add(service_package)
+    else:
+        total_str = f"{len(service_names)}"
+        for index, service_name in enumerate(service_names):
+            current_str = f"{{:0{len(total_str)}}}".format(index + 1)
+            logger.info(f"[{current_str}/{total_str}] Generating {service_name.module_name} module")
+            service_name.boto3_version = boto3_version
+            service_package = process_service(
+                session=session,
+                output_path=args.output_path,
+                service_name=service_name,
+                generate_setup=not args.installed,
+                cache=cache,
+                format_once=args.format_once,
+                skip_isort=args.skip_isort,
+            )
+            service_name.boto3_version = ServiceName.LATEST
+            registry.add(service_package)
+
+    if manifest is not None:
+        for service_name in service_names:
+            manifest.add(service_name, model_hashes[service_name.name])
+        manifest.save()
+
+
 def generate_docs(args: Namespace, service_names: List[ServiceName], session: Session) -> None:
     """
     Generate service and master docs.
@@ -176,16 +316,18 @@ def generate_docs(args: Namespace, service_names: List[ServiceName], session: Se
         session -- Botocore session
     """
     logger = get_logger()
+    registry = ServicePackageRegistry()
     if not args.skip_services:
         total_str = f"{len(service_names)}"
         for index, service_name in enumerate(service_names):
             current_str = f"{{:0{len(total_str)}}}".format(index + 1)
             logger.info(f"[{current_str}/{total_str}] Generating {service_name.module_name} module")
-            process_service_docs(
+            service_package = process_service_docs(
                 session=session,
                 output_path=args.output_path,
                 service_name=service_name,
             )
+            registry.add(service_package)
 
     if not args.skip_master:
         logger.info(f"Generating {BOTO3_STUBS_NAME} module")
@@ -193,6 +335,7 @@ def generate_docs(args: Namespace, service_names: List[ServiceName], session: Se
             session,
             args.output_path,
             service_names,
+            registry=registry,
         )
 
 
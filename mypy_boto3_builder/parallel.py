@@ -0,0 +1,257 @@
+"""
+Process pool for parallel service packages generation.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+from boto3 import __version__ as boto3_version
+from boto3.session import Session
+
+from mypy_boto3_builder.botocore_model_store import BotocoreModelStore
+from mypy_boto3_builder.constants import DUMMY_REGION
+from mypy_boto3_builder.jinja_manager import JinjaManager
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.fake_service_package import get_fake_service_package
+from mypy_boto3_builder.parsers.method_memo import MethodMemo
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+from mypy_boto3_builder.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.profiler import PhaseStats, Profiler
+from mypy_boto3_builder.writers.output_sink import OutputSink
+from mypy_boto3_builder.writers.processors import process_service
+from mypy_boto3_builder.writers.utils import FormatterCache
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+__all__ = ("ParallelBuildError", "process_services_parallel")
+
+
+class ParallelBuildError(Exception):
+    """
+    Raised when one or more services failed to generate in worker processes.
+    """
+
+
+class _WorkerState:
+    """
+    Per-process state of a service generation worker.
+    """
+
+    session: Optional[Session] = None
+
+    @classmethod
+    def get_session(cls) -> Session:
+        """
+        Get worker-owned boto3 session.
+        """
+        if cls.session is None:
+            cls.session = Session(region_name=DUMMY_REGION)
+            if BotocoreModelStore.path is not None:
+                BotocoreModelStore.install(cls.session)
+        return cls.session
+
+
+def init_worker(
+    log_level: int,
+    catalog: Sequence[Tuple[str, str]],
+    jinja_globals: Dict[str, Any],
+    formatter_cache_path: Optional[Path] = None,
+    botocore_model_store_path: Optional[Path] = None,
+    profile: bool = False,
+    jinja_bytecode_cache_path: Optional[Path] = None,
+    output_manifests_path: Optional[Path] = None,
+) -> None:
+    """
+    Initialize worker process state.
+
+    Arguments:
+        log_level -- Log level for worker logger.
+        catalog -- Pairs of service name and class name to restore `ServiceNameCatalog`.
+        jinja_globals -- Globals for worker `jinja2.Environment`.
+        formatter_cache_path -- `FormatterCache` directory, if enabled.
+        botocore_model_store_path -- `BotocoreModelStore` directory, if enabled.
+        profile -- Collect `Profiler` statistics.
+        jinja_bytecode_cache_path -- `JinjaManager` bytecode cache directory, if enabled.
+        output_manifests_path -- `OutputSink` manifests directory, if enabled.
+    """
+    get_logger(level=log_level)
+    for name, class_name in catalog:
+        ServiceNameCatalog.add(name, class_name)
+    JinjaManager.update_globals(**jinja_globals)
+    if jinja_bytecode_cache_path is not None:
+        JinjaManager.enable_bytecode_cache(jinja_bytecode_cache_path)
+    if formatter_cache_path is not None:
+        FormatterCache.enable(formatter_cache_path)
+    if botocore_model_store_path is not None:
+        BotocoreModelStore.enable(botocore_model_store_path)
+    if output_manifests_path is not None:
+        OutputSink.enable(output_manifests_path)
+    if profile:
+        Profiler.enable()
+
+
+def process_service_worker(
+    name: str,
+    output_path: Path,
+    generate_setup: bool,
+    cache: Optional[ServicePackageCache] = None,
+    format_once: bool = False,
+    skip_isort: bool = False,
+) -> Tuple[ServicePackage, Tuple[int, int], Tuple[int, int], Tuple[int, int], List[PhaseStats]]:
+    """
+    Parse and write service package in a worker process.
+
+    Arguments:
+        name -- Service name to look up in `ServiceNameCatalog`.
+        output_path -- Package output path.
+        generate_setup -- Generate ready-to-install or to-use package.
+        cache -- Cache of parsed service packages.
+        format_once -- Write `.pyi`-formatted content to `.py` twins.
+        skip_isort -- Rely on pre-sorted import sections instead of `isort`.
+
+    Returns:
+        Fake copy of parsed ServicePackage, `FormatterCache`, `BotocoreModelStore`
+        and `MethodMemo` hits and misses and `Profiler` statistics.
+    """
+    service_name = ServiceNameCatalog.find(name)
+    hits, misses = FormatterCache.get_counters()
+    store_hits, store_misses = BotocoreModelStore.get_counters()
+    memo_hits, memo_misses = MethodMemo.get_counters()
+    service_name.boto3_version = boto3_version
+    try:
+        service_package = process_service(
+            session=_WorkerState.get_session(),
+            service_name=service_name,
+            output_path=output_path,
+            generate_setup=generate_setup,
+            cache=cache,
+            format_once=format_once,
+            skip_isort=skip_isort,
+        )
+    finally:
+        service_name.boto3_version = ServiceName.LATEST
+    new_hits, new_misses = FormatterCache.get_counters()
+    new_store_hits, new_store_misses = BotocoreModelStore.get_counters()
+    new_memo_hits, new_memo_misses = MethodMemo.get_counters()
+    return (
+        get_fake_service_package(service_package),
+        (new_hits - hits, new_misses - misses),
+        (new_store_hits - store_hits, new_store_misses - store_misses),
+        (new_memo_hits - memo_hits, new_memo_misses - memo_misses),
+        Profiler.pop_stats(),
+    )
+
+
+def process_services_parallel(
+    service_names: Sequence[ServiceName],
+    output_path: Path,
+    generate_setup: bool,
+    jobs: int,
+    cache: Optional[ServicePackageCache] = None,
+    format_once: bool = False,
+    skip_isort: bool = False,
+) -> List[ServicePackage]:
+    """
+    Parse and write service packages `mypy_boto3_*` in a process pool.
+
+    Progress is reported in `service_names` order, failures are collected
+    and reported together after all services are processed.
+
+    Arguments:
+        service_names -- Service names to process.
+        output_path -- Package output path.
+        generate_setup -- Generate ready-to-install or to-use package.
+        jobs -- Number of worker processes.
+        cache -- Cache of parsed service packages.
+        format_once -- Write `.pyi`-formatted content to `.py` twins.
+        skip_isort -- Rely on pre-sorted import sections instead of `isort`.
+
+    Returns:
+        Fake copies of parsed service packages.
+
+    Raises:
+        ParallelBuildError -- If any service failed to generate.
+    """
+    logger = get_logger()
+    catalog = [(i.name, i.class_name) for i in ServiceNameCatalog.ITEMS.values()]
+    jinja_globals = dict(JinjaManager.get_environment().globals)
+    total_str = f"{len(service_names)}"
+    result: List[ServicePackage] = []
+    errors: List[Tuple[ServiceName, BaseException]] = []
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=init_worker,
+        initargs=(
+            logger.level,
+            catalog,
+            jinja_globals,
+            FormatterCache.path,
+            BotocoreModelStore.path,
+            Profiler.enabled,
+            JinjaManager.bytecode_cache_path,
+            OutputSink.manifests_path,
+        ),
+    ) as executor:
+        futures: List[
+            Tuple[
+                ServiceName,
+                Future[
+                    Tuple[
+                        ServicePackage,
+                        Tuple[int, int],
+                        Tuple[int, int],
+                        Tuple[int, int],
+                        List[PhaseStats],
+                    ]
+                ],
+            ]
+        ] = [
+            (
+                service_name,
+                executor.submit(
+                    process_service_worker,
+                    service_name.name,
+                    output_path,
+                    generate_setup,
+                    cache,
+                    format_once,
+                    skip_isort,
+                ),
+            )
+            for service_name in service_names
+        ]
+        for index, (service_name, future) in enumerate(futures):
+            current_str = f"{{:0{len(total_str)}}}".format(index + 1)
+            try:
+                (
+                    service_package,
+                    formatter_counters,
+                    store_counters,
+                    memo_counters,
+                    profiler_stats,
+                ) = future.result()
+            except Exception as e:
+                logger.error(
+                    f"[{current_str}/{total_str}] Failed {service_name.module_name} module: {e}"
+                )
+                errors.append((service_name, e))
+                continue
+            logger.info(f"[{current_str}/{total_str}] Generated {service_name.module_name} module")
+            service_package.service_name = service_name
+            result.append(service_package)
+            FormatterCache.add_counters(*formatter_counters)
+            BotocoreModelStore.add_counters(*store_counters)
+            MethodMemo.add_counters(*memo_counters)
+            Profiler.add_stats(profiler_stats)
+
+    if errors:
+        for service_name, error in errors:
+            logger.error(f"{service_name.module_name}: {error.__class__.__name__}: {error}")
+            if error.__cause__:
+                logger.debug(error.__cause__)
+        failed_names = ", ".join(i.name for i, _ in errors)
+        raise ParallelBuildError(f"Failed to generate {len(errors)} services: {failed_names}")
+
+    return result
@@ -0,0 +1,127 @@
+"""
+Per-service boto3 client and resource context shared by parsers.
+"""
+from typing import Any, Dict, Optional
+
+from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from boto3.session import Session
+from boto3.utils import ServiceContext
+from botocore.client import BaseClient
+from botocore.errorfactory import BaseClientExceptions
+from botocore.exceptions import DataNotFoundError
+from botocore.loaders import Loader
+from botocore.model import ServiceModel
+from botocore.waiter import WaiterModel
+
+from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client, get_boto3_resource
+from mypy_boto3_builder.service_name import ServiceName
+
+__all__ = ("Boto3Context",)
+
+
+class Boto3Context:
+    """
+    Per-service boto3 client and resource context shared by parsers.
+
+    Creates exactly one boto3 client per service. Service model, client exceptions,
+    waiter model and ServiceResource are taken from or built on top of this client.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+    """
+
+    def __init__(self, session: Session, service_name: ServiceName) -> None:
+        self.session = session
+        self.service_name = service_name
+        self.client: BaseClient = get_boto3_client(session, service_name)
+        self.service_model: ServiceModel = self.client.meta.service_model
+        self._client_exceptions: Optional[BaseClientExceptions] = None
+        self._waiter_model: Optional[WaiterModel] = None
+        self._waiter_model_loaded = False
+        self._resource_model: Optional[Dict[str, Any]] = None
+        self._resource_model_loaded = False
+        self._resource: Optional[Boto3ServiceResource] = None
+        self._resource_loaded = False
+
+    @property
+    def client_exceptions(self) -> BaseClientExceptions:
+        """
+        Client exceptions, created once by session exceptions factory.
+        """
+        if self._client_exceptions is None:
+            self._client_exceptions = self.client.exceptions
+        return self._client_exceptions
+
+    @property
+    def waiter_model(self) -> Optional[WaiterModel]:
+        """
+        Service waiter model or None if service has no waiters.
+        """
+        if not self._waiter_model_loaded:
+            self._waiter_model_loaded = True
+            try:
+                self._waiter_model = self.session._session.get_waiter_model(  # type: ignore
+                    self.service_name.boto3_name
+                )
+            except DataNotFoundError:
+                self._waiter_model = None
+        return self._waiter_model
+
+    @property
+    def resource_model(self) -> Optional[Dict[str, Any]]:
+        """
+        Raw `resources-1` data or None if service has no ServiceResource.
+        """
+        if not self._resource_model_loaded:
+            self._resource_model_loaded = True
+            loader: Loader = self.session._loader  # type: ignore
+            try:
+                self._resource_model = loader.load_service_model(
+                    self.service_name.boto3_name, "resources-1"
+                )
+            except DataNotFoundError:
+                self._resource_model = None
+        return self._resource_model
+
+    @property
+    def resource(self) -> Optional[Boto3ServiceResource]:
+        """
+        Boto3 ServiceResource on top of context client or None.
+        """
+        if not self._resource_loaded:
+            self._resource_loaded = True
+            self._resource = self._create_resource()
+        return self._resource
+
+    def get_service_context(self) -> ServiceContext:
+        """
+        Get boto3 resource factory service context.
+        """
+        resource_model = self.resource_model or {}
+        return ServiceContext(
+            service_name=self.service_name.boto3_name,
+            resource_json_definitions=resource_model.get("resources", {}),
+            service_model=self.service_model,
+            service_waiter_model=self.waiter_model,
+        )
+
+    def _create_resource(self) -> Optional[Boto3ServiceResource]:
+        resource_model = self.resource_model
+        if resource_model is None:
+            return None
+
+        loader: Loader = self.session._loader  # type: ignore
+        boto3_name = self.service_name.boto3_name
+        resource_api_version = loader.determine_latest_version(boto3_name, "resources-1")
+        client_api_version = loader.determine_latest_version(boto3_name, "service-2")
+        if resource_api_version != client_api_version:
+            # resource is paired with an older client model
+            return get_boto3_resource(self.session, self.service_name)
+
+        resource_class = self.session.resource_factory.load_from_definition(
+            resource_name=boto3_name,
+            single_resource_json_definition=resource_model["service"],
+            service_context=self.get_service_context(),
+        )
+        return resource_class(client=self.client)
@@ -1,14 +1,14 @@
 """
 Parser that produces `structures.Boto3StubsPackage`.
 """
-from typing import List
+from typing import List, Optional
 
 from boto3.session import Session
 from botocore.config import Config
 
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.import_helpers.import_string import ImportString
-from mypy_boto3_builder.parsers.fake_service_package import parse_fake_service_package
+from mypy_boto3_builder.parsers.service_package_registry import ServicePackageRegistry
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
@@ -22,7 +22,9 @@ from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 
 
 def parse_boto3_stubs_package(
-    session: Session, service_names: List[ServiceName]
+    session: Session,
+    service_names: List[ServiceName],
+    registry: Optional[ServicePackageRegistry] = None,
 ) -> Boto3StubsPackage:
     """
     Parse data for boto3_stubs package.
@@ -30,13 +32,16 @@ def parse_boto3_stubs_package(
     Arguments:
         session -- boto3 session.
         service_names -- All available service names.
+        registry -- Already parsed service packages.
 
     Returns:
         Boto3StubsPackage structure.
     """
+    if registry is None:
+        registry = ServicePackageRegistry()
     result = Boto3StubsPackage(service_names=service_names)
     for service_name in result.service_names:
-        result.service_packages.append(parse_fake_service_package(session, service_name))
+        result.service_packages.append(registry.get(session, service_name))
 
     init_arguments = [
         Argument("region_name", TypeSubscript(Type.Optional, [Type.str]), Type.none),
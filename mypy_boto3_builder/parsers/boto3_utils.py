@@ -1,12 +1,15 @@
 """
 Getters for boto3 client and resource from session.
 """
-from typing import Optional
+from typing import List, Optional
 
 from boto3.exceptions import ResourceNotExistsError
 from boto3.resources.base import ServiceResource as Boto3ServiceResource
 from boto3.session import Session
+from botocore import xform_name
 from botocore.client import BaseClient
+from botocore.exceptions import DataNotFoundError
+from botocore.loaders import Loader
 
 from mypy_boto3_builder.service_name import ServiceName
 
@@ -42,3 +45,53 @@ def get_boto3_resource(
         return session.resource(service_name.boto3_name)  # type: ignore
     except ResourceNotExistsError:
         return None
+
+
+def get_boto3_waiter_names(session: Session, service_name: ServiceName) -> List[str]:
+    """
+    Get client waiter names from botocore data without creating a client.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- ServiceName instance.
+
+    Returns:
+        Sorted snake_case waiter names, the same as `BaseClient.waiter_names`.
+    """
+    loader: Loader = session._loader  # type: ignore
+    api_version = loader.determine_latest_version(service_name.boto3_name, "service-2")
+    try:
+        waiters_model = loader.load_service_model(service_name.boto3_name, "waiters-2", api_version)
+    except DataNotFoundError:
+        return []
+    return [xform_name(i) for i in sorted(waiters_model["waiters"])]
+
+
+def get_boto3_paginator_names(session: Session, service_name: ServiceName) -> List[str]:
+    """
+    Get client paginator names from botocore data without creating a client.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- ServiceName instance.
+
+    Returns:
+        Sorted paginator names, the same as `ShapeParser.get_paginator_names`.
+    """
+    loader: Loader = session._loader  # type: ignore
+    try:
+        paginators_model = loader.load_service_model(service_name.boto3_name, "paginators-1")
+    except DataNotFoundError:
+        return []
+    return sorted(paginators_model.get("pagination", []))
+
+
+def has_boto3_resource(session: Session, service_name: ServiceName) -> bool:
+    """
+    Check if boto3 has a service resource for service without creating it.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- ServiceName instance.
+    """
+    return service_name.boto3_name in session.get_available_resources()
@@ -2,36 +2,68 @@
 Boto3 client parser, produces `structures.Client`.
 """
 import inspect
+from types import MethodType
 
-from boto3.session import Session
-from botocore.client import ClientMeta
-from botocore.errorfactory import ClientExceptionsFactory
+from botocore.client import BaseClient, ClientMeta
+from botocore.docs.bcdoc.restdoc import DocumentStructure
+from botocore.docs.docstring import ClientMethodDocstring
 
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client
+from mypy_boto3_builder.parsers.boto3_context import Boto3Context
 from mypy_boto3_builder.parsers.helpers import get_public_methods, parse_method
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
-from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.attribute import Attribute
 from mypy_boto3_builder.structures.client import Client
 from mypy_boto3_builder.type_annotations.internal_import import InternalImport
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_class import TypeClass
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
-from mypy_boto3_builder.utils.strings import get_short_docstring
+from mypy_boto3_builder.utils.strings import get_short_docstring, get_short_docstring_from_prefix
 
 
-def parse_client(session: Session, service_name: ServiceName, shape_parser: ShapeParser) -> Client:
+def get_client_method_short_docstring(
+    client: BaseClient, method_name: str, method: MethodType
+) -> str:
+    """
+    Get short docstring of a boto3 client method.
+
+    Full operation docstrings document every input and output shape,
+    so only the leading operation description is rendered if it is enough.
+
+    Arguments:
+        client -- Boto3 client.
+        method_name -- Method name.
+        method -- Client method.
+
+    Returns:
+        The same value as `get_short_docstring` for the full docstring.
+    """
+    operation_name = client.meta.method_to_api_mapping.get(method_name)
+    if operation_name and isinstance(method.__doc__, ClientMethodDocstring):
+        operation_model = client.meta.service_model.operation_model(operation_name)
+        docstring_structure = DocumentStructure("docstring", target="html")
+        intro_section = docstring_structure.add_new_section("method-intro")
+        intro_section.include_doc_string(operation_model.documentation)
+        description = docstring_structure.flush_structure().decode("utf-8")
+        docstring = get_short_docstring_from_prefix(description)
+        if docstring is not None:
+            return docstring
+
+    return get_short_docstring(inspect.getdoc(method) or "")
+
+
+def parse_client(context: Boto3Context, shape_parser: ShapeParser) -> Client:
     """
     Parse boto3 client to a structure.
 
     Arguments:
-        session -- boto3 session.
-        service_name -- Target service name.
+        context -- Service boto3 context.
+        shape_parser -- Service shape parser.
 
     Returns:
         Client structure.
     """
-    client = get_boto3_client(session, service_name)
+    service_name = context.service_name
+    client = context.client
     public_methods = get_public_methods(client)
 
     # remove methods that will be overriden
@@ -51,9 +83,12 @@ def parse_client(session: Session, service_name: ServiceName, shape_parser: Shap
     for method_name, public_method in public_methods.items():
         if method_name in shape_method_map:
             method = shape_method_map[method_name]
+        elif method_name in client.meta.method_to_api_mapping:
+            # operation is not included in a subset build
+            continue
         else:
             method = parse_method("Client", method_name, public_method, service_name)
-        docstring = get_short_docstring(inspect.getdoc(public_method) or "")
+        docstring = get_client_method_short_docstring(client, method_name, public_method)
         method.docstring = "".join(
             (
                 f"{docstring}\n\n" if docstring else "",
@@ -65,8 +100,7 @@ def parse_client(session: Session, service_name: ServiceName, shape_parser: Shap
         )
         result.methods.append(method)
 
-    service_model = client.meta.service_model
-    client_exceptions = ClientExceptionsFactory().create_client_exceptions(service_model)
+    client_exceptions = context.client_exceptions
     for exception_class_name in dir(client_exceptions):
         if exception_class_name.startswith("_"):
             continue
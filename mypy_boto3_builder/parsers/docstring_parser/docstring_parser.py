@@ -3,14 +3,23 @@ Botocore docstring parser.
 """
 import re
 import textwrap
-from typing import Any, Dict, List, Optional, Pattern
+from typing import Any, Callable, Dict, List, Optional, Pattern
 
-from pyparsing import ParseException
+from pyparsing import ParseException, ParserElement
 
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.docstring_parser.grammar_session import GrammarSession
 from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
+from mypy_boto3_builder.parsers.docstring_parser.syntax_tokenizer import (
+    SyntaxTokenizer,
+    SyntaxTokenizerError,
+)
 from mypy_boto3_builder.parsers.docstring_parser.type_doc_grammar import TypeDocGrammar
 from mypy_boto3_builder.parsers.docstring_parser.type_doc_line import TypeDocLine
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_tokenizer import (
+    TypeDocTokenizer,
+    TypeDocTokenizerError,
+)
 from mypy_boto3_builder.parsers.docstring_parser.type_value import TypeValue
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
@@ -58,6 +67,51 @@ class DocstringParser:
         self.arguments_map[name] = Argument(name, Type.Any, Type.none)
         return self.arguments_map[name]
 
+    def _parse_syntax(
+        self,
+        name: str,
+        syntax_string: str,
+        tokenizer_method: Callable[[str], Dict[str, Any]],
+        grammar: ParserElement,
+    ) -> Dict[str, Any]:
+        """
+        Parse request or response syntax with `SyntaxTokenizer`, fallback to `SyntaxGrammar`.
+
+        Raises:
+            ParseException -- If `SyntaxGrammar` cannot parse `syntax_string`.
+        """
+        try:
+            with GrammarSession.measure(f"SyntaxTokenizer.{name}"):
+                return tokenizer_method(syntax_string)
+        except SyntaxTokenizerError as e:
+            self.logger.debug(f"Fallback to syntax grammar for {self.prefix}: {e}")
+
+        with GrammarSession.measure(f"SyntaxGrammar.{name}"):
+            return grammar.parseString(syntax_string).asDict()
+
+    def _parse_type_doc(
+        self,
+        name: str,
+        type_doc_string: str,
+        tokenizer_method: Callable[[str], Dict[str, Any]],
+        grammar: ParserElement,
+    ) -> Dict[str, Any]:
+        """
+        Parse `:type` or `:param` definition with `TypeDocTokenizer`, fallback to `TypeDocGrammar`.
+
+        Raises:
+            ParseException -- If `TypeDocGrammar` cannot parse `type_doc_string`.
+        """
+        try:
+            with GrammarSession.measure(f"TypeDocTokenizer.{name}"):
+                return tokenizer_method(type_doc_string)
+        except TypeDocTokenizerError as e:
+            self.logger.debug(f"Fallback to type doc grammar for {self.prefix}: {e}")
+
+        TypeDocGrammar.reset()
+        with GrammarSession.measure(f"TypeDocGrammar.{name}"):
+            return grammar.parseString(type_doc_string).asDict()
+
     def _parse_request_syntax(self, input_string: str) -> None:
         if "**Request Syntax**" not in input_string:
             return
@@ -67,16 +121,19 @@ class DocstringParser:
             request_syntax_index = request_syntax_index - 1
         request_syntax_string = get_line_with_indented(input_string[request_syntax_index:], True)
 
-        SyntaxGrammar.reset()
-        SyntaxGrammar.enable_packrat()
         try:
-            match = SyntaxGrammar.request_syntax.parseString(request_syntax_string)
+            match_dict = self._parse_syntax(
+                "request_syntax",
+                request_syntax_string,
+                SyntaxTokenizer.parse_request_syntax,
+                SyntaxGrammar.request_syntax,
+            )
         except ParseException as e:
             self.logger.warning(f"Cannot parse request syntax for {self.prefix}")
             self.logger.debug(e)
             return
 
-        argument_groups = match.asDict().get("arguments", [])
+        argument_groups = match_dict.get("arguments", [])
         for argument_dict in argument_groups:
             argument_name = argument_dict["name"]
             argument_prefix = self.prefix + get_class_prefix(argument_name)
@@ -90,16 +147,19 @@ class DocstringParser:
             return
 
         type_strings = [i for i in input_string.split("\n") if i.startswith(":type ")]
-        TypeDocGrammar.reset()
         for type_string in type_strings:
             try:
-                match = TypeDocGrammar.type_definition.parseString(type_string)
+                match_dict = self._parse_type_doc(
+                    "type_definition",
+                    type_string,
+                    TypeDocTokenizer.parse_type_definition,
+                    TypeDocGrammar.type_definition,
+                )
             except ParseException as e:
                 self.logger.warning(f"Cannot parse type definition {type_string} for {self.prefix}")
                 self.logger.debug(e)
                 continue
 
-            match_dict: Dict[str, str] = match.asDict()  # type: ignore
             argument_name = match_dict["name"]
             type_str = match_dict["type_name"]
             argument = self._find_argument_or_append(argument_name)
@@ -119,9 +179,13 @@ class DocstringParser:
             start_index = re_match.start()
             param_string = get_line_with_indented(input_string[start_index + 1 :])
 
-            TypeDocGrammar.reset()
             try:
-                match = TypeDocGrammar.param_definition.parseString(param_string)
+                match_dict = self._parse_type_doc(
+                    "param_definition",
+                    param_string,
+                    TypeDocTokenizer.parse_param_definition,
+                    TypeDocGrammar.param_definition,
+                )
             except ParseException as e:
                 self.logger.warning(
                     f"Cannot parse param definition {param_string} for {self.prefix}"
@@ -129,7 +193,7 @@ class DocstringParser:
                 self.logger.debug(e)
                 continue
 
-            argument_line = TypeDocLine(**match.asDict())
+            argument_line = TypeDocLine(**match_dict)
             if not argument_line.name:
                 continue
 
@@ -207,10 +271,10 @@ class DocstringParser:
     def _parse_returns(self, input_string: str) -> Optional[FakeAnnotation]:
         if ":return: " not in input_string and ":returns: " not in input_string:
             return None
-        TypeDocGrammar.reset()
         returns_string = input_string[input_string.index(":return") :].split("\n", 1)[0]
         try:
-            match = TypeDocGrammar.returns_definition.parseString(returns_string)
+            with GrammarSession.measure("TypeDocGrammar.returns_definition"):
+                match = TypeDocGrammar.returns_definition.parseString(returns_string)
         except ParseException as e:
             self.logger.warning(f"Cannot parse returns for {self.prefix}: {e}")
             return None
@@ -234,10 +298,10 @@ class DocstringParser:
         if ":rtype: " not in input_string:
             return None
 
-        TypeDocGrammar.reset()
         rtype_string = input_string[input_string.index(":rtype: ") :].split("\n", 1)[0]
         try:
-            match = TypeDocGrammar.rtype_definition.parseString(rtype_string)
+            with GrammarSession.measure("TypeDocGrammar.rtype_definition"):
+                match = TypeDocGrammar.rtype_definition.parseString(rtype_string)
         except ParseException as e:
             self.logger.warning(f"Cannot parse rtype for {self.prefix}: {e}")
             return None
@@ -255,16 +319,18 @@ class DocstringParser:
             response_syntax_index -= 1
         response_syntax_string = get_line_with_indented(input_string[response_syntax_index:], True)
 
-        SyntaxGrammar.reset()
-        SyntaxGrammar.enable_packrat()
         try:
-            match = SyntaxGrammar.response_syntax.parseString(response_syntax_string)
+            match_dict = self._parse_syntax(
+                "response_syntax",
+                response_syntax_string,
+                SyntaxTokenizer.parse_response_syntax,
+                SyntaxGrammar.response_syntax,
+            )
         except ParseException as e:
             self.logger.warning(f"Cannot parse response syntax for {self.prefix}")
             self.logger.debug(e)
             return None
 
-        match_dict: Dict[str, Dict[str, Any]] = match.asDict()  # type: ignore
         value = match_dict["value"]
         return TypeValue(self.service_name, f"{self.prefix}Response", value).get_type()
 
@@ -283,7 +349,8 @@ class DocstringParser:
 
         TypeDocGrammar.reset()
         try:
-            match = TypeDocGrammar.response_structure.parseString(response_structure_string)
+            with GrammarSession.measure("TypeDocGrammar.response_structure"):
+                match = TypeDocGrammar.response_structure.parseString(response_structure_string)
         except ParseException as e:
             self.logger.warning(f"Cannot parse response structure for {self.prefix}")
             self.logger.debug(e)
@@ -0,0 +1,98 @@
+"""
+Process-wide pyparsing session for docstring grammars.
+"""
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from pyparsing import ParserElement
+
+from mypy_boto3_builder.constants import PACKRAT_CACHE_SIZE
+
+__all__ = ("GrammarSession", "GrammarStats")
+
+
+class GrammarStats:
+    """
+    Timing and packrat cache statistics of a grammar.
+
+    Arguments:
+        name -- Grammar name.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def render(self) -> str:
+        """
+        Render statistics to a log-friendly string.
+        """
+        result = f"{self.name} {self.calls}x {self.time:.3f}s"
+        cache_lookups = self.cache_hits + self.cache_misses
+        if cache_lookups:
+            result = f"{result} {self.cache_hits}/{cache_lookups} cache hits"
+        return result
+
+
+class GrammarSession:
+    """
+    Process-wide pyparsing session for docstring grammars.
+
+    Enables bounded packrat cache once per process and collects per-grammar statistics.
+    """
+
+    enabled = False
+    stats: Dict[str, GrammarStats] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Enable packrat cache with `PACKRAT_CACHE_SIZE` limit.
+        """
+        if cls.enabled:
+            return
+
+        ParserElement.enablePackrat(cache_size_limit=PACKRAT_CACHE_SIZE)
+        cls.enabled = True
+
+    @classmethod
+    @contextmanager
+    def measure(cls, name: str) -> Iterator[None]:
+        """
+        Collect time and packrat cache statistics of a grammar or tokenizer run.
+
+        Arguments:
+            name -- Grammar name.
+        """
+        cls.enable()
+        cache_hits, cache_misses = ParserElement.packrat_cache_stats
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if name not in cls.stats:
+                cls.stats[name] = GrammarStats(name)
+            stats = cls.stats[name]
+            stats.calls += 1
+            stats.time += time.perf_counter() - start
+            stats.cache_hits += ParserElement.packrat_cache_stats[0] - cache_hits
+            stats.cache_misses += ParserElement.packrat_cache_stats[1] - cache_misses
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """
+        Clear collected statistics.
+        """
+        cls.stats = {}
+
+    @classmethod
+    def render_stats(cls) -> str:
+        """
+        Render collected statistics sorted by time.
+        """
+        stats = sorted(cls.stats.values(), key=lambda x: x.time, reverse=True)
+        return ", ".join(i.render() for i in stats)
@@ -7,7 +7,6 @@ from pyparsing import (
     Group,
     Literal,
     Optional,
-    ParserElement,
     SkipTo,
     Word,
     alphanums,
@@ -128,24 +127,3 @@ class SyntaxGrammar:
         + Literal("::")
         + Group(list_value | dict_value).setResultsName("value")
     )
-
-    @classmethod
-    def reset(cls) -> None:
-        """
-        Reset packrat boost.
-        """
-        cls.disable_packrat()
-
-    @staticmethod
-    def enable_packrat() -> None:
-        """
-        Enable packrat boost.
-        """
-        ParserElement.enablePackrat(cache_size_limit=128)
-
-    @staticmethod
-    def disable_packrat() -> None:
-        """
-        Disable packrat boost.
-        """
-        ParserElement.enablePackrat(cache_size_limit=None)
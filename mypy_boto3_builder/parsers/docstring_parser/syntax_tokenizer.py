@@ -0,0 +1,353 @@
+"""
+Hand-written parser for request and response syntax.
+"""
+import string
+from typing import Any, Callable, Dict, List, NoReturn, Tuple
+
+__all__ = ("SyntaxTokenizer", "SyntaxTokenizerError")
+
+
+Token = Tuple[str, str, int]
+
+
+class SyntaxTokenizerError(Exception):
+    """
+    Input is not supported by SyntaxTokenizer, `SyntaxGrammar` should be used instead.
+    """
+
+
+class SyntaxTokenizer:
+    """
+    Fast tokenizer-based equivalent of `SyntaxGrammar`.
+
+    Produces the same dictionaries as `asDict()` of `SyntaxGrammar` parse results.
+    Raises `SyntaxTokenizerError` on any input that it cannot handle exactly like `SyntaxGrammar`.
+
+    Arguments:
+        text -- Request or response syntax string.
+    """
+
+    whitespace = " \n\t\r"
+    string_prefix_chars = frozenset(string.ascii_letters)
+    name_chars = frozenset(string.ascii_letters + string.digits + "_-.")
+    argument_name_chars = frozenset(string.ascii_letters + string.digits)
+    punctuation = frozenset("[]{}(),:|=")
+    ellipsis = "..."
+    union_delimiter = "or"
+
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.position = 0
+
+    @classmethod
+    def parse_request_syntax(cls, text: str) -> Dict[str, Any]:
+        """
+        Parse `**Request Syntax**` block.
+
+        Arguments:
+            text -- Request syntax string.
+
+        Returns:
+            A dictionary with a list of `arguments`.
+        """
+        tokenizer = cls(text)
+        tokenizer.skip_header("**Request Syntax**")
+        return tokenizer.parse_definition()
+
+    @classmethod
+    def parse_response_syntax(cls, text: str) -> Dict[str, Any]:
+        """
+        Parse `**Response Syntax**` block.
+
+        Arguments:
+            text -- Response syntax string.
+
+        Returns:
+            A dictionary with response `value`.
+        """
+        tokenizer = cls(text)
+        tokenizer.skip_header("**Response Syntax**")
+        kind, value, _ = tokenizer.peek()
+        if kind == "[":
+            return {"value": tokenizer.parse_list_value()}
+        if kind == "{":
+            result = tokenizer.parse_dict_or_set_value()
+            if "set_items" not in result:
+                return {"value": result}
+
+        tokenizer.fail(f"Expected list or dict, got {value}")
+
+    def fail(self, message: str) -> NoReturn:
+        """
+        Raise an error with current position.
+        """
+        raise SyntaxTokenizerError(f"{message} at {self.position}")
+
+    def skip_whitespace(self) -> int:
+        """
+        Get position of the next non-whitespace character.
+        """
+        position = self.position
+        text = self.text
+        while position < len(text) and text[position] in self.whitespace:
+            position += 1
+        return position
+
+    def skip_header(self, header: str) -> None:
+        """
+        Skip block header and `::` marker.
+        """
+        for literal in (header, "::"):
+            self.position = self.skip_whitespace()
+            if not self.text.startswith(literal, self.position):
+                self.fail(f"Expected {literal}")
+            self.position += len(literal)
+
+    def peek(self) -> Token:
+        """
+        Get next token without consuming it.
+
+        Returns:
+            A tuple of token kind, token value and token end position.
+        """
+        text = self.text
+        start = self.skip_whitespace()
+        if start >= len(text):
+            return ("", "", start)
+
+        char = text[start]
+        if char in self.punctuation:
+            return (char, char, start + 1)
+
+        prefix_end = start
+        while (
+            prefix_end < len(text)
+            and prefix_end - start < 2
+            and text[prefix_end] in self.string_prefix_chars
+        ):
+            prefix_end += 1
+        if prefix_end < len(text) and text[prefix_end] == "'":
+            end = text.find("'", prefix_end + 1)
+            if end == -1:
+                self.fail("Unterminated string")
+            return ("string", text[start : end + 1], end + 1)
+
+        end = start
+        while end < len(text) and text[end] in self.name_chars:
+            end += 1
+        if end == start:
+            self.fail(f"Unexpected character {char}")
+        return ("name", text[start:end], end)
+
+    def consume(self, kind: str) -> str:
+        """
+        Consume next token of `kind`.
+
+        Returns:
+            Token value.
+        """
+        token_kind, value, end = self.peek()
+        if token_kind != kind:
+            self.fail(f"Expected {kind}, got {value}")
+        self.position = end
+        return value
+
+    def consume_optional(self, kind: str, value: str = "") -> bool:
+        """
+        Consume next token if it is of `kind` and has `value`.
+
+        Returns:
+            True if token was consumed.
+        """
+        token_kind, token_value, end = self.peek()
+        if token_kind != kind or (value and token_value != value):
+            return False
+        self.position = end
+        return True
+
+    def is_next(self, kind: str, value: str = "") -> bool:
+        """
+        Whether next token is of `kind` and has `value`.
+        """
+        token_kind, token_value, _ = self.peek()
+        return token_kind == kind and (not value or token_value == value)
+
+    def parse_definition(self) -> Dict[str, Any]:
+        """
+        Parse method call with keyword arguments.
+        """
+        start = self.text.find("(", self.skip_whitespace())
+        if start == -1:
+            self.fail("Expected (")
+        self.position = start + 1
+
+        arguments: List[Dict[str, Any]] = []
+        while True:
+            kind, value, _ = self.peek()
+            if kind != "name":
+                break
+            if not set(value).issubset(self.argument_name_chars):
+                self.fail(f"Invalid argument name {value}")
+            self.consume("name")
+            self.consume("=")
+            arguments.append({"name": value, "value": self.parse_any_value()})
+            if not self.is_next(","):
+                break
+            if self.is_name_after_comma():
+                self.consume(",")
+                continue
+            break
+
+        self.consume_optional(",")
+        self.consume(")")
+        if not arguments:
+            return {}
+        return {"arguments": arguments}
+
+    def is_name_after_comma(self) -> bool:
+        """
+        Whether next comma is followed by a name token.
+        """
+        position = self.position
+        self.consume(",")
+        result = self.is_next("name")
+        self.position = position
+        return result
+
+    def parse_delimited(self, parse_item: Callable[[], Dict[str, Any]], closing: str) -> List[Any]:
+        """
+        Parse comma-delimited items with an optional trailing comma until `closing`.
+        """
+        result = [parse_item()]
+        while self.consume_optional(","):
+            if self.is_next(closing):
+                break
+            result.append(parse_item())
+        self.consume(closing)
+        return result
+
+    def parse_any_value(self) -> Dict[str, Any]:
+        """
+        Parse any value.
+        """
+        kind, value, end = self.peek()
+        if kind == "name":
+            position = self.position
+            self.position = end
+            is_func_call = self.is_next("(")
+            self.position = position
+            if is_func_call:
+                return self.parse_func_call()
+
+        first_item = self.parse_literal_item()
+        if self.is_next("|"):
+            return self.parse_literal_value(first_item)
+        if "value" in first_item and self.is_next("name", self.union_delimiter):
+            return self.parse_union_value(first_item)
+        return first_item
+
+    def parse_literal_item(self) -> Dict[str, Any]:
+        """
+        Parse list, dict, set or plain value.
+        """
+        kind, value, end = self.peek()
+        if kind == "[":
+            return self.parse_list_value()
+        if kind == "{":
+            return self.parse_dict_or_set_value()
+        if kind in ("string", "name"):
+            self.position = end
+            return {"value": value}
+
+        self.fail(f"Unexpected token {value}")
+
+    def parse_literal_value(self, first_item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse `|`-delimited literal items after `first_item`.
+        """
+        rest_items: List[Dict[str, Any]] = []
+        while self.consume_optional("|"):
+            rest_items.append(self.parse_literal_item())
+        return {"literal_first_item": first_item, "literal_rest_items": rest_items}
+
+    def parse_union_value(self, first_item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parse `or`-delimited union items after `first_item`.
+        """
+        rest_items: List[Dict[str, Any]] = []
+        while self.consume_optional("name", self.union_delimiter):
+            item = self.parse_literal_item()
+            if self.is_next("|"):
+                item = self.parse_literal_value(item)
+            rest_items.append(item)
+        return {"union_first_item": first_item, "union_rest_items": rest_items}
+
+    def parse_func_call(self) -> Dict[str, Any]:
+        """
+        Parse function call.
+        """
+        func_call: Dict[str, Any] = {"name": self.consume("name")}
+        self.consume("(")
+        if self.consume_optional(","):
+            self.consume(")")
+        elif not self.consume_optional(")"):
+            func_call["args"] = self.parse_delimited(self.parse_any_value, ")")
+        return {"func_call": func_call}
+
+    def parse_empty(self, opening: str, closing: str) -> List[str]:
+        """
+        Parse empty list or dict with optional ellipsis.
+
+        Returns:
+            Parsed tokens or an empty list if collection is not empty.
+        """
+        position = self.position
+        tokens = [self.consume(opening)]
+        if self.consume_optional("name", self.ellipsis):
+            tokens.append(self.ellipsis)
+        if self.consume_optional(","):
+            tokens.append(",")
+        if self.consume_optional(closing):
+            tokens.append(closing)
+            return tokens
+
+        self.position = position
+        return []
+
+    def parse_list_value(self) -> Dict[str, Any]:
+        """
+        Parse empty or non-empty list.
+        """
+        empty_tokens = self.parse_empty("[", "]")
+        if empty_tokens:
+            return {"empty_list": empty_tokens}
+
+        self.consume("[")
+        return {"list_items": self.parse_delimited(self.parse_any_value, "]")}
+
+    def parse_dict_item(self) -> Dict[str, Any]:
+        """
+        Parse dict key and value.
+        """
+        key = self.consume("string")
+        self.consume(":")
+        return {"key": key, "value": self.parse_any_value()}
+
+    def parse_dict_or_set_value(self) -> Dict[str, Any]:
+        """
+        Parse empty dict, non-empty dict or set.
+        """
+        empty_tokens = self.parse_empty("{", "}")
+        if empty_tokens:
+            return {"empty_dict": empty_tokens}
+
+        self.consume("{")
+        kind, _, end = self.peek()
+        position = self.position
+        self.position = end
+        is_dict = kind == "string" and self.is_next(":")
+        self.position = position
+        if is_dict:
+            return {"dict_items": self.parse_delimited(self.parse_dict_item, "}")}
+
+        return {"set_items": self.parse_delimited(self.parse_any_value, "}")}
@@ -7,7 +7,6 @@ from pyparsing import (
     LineStart,
     Literal,
     Optional,
-    ParserElement,
     SkipTo,
     White,
     Word,
@@ -119,23 +118,8 @@ class TypeDocGrammar:
     @classmethod
     def reset(cls) -> None:
         """
-        Reset call stack and packrat.
+        Reset indentation stack.
         """
-        cls.disable_packrat()
         cls.indented_block.setFailAction(cls.fail_action)
         cls.indent_stack.clear()
         cls.indent_stack.append(1)
-
-    @staticmethod
-    def enable_packrat() -> None:
-        """
-        Enable packrat boost.
-        """
-        ParserElement.enablePackrat(cache_size_limit=128)
-
-    @staticmethod
-    def disable_packrat() -> None:
-        """
-        Disable packrat boost.
-        """
-        ParserElement.enablePackrat(cache_size_limit=None)
@@ -0,0 +1,142 @@
+"""
+Hand-written parser for argument type doc lines.
+"""
+import re
+from typing import Any, Dict, List, Pattern, Tuple
+
+__all__ = ("TypeDocTokenizer", "TypeDocTokenizerError")
+
+
+class TypeDocTokenizerError(Exception):
+    """
+    Input is not supported by TypeDocTokenizer, `TypeDocGrammar` should be used instead.
+    """
+
+
+class TypeDocTokenizer:
+    """
+    Fast line-based equivalent of `TypeDocGrammar` definitions.
+
+    Produces the same dictionaries as `asDict()` of `TypeDocGrammar` parse results.
+    Raises `TypeDocTokenizerError` on any input that it cannot handle exactly like `TypeDocGrammar`.
+    """
+
+    whitespace = " \t"
+    # `TypeDocGrammar.typed_dict_key_line` tokens
+    RE_TYPED_DICT_KEY_LINE: Pattern[str] = re.compile(
+        r"(-)([ \t]+)(\*\*)[ \t]*([A-Za-z0-9_]+)[ \t]*(\*\*)([ \t]+)"
+        r"(\*\()[ \t]*([A-Za-z0-9_]+)[ \t]*(\))([ \t]+)(--\*)[ \t]*(.*)"
+    )
+    # `TypeDocGrammar.type_line` tokens
+    RE_TYPE_LINE: Pattern[str] = re.compile(
+        r"(-)([ \t]+)(\*\()[ \t]*([A-Za-z0-9_]+)[ \t]*(\))([ \t]+)(--\*)[ \t]*(.*)"
+    )
+
+    @classmethod
+    def _split_definition(cls, text: str, prefix: str) -> Tuple[str, str]:
+        if not text.startswith(prefix) or "\r" in text:
+            raise TypeDocTokenizerError(f"Expected {prefix}")
+
+        name_start = len(prefix)
+        while name_start < len(text) and text[name_start] in cls.whitespace:
+            name_start += 1
+        name_end = text.find(":", name_start)
+        first_line_end = text.find("\n")
+        if first_line_end == -1:
+            first_line_end = len(text)
+        if name_end == -1 or name_end > first_line_end:
+            raise TypeDocTokenizerError("Expected name on the first line")
+
+        name = text[name_start:name_end]
+        description = text[name_end + 1 : first_line_end].lstrip(cls.whitespace)
+        return name, description
+
+    @classmethod
+    def parse_type_definition(cls, text: str) -> Dict[str, str]:
+        """
+        Parse `:type <name>: <type_name>` line.
+
+        Arguments:
+            text -- Type definition line.
+
+        Returns:
+            A dictionary with `name` and `type_name`.
+        """
+        name, type_name = cls._split_definition(text, ":type")
+        return {"name": name, "type_name": type_name}
+
+    @classmethod
+    def parse_param_definition(cls, text: str) -> Dict[str, Any]:
+        """
+        Parse `:param <name>: <description>` line with indented lines.
+
+        Arguments:
+            text -- Param definition with indented lines.
+
+        Returns:
+            A dictionary with `name`, `description` and `indented` lines.
+        """
+        name, description = cls._split_definition(text, ":param")
+        result: Dict[str, Any] = {"name": name, "description": description}
+        lines: List[Tuple[int, str]] = []
+        for line in text.split("\n")[1:]:
+            stripped_line = line.lstrip(cls.whitespace)
+            if not stripped_line:
+                continue
+            if line.endswith("\\"):
+                raise TypeDocTokenizerError("Line continuation is not supported")
+            lines.append((len(line) - len(stripped_line), stripped_line))
+
+        if not lines or not lines[0][0]:
+            return result
+
+        indented, index = cls._parse_indented_block(lines, 0)
+        if index < len(lines):
+            raise TypeDocTokenizerError(f"Invalid unindent: {lines[index][1]}")
+
+        result["indented"] = indented
+        return result
+
+    @classmethod
+    def _parse_indented_block(
+        cls, lines: List[Tuple[int, str]], index: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        indent = lines[index][0]
+        result: List[Dict[str, Any]] = []
+        while index < len(lines) and lines[index][0] == indent:
+            item = cls._parse_line(lines[index][1])
+            index += 1
+            if index < len(lines) and lines[index][0] > indent:
+                item["indented"], index = cls._parse_indented_block(lines, index)
+            result.append(item)
+
+        if index < len(lines) and lines[index][0] > indent:
+            raise TypeDocTokenizerError(f"Invalid indent: {lines[index][1]}")
+        return result, index
+
+    @classmethod
+    def _parse_line(cls, line: str) -> Dict[str, Any]:
+        """
+        Parse indented line the same way as `TypeDocGrammar.any_line`.
+        """
+        match = cls.RE_TYPED_DICT_KEY_LINE.fullmatch(line)
+        if match:
+            return {
+                "name": match.group(4),
+                "type_name": match.group(8),
+                "description": match.group(12),
+                "line": list(match.groups()),
+            }
+
+        match = cls.RE_TYPE_LINE.fullmatch(line)
+        if match:
+            return {
+                "type_name": match.group(4),
+                "description": match.group(8),
+                "line": list(match.groups()),
+            }
+
+        if line.startswith("-") and "--*" in line:
+            raise TypeDocTokenizerError(f"Unsupported type line: {line}")
+
+        return {"line": [line]}
@@ -1,13 +1,14 @@
 """
 Fake parser that produces `structures.ServiceModule` for master module and stubs.
 """
-from typing import List
-
 from boto3.session import Session
 from botocore import xform_name
 
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client, get_boto3_resource
-from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.parsers.boto3_utils import (
+    get_boto3_paginator_names,
+    get_boto3_waiter_names,
+    has_boto3_resource,
+)
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.client import Client
 from mypy_boto3_builder.structures.paginator import Paginator
@@ -21,7 +22,8 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
     """
     Create fake boto3 service module structure.
 
-    Used by stubs and master package.
+    Used by stubs and master package. Reads only waiter, paginator and resource names
+    from botocore data, so no boto3 clients or resources are created.
 
     Arguments:
         session -- boto3 session.
@@ -30,30 +32,20 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
     Returns:
         ServiceModule structure.
     """
-    shape_parser = ShapeParser(session, service_name)
-    boto3_client = get_boto3_client(session, service_name)
-    boto3_resource = get_boto3_resource(session, service_name)
-
     result = ServicePackage(
         name=service_name.module_name,
         pypi_name=service_name.pypi_name,
         service_name=service_name,
-        client=Client(
-            name=f"{service_name.class_name}Client",
-            service_name=service_name,
-            boto3_client=boto3_client,
-        ),
+        client=Client(name=f"{service_name.class_name}Client", service_name=service_name),
     )
 
-    if boto3_resource is not None:
+    if has_boto3_resource(session, service_name):
         result.service_resource = ServiceResource(
             name=f"{service_name.class_name}ServiceResource",
             service_name=service_name,
-            boto3_service_resource=boto3_resource,
         )
 
-    waiter_names: List[str] = boto3_client.waiter_names
-    for waiter_name in waiter_names:
+    for waiter_name in get_boto3_waiter_names(session, service_name):
         real_class_name = get_class_prefix(waiter_name)
         waiter_class_name = f"{real_class_name}Waiter"
         result.waiters.append(
@@ -64,7 +56,7 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
             )
         )
 
-    for paginator_name in shape_parser.get_paginator_names():
+    for paginator_name in get_boto3_paginator_names(session, service_name):
         operation_name = xform_name(paginator_name)
         result.paginators.append(
             Paginator(
@@ -76,3 +68,48 @@ def parse_fake_service_package(session: Session, service_name: ServiceName) -> S
         )
 
     return result
+
+
+def get_fake_service_package(package: ServicePackage) -> ServicePackage:
+    """
+    Create fake boto3 service module structure from already parsed `package`.
+
+    Used by stubs and master package to avoid parsing service again.
+    Keeps only class names, so result does not hold boto3 objects and can be pickled.
+
+    Arguments:
+        package -- Parsed service package.
+
+    Returns:
+        ServiceModule structure.
+    """
+    service_name = package.service_name
+    result = ServicePackage(
+        name=package.name,
+        pypi_name=package.pypi_name,
+        service_name=service_name,
+        client=Client(name=package.client.name, service_name=service_name),
+    )
+
+    if package.service_resource is not None:
+        result.service_resource = ServiceResource(
+            name=package.service_resource.name,
+            service_name=service_name,
+        )
+
+    for waiter in package.waiters:
+        result.waiters.append(
+            Waiter(waiter.name, waiter_name=waiter.waiter_name, service_name=service_name)
+        )
+
+    for paginator in package.paginators:
+        result.paginators.append(
+            Paginator(
+                paginator.name,
+                operation_name=paginator.operation_name,
+                service_name=service_name,
+                paginator_name=paginator.paginator_name,
+            )
+        )
+
+    return result
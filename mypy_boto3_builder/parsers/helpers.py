@@ -4,13 +4,16 @@ Helpers for parsing methods and attributes.
 import inspect
 import textwrap
 from types import MethodType
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from boto3.resources.base import ServiceResource as Boto3ServiceResource
+from boto3.resources.model import ResourceModel
+from botocore.model import ServiceModel
 
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.parsers.docstring_parser.argspec_parser import ArgSpecParser
 from mypy_boto3_builder.parsers.docstring_parser.docstring_parser import DocstringParser
+from mypy_boto3_builder.parsers.docstring_parser.grammar_session import GrammarSession
+from mypy_boto3_builder.parsers.method_memo import MethodMemo
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.attribute import Attribute
@@ -18,6 +21,7 @@ from mypy_boto3_builder.structures.method import Method
 from mypy_boto3_builder.type_maps.docstring_type_map import get_type_from_docstring
 from mypy_boto3_builder.type_maps.method_argument_map import get_method_arguments_stub
 from mypy_boto3_builder.type_maps.method_type_map import get_method_type_stub
+from mypy_boto3_builder.utils.profiler import Profiler
 from mypy_boto3_builder.utils.strings import get_class_prefix
 
 
@@ -46,27 +50,27 @@ def get_public_methods(inspect_class: Any) -> Dict[str, MethodType]:
 
 
 def parse_attributes(
-    service_name: ServiceName, resource_name: str, resource: Boto3ServiceResource
+    service_name: ServiceName,
+    resource_name: str,
+    resource_model: ResourceModel,
+    service_model: ServiceModel,
 ) -> List[Attribute]:
     """
-    Extract attributes from boto3 resource.
+    Extract attributes from boto3 resource model.
 
     Arguments:
-        resource -- boto3 service resource.
+        service_name -- Service name.
+        resource_name -- Resource name.
+        resource_model -- boto3 resource model.
+        service_model -- botocore service model.
 
     Returns:
         A list of Attribute structures.
     """
     result: List[Attribute] = []
-    if not resource.meta.client:
-        return result
-    if not resource.meta.resource_model:
-        return result
-
-    service_model = resource.meta.client.meta.service_model
-    if resource.meta.resource_model.shape:
-        shape = service_model.shape_for(resource.meta.resource_model.shape)
-        attributes = resource.meta.resource_model.get_attributes(shape)
+    if resource_model.shape:
+        shape = service_model.shape_for(resource_model.shape)
+        attributes = resource_model.get_attributes(shape)
         for name, attribute in attributes.items():
             argument_type = get_method_type_stub(service_name, resource_name, "_attributes", name)
             if argument_type is None:
@@ -82,6 +86,8 @@ def parse_method(
     """
     Parse method to a structure.
 
+    Results are memoized by `MethodMemo`, so boilerplate methods are parsed once.
+
     Arguments:
         parent_name -- Parent class name.
         method -- Inspect method.
@@ -91,9 +97,16 @@ def parse_method(
     """
     logger = get_logger()
     docstring = textwrap.dedent(inspect.getdoc(method) or "")
+    memo_key: Optional[bytes] = None
+    if MethodMemo.is_supported(service_name):
+        memo_key = MethodMemo.get_key(parent_name, name, method, docstring)
+        memo_method = MethodMemo.get(memo_key)
+        if memo_method is not None:
+            return memo_method
+
     method_name = f"{parent_name}.{name}"
+    GrammarSession.reset_stats()
 
-    logger.debug(f"Slow parsing of {method_name}: {len(docstring)} chars")
     prefix = f"{get_class_prefix(parent_name)}{get_class_prefix(name)}"
     arg_spec_parser = ArgSpecParser(prefix, service_name)
 
@@ -101,7 +114,8 @@ def parse_method(
     if arguments is None:
         arguments = arg_spec_parser.get_arguments(parent_name, name, method)
         docstring_parser = DocstringParser(service_name, parent_name, name, arguments)
-        arguments = docstring_parser.get_arguments(docstring)
+        with Profiler.phase("docstrings"):
+            arguments = docstring_parser.get_arguments(docstring)
 
     # do not add kwonly flag to resource generators
     if len(arguments) > 1 and not name[0].isupper():
@@ -109,12 +123,20 @@ def parse_method(
 
     return_type = arg_spec_parser.get_return_type(parent_name, name)
     if return_type is None:
-        return_type = DocstringParser(service_name, parent_name, name, []).get_return_type(
-            docstring
-        )
+        with Profiler.phase("docstrings"):
+            return_type = DocstringParser(service_name, parent_name, name, []).get_return_type(
+                docstring
+            )
+
+    logger.debug(
+        f"Slow parsing of {method_name}: {len(docstring)} chars,"
+        f" {GrammarSession.render_stats() or 'no grammars used'}"
+    )
 
     result = Method(name=name, arguments=arguments, return_type=return_type)
     result.request_type_annotation = result.get_request_type_annotation(
         f"{parent_name}{get_class_prefix(name)}RequestTypeDef"
     )
+    if memo_key is not None:
+        MethodMemo.set(memo_key, result)
     return result
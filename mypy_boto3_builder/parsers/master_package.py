@@ -1,28 +1,35 @@
 """
 Parser that produces `structures.MasterPackage`.
 """
-from typing import List
+from typing import List, Optional
 
 from boto3.session import Session
 
-from mypy_boto3_builder.parsers.fake_service_package import parse_fake_service_package
+from mypy_boto3_builder.parsers.service_package_registry import ServicePackageRegistry
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.master_package import MasterPackage
 
 
-def parse_master_package(session: Session, service_names: List[ServiceName]) -> MasterPackage:
+def parse_master_package(
+    session: Session,
+    service_names: List[ServiceName],
+    registry: Optional[ServicePackageRegistry] = None,
+) -> MasterPackage:
     """
     Parse data for master package.
 
     Arguments:
         session -- boto3 session.
         service_names -- All available service names.
+        registry -- Already parsed service packages.
 
     Returns:
         MasterPackage structure.
     """
+    if registry is None:
+        registry = ServicePackageRegistry()
     result = MasterPackage(service_names=service_names)
     for service_name in result.service_names:
-        result.service_packages.append(parse_fake_service_package(session, service_name))
+        result.service_packages.append(registry.get(session, service_name))
 
     return result
@@ -0,0 +1,121 @@
+"""
+Process-wide memo of methods parsed from boto3 docstrings.
+"""
+import copy
+import hashlib
+import inspect
+from types import MethodType
+from typing import Any, Dict, Optional, Set, Tuple
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_maps.docstring_type_map import DOCSTRING_TYPE_MAP
+from mypy_boto3_builder.type_maps.method_argument_map import METHOD_MAP
+from mypy_boto3_builder.type_maps.method_type_map import TYPE_MAP
+from mypy_boto3_builder.type_maps.shape_type_map import SHAPE_TYPE_MAP
+from mypy_boto3_builder.type_maps.syntax_type_map import SYNTAX_TYPE_MAP
+
+__all__ = ("MethodMemo",)
+
+
+class MethodMemo:
+    """
+    Process-wide memo of methods parsed from boto3 docstrings.
+
+    Boilerplate methods like `can_paginate`, `load` or `get_available_subresources`
+    have the same docstrings in every service. Methods are keyed by parent name,
+    method name, argspec and docstring. Services with method or shape type map entries
+    are not memoized. A method is stored when its key is seen for the second time,
+    so unique methods cost only a key digest. Every lookup returns a deep copy
+    that shares predefined type annotations with the original.
+    """
+
+    seen: Set[bytes] = set()
+    methods: Dict[bytes, Method] = {}
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def _get_shared_annotations() -> Dict[int, Any]:
+        annotations = [
+            *(i for i in vars(Type).values() if isinstance(i, FakeAnnotation)),
+            *DOCSTRING_TYPE_MAP.values(),
+            *SYNTAX_TYPE_MAP.values(),
+        ]
+        return {id(i): i for i in annotations}
+
+    @staticmethod
+    def is_supported(service_name: ServiceName) -> bool:
+        """
+        Whether methods of `service_name` do not depend on service type maps.
+        """
+        return not any(service_name in i for i in (TYPE_MAP, METHOD_MAP, SHAPE_TYPE_MAP))
+
+    @staticmethod
+    def get_key(parent_name: str, name: str, method: MethodType, docstring: str) -> bytes:
+        """
+        Get memo key of a method.
+
+        Arguments:
+            parent_name -- Parent class name.
+            name -- Method name.
+            method -- Inspect method.
+            docstring -- Method docstring.
+        """
+        try:
+            argspec = str(inspect.getfullargspec(method))
+        except TypeError:
+            argspec = ""
+        parts = (parent_name, name, argspec, docstring)
+        return hashlib.sha256("\0".join(parts).encode()).digest()
+
+    @classmethod
+    def get(cls, key: bytes) -> Optional[Method]:
+        """
+        Get a copy of memoized method.
+        """
+        method = cls.methods.get(key)
+        if method is None:
+            cls.misses += 1
+            return None
+
+        cls.hits += 1
+        return copy.deepcopy(method, cls._get_shared_annotations())
+
+    @classmethod
+    def set(cls, key: bytes, method: Method) -> None:
+        """
+        Memoize a copy of `method` if `key` has been seen before.
+        """
+        if key not in cls.seen:
+            cls.seen.add(key)
+            return
+
+        cls.methods[key] = copy.deepcopy(method, cls._get_shared_annotations())
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Clear memo and counters.
+        """
+        cls.seen = set()
+        cls.methods = {}
+        cls.hits = 0
+        cls.misses = 0
+
+    @classmethod
+    def get_counters(cls) -> Tuple[int, int]:
+        """
+        Get memo hits and misses.
+        """
+        return cls.hits, cls.misses
+
+    @classmethod
+    def add_counters(cls, hits: int, misses: int) -> None:
+        """
+        Add memo hits and misses from worker processes.
+        """
+        cls.hits += hits
+        cls.misses += misses
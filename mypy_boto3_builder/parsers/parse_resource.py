@@ -22,7 +22,7 @@ from mypy_boto3_builder.utils.strings import get_short_docstring
 
 def parse_resource(
     name: str,
-    resource: Boto3ServiceResource,
+    resource_class: Type[Boto3ServiceResource],
     service_name: ServiceName,
     shape_parser: ShapeParser,
 ) -> Resource:
@@ -30,7 +30,10 @@ def parse_resource(
     Parse boto3 sub Resource data.
 
     Arguments:
-        resource -- Original boto3 resource.
+        name -- Resource name.
+        resource_class -- Generated boto3 resource class.
+        service_name -- Service name.
+        shape_parser -- Service ShapeParser.
 
     Returns:
         Resource structure.
@@ -40,7 +43,7 @@ def parse_resource(
         service_name=service_name,
     )
     shape_method_map = shape_parser.get_resource_method_map(name)
-    public_methods = get_resource_public_methods(resource.__class__)
+    public_methods = get_resource_public_methods(resource_class)
     for method_name, public_method in public_methods.items():
         if method_name in shape_method_map:
             method = shape_method_map[method_name]
@@ -59,11 +62,14 @@ def parse_resource(
         )
         result.methods.append(method)
 
-    result.attributes.extend(parse_attributes(service_name, name, resource))
-    result.attributes.extend(parse_identifiers(resource))
-    result.attributes.extend(parse_references(resource))
+    resource_model = resource_class.meta.resource_model
+    result.attributes.extend(
+        parse_attributes(service_name, name, resource_model, shape_parser.service_model)
+    )
+    result.attributes.extend(parse_identifiers(resource_model))
+    result.attributes.extend(parse_references(resource_model))
 
-    collections = parse_collections(name, resource, service_name, shape_parser)
+    collections = parse_collections(name, resource_model, service_name, shape_parser)
     for collection in collections:
         result.collections.append(collection)
         result.attributes.append(
@@ -2,12 +2,13 @@
 Parser that produces `structures.ServiceModule`.
 """
 
-from typing import List
+from typing import Iterable, Optional
 
 from boto3.session import Session
 from botocore import xform_name
 
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.boto3_context import Boto3Context
 from mypy_boto3_builder.parsers.client import parse_client
 from mypy_boto3_builder.parsers.service_resource import parse_service_resource
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
@@ -15,25 +16,42 @@ from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.structures.waiter import Waiter
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.utils.profiler import Profiler
 
 
-def parse_service_package(session: Session, service_name: ServiceName) -> ServicePackage:
+def parse_service_package(
+    session: Session,
+    service_name: ServiceName,
+    operation_names: Optional[Iterable[str]] = None,
+) -> ServicePackage:
     """
     Extract all data from boto3 service package.
 
     Arguments:
         session -- boto3 session.
         service_name -- Target service name.
+        operation_names -- Operations to include for a subset build, all if not set.
+            Subset build has no ServiceResource.
 
     Returns:
         ServiceModule structure.
     """
     logger = get_logger()
+    with Profiler.phase("load_models"):
+        context = Boto3Context(session, service_name)
     logger.debug("Parsing Shapes")
-    shape_parser = ShapeParser(session, service_name)
+    with Profiler.phase("shape_parser"):
+        shape_parser = ShapeParser(
+            session, service_name, context.service_model, operation_names=operation_names
+        )
     logger.debug("Parsing Client")
-    client = parse_client(session, service_name, shape_parser)
-    service_resource = parse_service_resource(session, service_name, shape_parser)
+    with Profiler.phase("client"):
+        client = parse_client(context, shape_parser)
+    service_resource = None
+    if operation_names is None:
+        with Profiler.phase("resource"):
+            service_resource = parse_service_resource(context, shape_parser)
 
     result = ServicePackage(
         name=service_name.module_name,
@@ -43,20 +61,19 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
         service_resource=service_resource,
     )
 
-    waiter_names: List[str] = client.boto3_client.waiter_names
-    for waiter_name in waiter_names:
+    for waiter_class_name in shape_parser.get_waiter_names():
+        waiter_name = xform_name(waiter_class_name)
         logger.debug(f"Parsing Waiter {waiter_name}")
-        waiter = client.boto3_client.get_waiter(waiter_name)
         waiter_record = Waiter(
-            name=f"{waiter.name}Waiter",
+            name=f"{waiter_class_name}Waiter",
             waiter_name=waiter_name,
             service_name=service_name,
         )
 
-        wait_method = shape_parser.get_wait_method(waiter.name)
+        wait_method = shape_parser.get_wait_method(waiter_class_name)
         wait_method.docstring = (
             "[Show boto3 documentation]"
-            f"({service_name.get_boto3_doc_link('Waiter', waiter.name, 'wait')})\n"
+            f"({service_name.get_boto3_doc_link('Waiter', waiter_class_name, 'wait')})\n"
             "[Show boto3-stubs documentation]"
             f"({service_name.get_doc_link('waiters', waiter_record.name)})"
         )
@@ -104,8 +121,12 @@ def parse_service_package(session: Session, service_name: ServiceName) -> Servic
                 method = package_waiter.get_client_method()
                 result.client.methods.append(method)
 
-    result.typed_dicts = result.extract_typed_dicts()
-    result.literals = result.extract_literals()
-    result.validate()
+    with FakeAnnotation.frozen(), Profiler.phase("typed_dicts"):
+        result.build_index()
+        result.typed_dicts = result.extract_typed_dicts()
+        result.literals = result.extract_literals()
+        result.validate()
+
+    result.recursive_typed_dict_names = shape_parser.get_recursive_typed_dict_names()
 
     return result
@@ -0,0 +1,52 @@
+"""
+Registry of parsed service packages shared by master and boto3-stubs parsers.
+"""
+from typing import Dict
+
+from boto3.session import Session
+
+from mypy_boto3_builder.parsers.fake_service_package import (
+    get_fake_service_package,
+    parse_fake_service_package,
+)
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_package import ServicePackage
+
+
+class ServicePackageRegistry:
+    """
+    Registry of parsed service packages shared by master and boto3-stubs parsers.
+
+    Stores fake copies of service packages, so every service is parsed at most once per run.
+    """
+
+    def __init__(self) -> None:
+        self._packages: Dict[str, ServicePackage] = {}
+
+    def __contains__(self, service_name: ServiceName) -> bool:
+        return service_name.name in self._packages
+
+    def add(self, package: ServicePackage) -> None:
+        """
+        Register fake copy of parsed `package`.
+
+        Arguments:
+            package -- Parsed or fake service package.
+        """
+        self._packages[package.service_name.name] = get_fake_service_package(package)
+
+    def get(self, session: Session, service_name: ServiceName) -> ServicePackage:
+        """
+        Get registered service package or parse a fake one.
+
+        Arguments:
+            session -- boto3 session.
+            service_name -- Target service name.
+
+        Returns:
+            Fake ServicePackage.
+        """
+        if service_name.name not in self._packages:
+            self._packages[service_name.name] = parse_fake_service_package(session, service_name)
+
+        return self._packages[service_name.name]
@@ -2,23 +2,18 @@
 Parser for Boto3 ServiceResource, produces `structires.ServiceResource`.
 """
 import inspect
-from typing import List, Optional
+from typing import List, Optional, Type
 
 from boto3.resources.base import ServiceResource as Boto3ServiceResource
-from boto3.session import Session
-from boto3.utils import ServiceContext
-from botocore.exceptions import UnknownServiceError
-from botocore.waiter import WaiterModel
 
 from mypy_boto3_builder.logger import get_logger
-from mypy_boto3_builder.parsers.boto3_utils import get_boto3_client, get_boto3_resource
+from mypy_boto3_builder.parsers.boto3_context import Boto3Context
 from mypy_boto3_builder.parsers.helpers import get_public_methods, parse_attributes, parse_method
 from mypy_boto3_builder.parsers.parse_collections import parse_collections
 from mypy_boto3_builder.parsers.parse_identifiers import parse_identifiers
 from mypy_boto3_builder.parsers.parse_references import parse_references
 from mypy_boto3_builder.parsers.parse_resource import parse_resource
 from mypy_boto3_builder.parsers.shape_parser import ShapeParser
-from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.attribute import Attribute
 from mypy_boto3_builder.structures.service_resource import ServiceResource
 from mypy_boto3_builder.type_annotations.internal_import import InternalImport
@@ -26,19 +21,20 @@ from mypy_boto3_builder.utils.strings import get_short_docstring
 
 
 def parse_service_resource(
-    session: Session, service_name: ServiceName, shape_parser: ShapeParser
+    context: Boto3Context, shape_parser: ShapeParser
 ) -> Optional[ServiceResource]:
     """
     Parse boto3 ServiceResource data.
 
     Arguments:
-        session -- boto3 session.
-        service_name -- Target service name.
+        context -- Service boto3 context.
+        shape_parser -- Service shape parser.
 
     Returns:
         ServiceResource structure or None if service does not have a resource.
     """
-    service_resource = get_boto3_resource(session, service_name)
+    service_name = context.service_name
+    service_resource = context.resource
     if service_resource is None:
         return None
 
@@ -70,12 +66,17 @@ def parse_service_resource(
         result.methods.append(method)
 
     logger.debug("Parsing ServiceResource attributes")
-    result.attributes.extend(parse_attributes(service_name, "ServiceResource", service_resource))
-    result.attributes.extend(parse_identifiers(service_resource))
-    result.attributes.extend(parse_references(service_resource))
+    resource_model = service_resource.meta.resource_model
+    result.attributes.extend(
+        parse_attributes(
+            service_name, "ServiceResource", resource_model, shape_parser.service_model
+        )
+    )
+    result.attributes.extend(parse_identifiers(resource_model))
+    result.attributes.extend(parse_references(resource_model))
 
     logger.debug("Parsing ServiceResource collections")
-    collections = parse_collections("ServiceResource", service_resource, service_name, shape_parser)
+    collections = parse_collections("ServiceResource", resource_model, service_name, shape_parser)
     for collection in collections:
         result.collections.append(collection)
         result.attributes.append(
@@ -89,56 +90,41 @@ def parse_service_resource(
             )
         )
 
-    for sub_resource in get_sub_resources(session, service_name, service_resource):
-        sub_resource_name = sub_resource.__class__.__name__.split(".", 1)[-1]
+    for sub_resource_class in get_sub_resources(context):
+        sub_resource_name = sub_resource_class.__name__.split(".", 1)[-1]
         logger.debug(f"Parsing {sub_resource_name} sub resource")
         result.sub_resources.append(
-            parse_resource(sub_resource_name, sub_resource, service_name, shape_parser)
+            parse_resource(sub_resource_name, sub_resource_class, service_name, shape_parser)
         )
 
     return result
 
 
-def get_sub_resources(
-    session: Session, service_name: ServiceName, resource: Boto3ServiceResource
-) -> List[Boto3ServiceResource]:
+def get_sub_resources(context: Boto3Context) -> List[Type[Boto3ServiceResource]]:
     """
-    Initialize ServiceResource sub-resources with fake data.
+    Generate ServiceResource sub-resource classes.
+
+    Sub-resources are parsed from class-level resource models,
+    so no instances or clients are created.
 
     Arguments:
-        session -- boto3 session.
-        service_name -- Target service name.
-        resource -- Parent ServiceResource.
+        context -- Service boto3 context.
 
     Returns:
-        A list of initialized `Boto3ServiceResource`.
+        A list of generated `Boto3ServiceResource` subclasses.
     """
-    result: List[Boto3ServiceResource] = []
-    session_session = session._session
-    loader = session_session.get_component("data_loader")
-    assert resource.meta.service_name == service_name.boto3_name
-    json_resource_model = loader.load_service_model(service_name.boto3_name, "resources-1")
-    service_model = resource.meta.client.meta.service_model
-    assert service_model.service_name == service_name.boto3_name
-    service_waiter_model: Optional[WaiterModel]
-    try:
-        service_waiter_model = session_session.get_waiter_model(service_name.boto3_name)
-    except UnknownServiceError:
-        service_waiter_model = None
-    for name in json_resource_model["resources"]:
-        resource_model = json_resource_model["resources"][name]
-        resource_class = session.resource_factory.load_from_definition(
+    result: List[Type[Boto3ServiceResource]] = []
+    json_resource_model = context.resource_model
+    if json_resource_model is None:
+        return result
+
+    service_context = context.get_service_context()
+    for name, resource_model in json_resource_model["resources"].items():
+        resource_class = context.session.resource_factory.load_from_definition(
             resource_name=name,
             single_resource_json_definition=resource_model,
-            service_context=ServiceContext(
-                service_name=service_name.boto3_name,
-                resource_json_definitions=json_resource_model["resources"],
-                service_model=service_model,
-                service_waiter_model=service_waiter_model,
-            ),
+            service_context=service_context,
         )
-        identifiers = resource_class.meta.resource_model.identifiers  # type: ignore
-        args = ["foo"] * len(identifiers)
-        result.append(resource_class(*args, client=get_boto3_client(session, service_name)))
+        result.append(resource_class)
 
     return result
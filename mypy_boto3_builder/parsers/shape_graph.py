@@ -0,0 +1,149 @@
+"""
+Dependency graph of botocore shapes.
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+from botocore.model import ServiceModel
+
+__all__ = ("ShapeGraph",)
+
+
+class ShapeGraph:
+    """
+    Dependency graph of botocore shapes.
+
+    Built once from raw shape definitions of `ServiceModel`, so no `Shape` objects
+    are created. Used to find shapes reachable from requested operations
+    and shapes that are part of a reference cycle.
+
+    Arguments:
+        service_model -- Service model.
+    """
+
+    def __init__(self, service_model: ServiceModel) -> None:
+        service_description: Mapping[str, Any] = service_model._service_description
+        self._operations: Mapping[str, Mapping[str, Any]] = service_description.get(
+            "operations", {}
+        )
+        self._edges: Dict[str, Tuple[str, ...]] = {}
+        self._recursive_shape_names: Optional[Set[str]] = None
+        for shape_name, shape_data in service_description.get("shapes", {}).items():
+            self._edges[shape_name] = tuple(self._iterate_member_shape_names(shape_data))
+
+    def __len__(self) -> int:
+        return len(self._edges)
+
+    def __contains__(self, shape_name: str) -> bool:
+        return shape_name in self._edges
+
+    @staticmethod
+    def _iterate_member_shape_names(shape_data: Mapping[str, Any]) -> Iterator[str]:
+        for member_data in shape_data.get("members", {}).values():
+            yield member_data["shape"]
+        for key in ("member", "key", "value"):
+            if key in shape_data:
+                yield shape_data[key]["shape"]
+
+    def get_children(self, shape_name: str) -> Tuple[str, ...]:
+        """
+        Get names of shapes used by `shape_name` members.
+        """
+        return self._edges.get(shape_name, tuple())
+
+    def get_operation_shape_names(self, operation_name: str) -> List[str]:
+        """
+        Get input and output shape names of operation.
+        """
+        operation_data = self._operations.get(operation_name, {})
+        result: List[str] = []
+        for key in ("input", "output"):
+            if key in operation_data:
+                result.append(operation_data[key]["shape"])
+        return result
+
+    def get_reachable(self, shape_names: Iterable[str]) -> Set[str]:
+        """
+        Get `shape_names` and names of all shapes reachable from them.
+        """
+        result: Set[str] = set()
+        stack = list(shape_names)
+        while stack:
+            shape_name = stack.pop()
+            if shape_name in result:
+                continue
+            result.add(shape_name)
+            stack.extend(self.get_children(shape_name))
+        return result
+
+    def get_operations_reachable(self, operation_names: Iterable[str]) -> Set[str]:
+        """
+        Get names of all shapes reachable from input and output shapes of operations.
+        """
+        shape_names: List[str] = []
+        for operation_name in operation_names:
+            shape_names.extend(self.get_operation_shape_names(operation_name))
+        return self.get_reachable(shape_names)
+
+    def get_recursive_shape_names(self) -> Set[str]:
+        """
+        Get names of shapes that are part of a reference cycle.
+
+        Strongly connected components are found once with iterative Tarjan algorithm,
+        a shape is recursive if its component has more than one shape or a self reference.
+        """
+        if self._recursive_shape_names is None:
+            self._recursive_shape_names = self._find_recursive_shape_names()
+        return self._recursive_shape_names
+
+    def is_recursive(self, shape_name: str) -> bool:
+        """
+        Whether shape is a part of a reference cycle.
+        """
+        return shape_name in self.get_recursive_shape_names()
+
+    def _find_recursive_shape_names(self) -> Set[str]:
+        result: Set[str] = set()
+        indexes: Dict[str, int] = {}
+        low_links: Dict[str, int] = {}
+        component_stack: List[str] = []
+        on_stack: Set[str] = set()
+        for root in self._edges:
+            if root in indexes:
+                continue
+
+            indexes[root] = low_links[root] = len(indexes)
+            component_stack.append(root)
+            on_stack.add(root)
+            work_stack: List[Tuple[str, Iterator[str]]] = [(root, iter(self.get_children(root)))]
+            while work_stack:
+                node, children = work_stack[-1]
+                child = next(children, None)
+                if child is not None:
+                    if child not in self._edges:
+                        continue
+                    if child not in indexes:
+                        indexes[child] = low_links[child] = len(indexes)
+                        component_stack.append(child)
+                        on_stack.add(child)
+                        work_stack.append((child, iter(self.get_children(child))))
+                    elif child in on_stack:
+                        low_links[node] = min(low_links[node], indexes[child])
+                    continue
+
+                work_stack.pop()
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    low_links[parent] = min(low_links[parent], low_links[node])
+                if low_links[node] != indexes[node]:
+                    continue
+
+                component: List[str] = []
+                while True:
+                    member = component_stack.pop()
+                    on_stack.remove(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                if len(component) > 1 or node in self.get_children(node):
+                    result.update(component)
+        return result
@@ -1,7 +1,7 @@
 """
 Parser for botocore shape files.
 """
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 from boto3.resources.model import Collection
 from boto3.session import Session
@@ -20,6 +20,7 @@ from botocore.response import StreamingBody
 from botocore.session import Session as BotocoreSession
 
 from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.parsers.shape_graph import ShapeGraph
 from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
 from mypy_boto3_builder.structures.argument import Argument
 from mypy_boto3_builder.structures.method import Method
@@ -35,6 +36,7 @@ from mypy_boto3_builder.type_maps.literal_type_map import get_literal_type_stub
 from mypy_boto3_builder.type_maps.method_type_map import get_method_type_stub
 from mypy_boto3_builder.type_maps.shape_type_map import get_shape_type_stub
 from mypy_boto3_builder.type_maps.typed_dicts import paginator_config_type, waiter_config_type
+from mypy_boto3_builder.utils.profiler import Profiler
 
 
 class ShapeParserError(Exception):
@@ -50,6 +52,9 @@ class ShapeParser:
     Arguments:
         session -- Boto3 session.
         service_name -- ServiceName.
+        service_model -- Service model to reuse, loaded from session if not set.
+        operation_names -- Operations to parse for a subset build, all if not set.
+            Only shapes reachable from these operations can be parsed.
     """
 
     # Type map for shape types.
@@ -72,6 +77,9 @@ class ShapeParser:
         "blob_streaming": TypeClass(StreamingBody),
     }
 
+    # Shape classes with annotations shared between all occurrences of a shape.
+    CACHED_SHAPE_CLASSES = (StringShape, ListShape, MapShape, StructureShape)
+
     # Alias map fixes added by botocore for documentation build.
     # https://github.com/boto/botocore/blob/develop/botocore/handlers.py#L773
     # https://github.com/boto/botocore/blob/develop/botocore/handlers.py#L1055
@@ -95,32 +103,48 @@ class ShapeParser:
         },
     }
 
-    def __init__(self, session: Session, service_name: ServiceName):
+    def __init__(
+        self,
+        session: Session,
+        service_name: ServiceName,
+        service_model: Optional[ServiceModel] = None,
+        operation_names: Optional[Iterable[str]] = None,
+    ):
         loader = session._loader
         botocore_session: BotocoreSession = session._session
-        service_data = botocore_session.get_service_data(service_name.boto3_name)
         self.service_name = service_name
-        self.service_model = ServiceModel(service_data, service_name.boto3_name)
         self._typed_dict_map: Dict[str, TypeTypedDict] = {}
+        self._shape_annotation_map: Dict[Tuple[str, bool], FakeAnnotation] = {}
         self._waiters_shape: Optional[Mapping[str, Any]] = None
-        try:
-            self._waiters_shape = loader.load_service_model(service_name.boto3_name, "waiters-2")
-        except UnknownServiceError:
-            pass
         self._paginators_shape: Optional[Mapping[str, Any]] = None
-        try:
-            self._paginators_shape = loader.load_service_model(
-                service_name.boto3_name, "paginators-1"
-            )
-        except UnknownServiceError:
-            pass
         self._resources_shape: Optional[Mapping[str, Any]] = None
-        try:
-            self._resources_shape = loader.load_service_model(
-                service_name.boto3_name, "resources-1"
-            )
-        except UnknownServiceError:
-            pass
+        self._operation_names = set(operation_names) if operation_names is not None else None
+        self._shape_graph: Optional[ShapeGraph] = None
+        self._reachable_shape_names: Optional[Set[str]] = None
+        self._recursive_typed_dicts: List[TypeTypedDict] = []
+        with Profiler.phase("load_models"):
+            if service_model is None:
+                service_data = botocore_session.get_service_data(service_name.boto3_name)
+                service_model = ServiceModel(service_data, service_name.boto3_name)
+            self.service_model = service_model
+            try:
+                self._waiters_shape = loader.load_service_model(
+                    service_name.boto3_name, "waiters-2"
+                )
+            except UnknownServiceError:
+                pass
+            try:
+                self._paginators_shape = loader.load_service_model(
+                    service_name.boto3_name, "paginators-1"
+                )
+            except UnknownServiceError:
+                pass
+            try:
+                self._resources_shape = loader.load_service_model(
+                    service_name.boto3_name, "resources-1"
+                )
+            except UnknownServiceError:
+                pass
 
         self.logger = get_logger()
         self.response_metadata_typed_dict = TypeTypedDict(
@@ -137,8 +161,47 @@ class ShapeParser:
     def _get_operation(self, name: str) -> OperationModel:
         return self.service_model.operation_model(name)
 
+    @property
+    def shape_graph(self) -> ShapeGraph:
+        """
+        Dependency graph of service shapes, built on first use.
+        """
+        if self._shape_graph is None:
+            with Profiler.phase("shape_graph"):
+                self._shape_graph = ShapeGraph(self.service_model)
+        return self._shape_graph
+
     def _get_operation_names(self) -> List[str]:
-        return list(self.service_model.operation_names)
+        operation_names = list(self.service_model.operation_names)
+        if self._operation_names is None:
+            return operation_names
+
+        unknown_names = self._operation_names.difference(operation_names)
+        if unknown_names:
+            raise ShapeParserError(f"Unknown operations: {', '.join(sorted(unknown_names))}")
+        return [i for i in operation_names if i in self._operation_names]
+
+    def _is_reachable(self, shape: Shape) -> bool:
+        if self._operation_names is None:
+            return True
+
+        if self._reachable_shape_names is None:
+            self._reachable_shape_names = self.shape_graph.get_operations_reachable(
+                self._get_operation_names()
+            )
+        return shape.name in self._reachable_shape_names
+
+    def get_recursive_typed_dict_names(self) -> Set[str]:
+        """
+        Get names of parsed typed dicts with shapes that are part of a reference cycle.
+
+        Only these typed dicts can have self references, see
+        `ServicePackage.replace_self_references`.
+
+        Returns:
+            A set of typed dict names.
+        """
+        return {i.name for i in self._recursive_typed_dicts}
 
     def _get_paginator(self, name: str) -> Dict[str, Any]:
         if not self._paginators_shape:
@@ -171,6 +234,27 @@ class ShapeParser:
         result: List[str] = []
         if self._paginators_shape:
             for name in self._paginators_shape.get("pagination", []):
+                if self._operation_names is not None and name not in self._operation_names:
+                    continue
+                result.append(name)
+        result.sort()
+        return result
+
+    def get_waiter_names(self) -> List[str]:
+        """
+        Get available waiter names.
+
+        Returns:
+            A list of waiter names.
+        """
+        result: List[str] = []
+        if self._waiters_shape:
+            for name, waiter_shape in self._waiters_shape.get("waiters", {}).items():
+                if (
+                    self._operation_names is not None
+                    and waiter_shape["operation"] not in self._operation_names
+                ):
+                    continue
                 result.append(name)
         result.sort()
         return result
@@ -344,6 +428,10 @@ class ShapeParser:
         typed_dict_name = self._get_typed_dict_name(shape)
         shape_type_stub = get_shape_type_stub(self.service_name, typed_dict_name)
         if shape_type_stub:
+            if isinstance(shape_type_stub, TypeTypedDict) and self.shape_graph.is_recursive(
+                shape.name
+            ):
+                self._recursive_typed_dicts.append(shape_type_stub)
             return shape_type_stub
         typed_dict = TypeTypedDict(typed_dict_name)
 
@@ -364,6 +452,8 @@ class ShapeParser:
                 self.logger.debug(f"Marking {old_typed_dict.name} as ResponseMetadataTypeDef")
 
         self._typed_dict_map[typed_dict.name] = typed_dict
+        if self.shape_graph.is_recursive(shape.name):
+            self._recursive_typed_dicts.append(typed_dict)
         for attr_name, attr_shape in shape.members.items():
             typed_dict.add_attribute(
                 attr_name,
@@ -399,6 +489,9 @@ class ShapeParser:
         output: bool = False,
         output_child: bool = False,
     ) -> FakeAnnotation:
+        if not self._is_reachable(shape):
+            raise ShapeParserError(f"Shape {shape.name} is not reachable from parsed operations")
+
         is_streaming = "streaming" in shape.serialization and shape.serialization["streaming"]
 
         type_name = shape.type_name + ("_streaming" if is_streaming else "")
@@ -409,6 +502,23 @@ class ShapeParser:
         if type_name in self.SHAPE_TYPE_MAP:
             return self.SHAPE_TYPE_MAP[type_name]
 
+        # output structures are not cached, they can be renamed to ResponseMetadata TypedDicts
+        if output or not isinstance(shape, self.CACHED_SHAPE_CLASSES):
+            return self._parse_shape_by_type(shape, output=output, output_child=output_child)
+
+        key = (shape.name, output_child)
+        if key not in self._shape_annotation_map:
+            self._shape_annotation_map[key] = self._parse_shape_by_type(
+                shape, output=output, output_child=output_child
+            )
+        return self._shape_annotation_map[key]
+
+    def _parse_shape_by_type(
+        self,
+        shape: Shape,
+        output: bool = False,
+        output_child: bool = False,
+    ) -> FakeAnnotation:
         if isinstance(shape, StringShape):
             return self._parse_shape_string(shape)
 
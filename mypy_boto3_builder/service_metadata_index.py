@@ -0,0 +1,114 @@
+"""
+On-disk index of botocore service metadata.
+"""
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from boto3.session import Session
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.disk_cache import write_atomic
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.strings import get_botocore_class_name
+
+__all__ = ("ServiceMetadataRecord", "ServiceMetadataIndex")
+
+
+@dataclass
+class ServiceMetadataRecord:
+    """
+    Index record of a botocore service.
+    """
+
+    class_name: str
+    api_version: str
+    fingerprint: str
+
+
+class ServiceMetadataIndex:
+    """
+    Index of botocore service metadata built lazily and saved to `path`.
+
+    Records are reused while `service-2` data files keep the same path, size and
+    modification time, so only new and updated services are loaded.
+
+    Arguments:
+        session -- boto3 session.
+        path -- Index file path, keep index in memory if not set.
+    """
+
+    type_name = "service-2"
+
+    def __init__(self, session: Session, path: Optional[Path] = None) -> None:
+        self.session = session
+        self.path = path
+        self.records: Dict[str, ServiceMetadataRecord] = self._load()
+        self.changed = False
+
+    def _load(self) -> Dict[str, ServiceMetadataRecord]:
+        if self.path is None or not self.path.exists():
+            return {}
+
+        try:
+            data = json.loads(self.path.read_text())
+            return {key: ServiceMetadataRecord(**value) for key, value in data["services"].items()}
+        except (ValueError, KeyError, TypeError):
+            get_logger().warning(f"Invalid service metadata index {NicePath(self.path)}, ignoring")
+            return {}
+
+    def get_fingerprint(self, name: str, api_version: str) -> str:
+        """
+        Get fingerprint of `service-2` data files of a service from file stats.
+
+        Arguments:
+            name -- boto3 service name.
+            api_version -- Service API version.
+        """
+        loader = self.session._loader  # type: ignore
+        hasher = hashlib.sha256()
+        for search_path in loader.search_paths:
+            model_path = Path(search_path) / name / api_version
+            if not model_path.is_dir():
+                continue
+            for path in sorted(model_path.glob(f"{self.type_name}.*")):
+                stat = path.stat()
+                hasher.update(f"{path}\0{stat.st_size}\0{stat.st_mtime_ns}\0".encode())
+        return hasher.hexdigest()
+
+    def get_record(self, name: str) -> ServiceMetadataRecord:
+        """
+        Get index record of a service, load service data only if it has changed.
+
+        Arguments:
+            name -- boto3 service name.
+        """
+        loader = self.session._loader  # type: ignore
+        api_version = loader.determine_latest_version(name, self.type_name)
+        fingerprint = self.get_fingerprint(name, api_version)
+        record = self.records.get(name)
+        if record and record.api_version == api_version and record.fingerprint == fingerprint:
+            return record
+
+        service_data = self.session._session.get_service_data(name)  # type: ignore
+        record = ServiceMetadataRecord(
+            class_name=get_botocore_class_name(service_data["metadata"]),
+            api_version=api_version,
+            fingerprint=fingerprint,
+        )
+        self.records[name] = record
+        self.changed = True
+        return record
+
+    def save(self) -> None:
+        """
+        Save index to `path` if it has changed.
+        """
+        if self.path is None or not self.changed:
+            return
+
+        data = {"services": {key: asdict(self.records[key]) for key in sorted(self.records)}}
+        write_atomic(self.path, json.dumps(data, indent=4).encode())
+        self.changed = False
@@ -1,7 +1,7 @@
 """
 Description for boto3 service.
 """
-from typing import Dict, Literal
+from typing import Any, Dict, Literal, Tuple
 
 from mypy_boto3_builder.constants import MODULE_NAME, PYPI_NAME
 from mypy_boto3_builder.utils.strings import get_anchor_link, is_reserved
@@ -39,6 +39,12 @@ class ServiceName:
     def __str__(self) -> str:
         return f"<ServiceName {self.name} {self.class_name}>"
 
+    def __reduce__(self) -> Tuple[Any, Tuple[str, str]]:
+        """
+        Unpickle as `ServiceNameCatalog` item, type maps rely on `ServiceName` identity.
+        """
+        return (ServiceNameCatalog.add, (self.name, self.class_name))
+
     @property
     def underscore_name(self) -> str:
         """
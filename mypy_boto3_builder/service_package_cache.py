@@ -0,0 +1,101 @@
+"""
+On-disk cache of parsed service packages.
+"""
+import hashlib
+import pickle
+from pathlib import Path
+from typing import Optional
+
+from boto3.session import Session
+
+from mypy_boto3_builder.constants import SERVICE_PACKAGE_CACHE_VERSION
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.utils.botocore_models import get_service_model_hash
+from mypy_boto3_builder.utils.disk_cache import evict_least_recently_used, write_atomic
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+__all__ = ("ServicePackageCache",)
+
+
+class ServicePackageCache:
+    """
+    Content-addressed on-disk cache of parsed service packages.
+
+    Entries are keyed by builder sources hash and botocore model hash,
+    so template changes do not invalidate parsed packages.
+    Least recently used entries are evicted when cache exceeds `max_size`.
+
+    Arguments:
+        path -- Cache directory.
+        builder_hash -- Hash of builder parser sources and build settings.
+        max_size -- Cache size limit in bytes.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, path: Path, builder_hash: str, max_size: int) -> None:
+        self.path = path / f"v{SERVICE_PACKAGE_CACHE_VERSION}"
+        self.builder_hash = builder_hash
+        self.max_size = max_size
+
+    def get_entry_path(self, session: Session, service_name: ServiceName) -> Path:
+        """
+        Get cache entry path for current botocore model of a service.
+
+        Arguments:
+            session -- boto3 session.
+            service_name -- Target service name.
+        """
+        hasher = hashlib.sha256()
+        hasher.update(self.builder_hash.encode())
+        hasher.update(get_service_model_hash(session, service_name).encode())
+        return self.path / f"{service_name.name}-{hasher.hexdigest()[:32]}{self.suffix}"
+
+    def get(self, session: Session, service_name: ServiceName) -> Optional[ServicePackage]:
+        """
+        Load cached service package.
+
+        Arguments:
+            session -- boto3 session.
+            service_name -- Target service name.
+
+        Returns:
+            ServicePackage or None if there is no valid entry.
+        """
+        logger = get_logger()
+        entry_path = self.get_entry_path(session, service_name)
+        try:
+            data = entry_path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            result = pickle.loads(data)
+        except Exception as e:
+            logger.warning(f"Invalid cache entry {NicePath(entry_path)}, ignoring: {e}")
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        entry_path.touch()
+        logger.debug(f"Loaded {service_name.boto3_name} from {NicePath(entry_path)}")
+        return result
+
+    def set(self, session: Session, service_package: ServicePackage) -> None:
+        """
+        Store parsed service package and evict least recently used entries.
+
+        Arguments:
+            session -- boto3 session.
+            service_package -- Parsed service package.
+        """
+        entry_path = self.get_entry_path(session, service_package.service_name)
+        write_atomic(entry_path, pickle.dumps(service_package, protocol=pickle.HIGHEST_PROTOCOL))
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until cache fits `max_size`.
+        """
+        evict_least_recently_used(self.path, f"*{self.suffix}", self.max_size)
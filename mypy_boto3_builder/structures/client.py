@@ -1,7 +1,7 @@
 """
 Boto3 Client.
 """
-from typing import Iterator, List
+from typing import Any, Dict, Iterator, List, Optional
 
 from botocore.client import BaseClient
 
@@ -24,10 +24,12 @@ class Client(ClassRecord):
 
     _alias_name: str = "Client"
 
-    def __init__(self, name: str, service_name: ServiceName, boto3_client: BaseClient) -> None:
+    def __init__(
+        self, name: str, service_name: ServiceName, boto3_client: Optional[BaseClient] = None
+    ) -> None:
         super().__init__(name=name)
         self.service_name = service_name
-        self.boto3_client = boto3_client
+        self._boto3_client = boto3_client
         self.exceptions_class = ClassRecord(name="Exceptions")
         self.bases = [TypeClass(BaseClient)]
         self.client_error_class = ClassRecord(
@@ -53,6 +55,26 @@ class Client(ClassRecord):
             ],
         )
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop boto3 object on pickling, it is used only during parsing.
+        """
+        state = self.__dict__.copy()
+        state["_boto3_client"] = None
+        return state
+
+    @property
+    def boto3_client(self) -> BaseClient:
+        """
+        Boto3 client used for parsing.
+
+        Raises:
+            ValueError -- If client is not set or was dropped on pickling.
+        """
+        if self._boto3_client is None:
+            raise ValueError(f"{self.name} has no boto3 client")
+        return self._boto3_client
+
     def __hash__(self) -> int:
         """
         Calculate hash from client service name.
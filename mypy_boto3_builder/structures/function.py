@@ -15,6 +15,17 @@ class Function:
     Module-level function.
     """
 
+    __slots__ = (
+        "name",
+        "arguments",
+        "return_type",
+        "docstring",
+        "decorators",
+        "body_lines",
+        "type_ignore",
+        "request_type_annotation",
+    )
+
     def __init__(
         self,
         name: str,
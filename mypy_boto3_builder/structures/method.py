@@ -12,6 +12,8 @@ class Method(Function):
     Class method.
     """
 
+    __slots__ = ()
+
     @property
     def call_arguments(self) -> List[Argument]:
         """
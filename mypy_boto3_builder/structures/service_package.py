@@ -1,10 +1,11 @@
 """
 Parsed Service package.
 """
-from typing import Dict, Iterable, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set
 
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_record_group import ImportRecordGroup
 from mypy_boto3_builder.import_helpers.import_string import ImportString
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.client import Client
@@ -12,6 +13,7 @@ from mypy_boto3_builder.structures.function import Function
 from mypy_boto3_builder.structures.package import Package
 from mypy_boto3_builder.structures.paginator import Paginator
 from mypy_boto3_builder.structures.service_resource import ServiceResource
+from mypy_boto3_builder.structures.typed_dict_graph import TypedDictGraph
 from mypy_boto3_builder.structures.waiter import Waiter
 from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
@@ -24,6 +26,20 @@ class ServicePackage(Package):
     Parsed Service package.
     """
 
+    # modules rendered from Client, ServiceResource, waiters and paginators
+    INDEXED_MODULE_NAMES = (
+        ServiceModuleName.client,
+        ServiceModuleName.service_resource,
+        ServiceModuleName.waiter,
+        ServiceModuleName.paginator,
+    )
+
+    # modules rendered from `typed_dicts` and `literals`, indexed on first access
+    LAZY_INDEXED_MODULE_NAMES = (
+        ServiceModuleName.type_defs,
+        ServiceModuleName.literals,
+    )
+
     def __init__(
         self,
         name: str,
@@ -38,37 +54,92 @@ class ServicePackage(Package):
         helper_functions: Iterable[Function] = tuple(),
     ):
         super().__init__(name=name, pypi_name=pypi_name)
+        self._module_types: Dict[ServiceModuleName, Set[FakeAnnotation]] = {}
+        self._module_import_records: Dict[ServiceModuleName, List[ImportRecord]] = {}
         self.service_name = service_name
         self.client = client
         self.service_resource = service_resource
         self.waiters = list(waiters)
         self.paginators = list(paginators)
-        self.typed_dicts = list(typed_dicts)
-        self.literals = list(literals)
+        self._typed_dicts = list(typed_dicts)
+        self._literals = list(literals)
         self.helper_functions = list(helper_functions)
+        self.recursive_typed_dict_names: Optional[Set[str]] = None
+        self._typed_dict_graph: Optional[TypedDictGraph] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop typed dict graph and module types on pickling.
+
+        Typed dict graph is indexed by object identity, module types are sets of annotations
+        with render-based hashes. Module import records are kept.
+        """
+        state = self.__dict__.copy()
+        state["_typed_dict_graph"] = None
+        state["_module_types"] = {}
+        return state
+
+    @property
+    def typed_dicts(self) -> List[TypeTypedDict]:
+        """
+        Typed dicts rendered to `type_defs` module.
+        """
+        return self._typed_dicts
+
+    @typed_dicts.setter
+    def typed_dicts(self, typed_dicts: List[TypeTypedDict]) -> None:
+        self._typed_dicts = typed_dicts
+        self._invalidate_index(ServiceModuleName.type_defs)
+
+    @property
+    def literals(self) -> List[TypeLiteral]:
+        """
+        Literals rendered to `literals` module.
+        """
+        return self._literals
+
+    @literals.setter
+    def literals(self, literals: List[TypeLiteral]) -> None:
+        self._literals = literals
+        self._invalidate_index(ServiceModuleName.literals)
+
+    def _invalidate_index(self, module_name: ServiceModuleName) -> None:
+        self._module_types.pop(module_name, None)
+        self._module_import_records.pop(module_name, None)
+
+    @property
+    def typed_dict_graph(self) -> TypedDictGraph:
+        """
+        Dependency graph of all typed dicts used by package.
+        """
+        if self._typed_dict_graph is None:
+            self._typed_dict_graph = TypedDictGraph([*self._get_typed_dicts(), *self.typed_dicts])
+        return self._typed_dict_graph
 
     def extract_literals(self) -> List[TypeLiteral]:
         """
         Extract literals from children.
         """
         found: Dict[str, TypeLiteral] = {}
+        literals: List[TypeLiteral] = []
+        typed_dicts: List[TypeTypedDict] = []
         for type_annotation in sorted([*self.get_types(), *self.typed_dicts]):
-            current: List[TypeLiteral] = []
             if isinstance(type_annotation, TypeTypedDict):
-                current.extend(type_annotation.get_children_literals())
+                typed_dicts.append(type_annotation)
             if isinstance(type_annotation, TypeLiteral):
-                current.append(type_annotation)
+                literals.append(type_annotation)
+        literals.extend(self.typed_dict_graph.get_literals(typed_dicts))
 
-            for literal in current:
-                if literal.name not in found:
-                    found[literal.name] = literal
-                    continue
+        for literal in literals:
+            if literal.name not in found:
+                found[literal.name] = literal
+                continue
 
-                old_literal = found[literal.name]
-                if not literal.is_same(old_literal):
-                    raise ValueError(
-                        f"Duplicate literal: {literal.name} {literal.children} != {old_literal.children}"
-                    )
+            old_literal = found[literal.name]
+            if not literal.is_same(old_literal):
+                raise ValueError(
+                    f"Duplicate literal: {literal.name} {literal.children} != {old_literal.children}"
+                )
 
         return list(sorted(found.values()))
 
@@ -98,49 +169,194 @@ class ServicePackage(Package):
 
         Attempts to resolve circular typed dicts.
         """
-        added_hashes: List[int] = []
+        added_hashes: Set[int] = set()
         result: List[TypeTypedDict] = []
         discovered: List[TypeTypedDict] = []
         typed_dicts = self._get_typed_dicts()
+        graph = TypedDictGraph(typed_dicts)
         for type_annotation in sorted(typed_dicts):
             if hash(type_annotation) in added_hashes:
                 continue
 
             result.append(type_annotation)
-            added_hashes.append(hash(type_annotation))
+            added_hashes.add(hash(type_annotation))
             discovered.append(type_annotation)
 
         while discovered:
             child = discovered.pop()
-            sub_typed_dicts = child.get_children_typed_dicts()
+            sub_typed_dicts = graph.get_children_typed_dicts(child)
             for child_typed_dict in sorted(sub_typed_dicts):
-                child_typed_dict.stringify = True
+                if not child_typed_dict.stringify:
+                    child_typed_dict.stringify = True
+                    child_typed_dict.invalidate()
 
                 if hash(child_typed_dict) in added_hashes:
                     continue
 
                 result.append(child_typed_dict)
-                added_hashes.append(hash(child_typed_dict))
+                added_hashes.add(hash(child_typed_dict))
                 discovered.append(child_typed_dict)
 
         result.sort()
+        self._typed_dict_graph = graph
         return result
 
+    def replace_self_references(self) -> None:
+        """
+        Replace self references in typed dicts to avoid circular dependencies.
+
+        If `recursive_typed_dict_names` are set, only these typed dicts are checked.
+        """
+        for typed_dict in self.typed_dicts:
+            if (
+                self.recursive_typed_dict_names is not None
+                and typed_dict.name not in self.recursive_typed_dict_names
+            ):
+                continue
+            self.typed_dict_graph.replace_self_references(typed_dict)
+        self._invalidate_index(ServiceModuleName.type_defs)
+
     def get_types(self) -> Set[FakeAnnotation]:
         """
         Extract type annotations from Client, ServiceResource, waiters and paginators.
         """
         types: Set[FakeAnnotation] = set()
-        types.update(self.client.get_types())
-        if self.service_resource:
-            types.update(self.service_resource.get_types())
-        for waiter in self.waiters:
-            types.update(waiter.get_types())
-        for paginator in self.paginators:
-            types.update(paginator.get_types())
+        for module_name in self.INDEXED_MODULE_NAMES:
+            types.update(self.get_module_types(module_name))
+
+        return types
+
+    def build_index(self) -> None:
+        """
+        Collect used types and required import records of class modules in a single pass.
+
+        Should be called when Client, ServiceResource, waiters and paginators are final,
+        index is not updated on changes. `type_defs` and `literals` modules are indexed
+        on first access and invalidated when `typed_dicts`, `literals` or self references
+        are replaced.
+        """
+        self._module_types = {}
+        self._module_import_records = {}
+        for module_name in self.INDEXED_MODULE_NAMES:
+            types = self._get_module_types(module_name)
+            self._module_types[module_name] = types
+            self._module_import_records[module_name] = self._get_module_import_records(
+                module_name, types
+            )
+
+    def get_module_types(self, module_name: ServiceModuleName) -> Set[FakeAnnotation]:
+        """
+        Get type annotations used by a module.
+
+        Arguments:
+            module_name -- Service module name.
+
+        Returns:
+            A set of type annotations.
+        """
+        if module_name in self._module_types:
+            return self._module_types[module_name]
+
+        types = self._get_module_types(module_name)
+        if module_name in self.LAZY_INDEXED_MODULE_NAMES:
+            self._module_types[module_name] = types
+        return types
 
+    def _get_module_types(self, module_name: ServiceModuleName) -> Set[FakeAnnotation]:
+        types: Set[FakeAnnotation] = set()
+        if module_name == ServiceModuleName.client:
+            types.update(self.client.get_types())
+            types.update(self.client.exceptions_class.get_types())
+        if module_name == ServiceModuleName.service_resource and self.service_resource:
+            types.update(self.service_resource.get_types())
+        if module_name == ServiceModuleName.paginator:
+            for paginator in self.paginators:
+                types.update(paginator.get_types())
+        if module_name == ServiceModuleName.waiter:
+            for waiter in self.waiters:
+                types.update(waiter.get_types())
+        if module_name == ServiceModuleName.type_defs:
+            for typed_dict in self.typed_dicts:
+                types.update(typed_dict.get_children_types())
+        if module_name == ServiceModuleName.literals:
+            types.update(self.literals)
         return types
 
+    def get_module_required_import_records(
+        self, module_name: ServiceModuleName
+    ) -> List[ImportRecord]:
+        """
+        Get import records for a module.
+
+        Arguments:
+            module_name -- Service module name.
+
+        Returns:
+            A sorted list of import records.
+        """
+        if module_name in self._module_import_records:
+            return self._module_import_records[module_name]
+
+        import_records = self._get_module_import_records(
+            module_name, self.get_module_types(module_name)
+        )
+        if module_name in self.LAZY_INDEXED_MODULE_NAMES:
+            self._module_import_records[module_name] = import_records
+        return import_records
+
+    def _get_module_import_records(
+        self, module_name: ServiceModuleName, types: Iterable[FakeAnnotation]
+    ) -> List[ImportRecord]:
+        import_records: Set[ImportRecord] = set()
+        if module_name == ServiceModuleName.literals:
+            import_records.add(ImportRecord(ImportString("sys")))
+            import_records.add(
+                ImportRecord(
+                    ImportString("typing"),
+                    "Literal",
+                    min_version=(3, 8),
+                    fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
+                )
+            )
+            return list(sorted(import_records))
+
+        if module_name == ServiceModuleName.type_defs:
+            if not self.typed_dicts:
+                return []
+
+            import_records.add(ImportRecord(ImportString("sys")))
+            import_records.add(
+                ImportRecord(
+                    ImportString("typing"),
+                    "TypedDict",
+                    min_version=(3, 8),
+                    fallback=ImportRecord(ImportString("typing_extensions"), "TypedDict"),
+                )
+            )
+            if any(i.replace_with_dict for i in self.typed_dicts):
+                import_records.add(ImportRecord(ImportString("typing"), "Dict"))
+                import_records.add(ImportRecord(ImportString("typing"), "Any"))
+
+        for type_annotation in types:
+            import_record = type_annotation.get_import_record()
+            if not import_record or import_record.is_builtins():
+                continue
+            if module_name == ServiceModuleName.type_defs and import_record.is_type_defs():
+                continue
+            import_records.add(import_record.get_external(self.service_name.module_name))
+            if import_record.fallback:
+                import_records.add(ImportRecord(ImportString("sys")))
+
+        return list(sorted(import_records))
+
+    def get_import_record_sections(
+        self, import_records: Iterable[ImportRecord]
+    ) -> List[List[ImportRecordGroup]]:
+        """
+        Get import record groups split into sections in final render order.
+        """
+        return ImportRecordGroup.get_sections(import_records, self.service_name.module_name)
+
     def get_init_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `__init__.py[i]`.
@@ -197,116 +413,37 @@ class ServicePackage(Package):
         """
         Get import records for `client.py[i]`.
         """
-        import_records: Set[ImportRecord] = set()
-        for import_record in self.client.get_required_import_records():
-            import_records.add(import_record.get_external(self.service_name.module_name))
-            if import_record.fallback:
-                import_records.add(ImportRecord(ImportString("sys")))
-        for import_record in self.client.exceptions_class.get_required_import_records():
-            import_records.add(import_record.get_external(self.service_name.module_name))
-            if import_record.fallback:
-                import_records.add(ImportRecord(ImportString("sys")))
-
-        return list(sorted(import_records))
+        return self.get_module_required_import_records(ServiceModuleName.client)
 
     def get_service_resource_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `service_resource.py[i]`.
         """
-        if self.service_resource is None:
-            return []
-
-        import_records: Set[ImportRecord] = set()
-        class_import_records = self.service_resource.get_required_import_records()
-        for import_record in class_import_records:
-            import_records.add(import_record.get_external(self.service_name.module_name))
-            if import_record.fallback:
-                import_records.add(ImportRecord(ImportString("sys")))
-
-        return list(sorted(import_records))
+        return self.get_module_required_import_records(ServiceModuleName.service_resource)
 
     def get_paginator_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `paginator.py[i]`.
         """
-        import_records: Set[ImportRecord] = set()
-        for paginator in self.paginators:
-            for import_record in paginator.get_required_import_records():
-                import_records.add(import_record.get_external(self.service_name.module_name))
-                if import_record.fallback:
-                    import_records.add(ImportRecord(ImportString("sys")))
-
-        return list(sorted(import_records))
+        return self.get_module_required_import_records(ServiceModuleName.paginator)
 
     def get_waiter_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `waiter.py[i]`.
         """
-        import_records: Set[ImportRecord] = set()
-        for waiter in self.waiters:
-            for import_record in waiter.get_required_import_records():
-                import_records.add(import_record.get_external(self.service_name.module_name))
-                if import_record.fallback:
-                    import_records.add(ImportRecord(ImportString("sys")))
-
-        return list(sorted(import_records))
+        return self.get_module_required_import_records(ServiceModuleName.waiter)
 
     def get_type_defs_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `type_defs.py[i]`.
         """
-        if not self.typed_dicts:
-            return []
-
-        import_records: Set[ImportRecord] = set()
-        import_records.add(ImportRecord(ImportString("sys")))
-        import_records.add(
-            ImportRecord(
-                ImportString("typing"),
-                "TypedDict",
-                min_version=(3, 8),
-                fallback=ImportRecord(ImportString("typing_extensions"), "TypedDict"),
-            )
-        )
-        for typed_dict in self.typed_dicts:
-            if typed_dict.replace_with_dict:
-                import_records.add(
-                    ImportRecord(
-                        ImportString("typing"),
-                        "Dict",
-                    )
-                )
-                import_records.add(
-                    ImportRecord(
-                        ImportString("typing"),
-                        "Any",
-                    )
-                )
-            for type_annotation in typed_dict.get_children_types():
-                import_record = type_annotation.get_import_record()
-                if not import_record or import_record.is_builtins():
-                    continue
-                if import_record.is_type_defs():
-                    continue
-                import_records.add(import_record.get_external(self.service_name.module_name))
-
-        return list(sorted(import_records))
+        return self.get_module_required_import_records(ServiceModuleName.type_defs)
 
     def get_literals_required_import_records(self) -> List[ImportRecord]:
         """
         Get import records for `literals.py[i]`.
         """
-        import_records: Set[ImportRecord] = set()
-        import_records.add(ImportRecord(ImportString("sys")))
-        import_records.add(
-            ImportRecord(
-                ImportString("typing"),
-                "Literal",
-                min_version=(3, 8),
-                fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
-            )
-        )
-        return list(sorted(import_records))
+        return self.get_module_required_import_records(ServiceModuleName.literals)
 
     def validate(self) -> None:
         """
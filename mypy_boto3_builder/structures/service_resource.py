@@ -1,7 +1,7 @@
 """
 Boto3 ServiceResource.
 """
-from typing import List, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from boto3.resources.base import ServiceResource as Boto3ServiceResource
 
@@ -26,7 +26,7 @@ class ServiceResource(ClassRecord):
         self,
         name: str,
         service_name: ServiceName,
-        boto3_service_resource: Boto3ServiceResource,
+        boto3_service_resource: Optional[Boto3ServiceResource] = None,
     ):
         super().__init__(
             name=name,
@@ -43,6 +43,14 @@ class ServiceResource(ClassRecord):
         self.collections: List[Collection] = []
         self.sub_resources: List[Resource] = []
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop boto3 object on pickling, it is used only during parsing.
+        """
+        state = self.__dict__.copy()
+        state["boto3_service_resource"] = None
+        return state
+
     def __hash__(self) -> int:
         return hash(self.service_name)
 
@@ -129,6 +137,7 @@ class ServiceResource(ClassRecord):
                     continue
 
                 internal_import.stringify = True
+                internal_import.invalidate()
 
             result.append(sub_resource)
             added_names.add(sub_resource.name)
@@ -0,0 +1,106 @@
+"""
+Dependency graph of typed dicts.
+"""
+from typing import Dict, Iterable, List, Set
+
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class TypedDictGraph:
+    """
+    Dependency graph of typed dicts.
+
+    Children of each typed dict are collected once, nodes are indexed by identity,
+    so circular and shared typed dicts are processed in linear time.
+
+    Arguments:
+        typed_dicts -- Root typed dicts, all reachable typed dicts are added too.
+    """
+
+    def __init__(self, typed_dicts: Iterable[TypeTypedDict] = tuple()) -> None:
+        self._nodes: Dict[int, TypeTypedDict] = {}
+        self._children: Dict[int, Set[TypeTypedDict]] = {}
+        self._literals: Dict[int, Set[TypeLiteral]] = {}
+        for typed_dict in typed_dicts:
+            self.add(typed_dict)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, typed_dict: TypeTypedDict) -> bool:
+        return id(typed_dict) in self._nodes
+
+    def add(self, typed_dict: TypeTypedDict) -> None:
+        """
+        Add `typed_dict` and all typed dicts reachable from it.
+        """
+        stack = [typed_dict]
+        while stack:
+            node = stack.pop()
+            if node in self:
+                continue
+
+            children: Set[TypeTypedDict] = set()
+            literals: Set[TypeLiteral] = set()
+            for type_annotation in node.get_children_types():
+                if isinstance(type_annotation, TypeTypedDict):
+                    children.add(type_annotation)
+                if isinstance(type_annotation, TypeLiteral):
+                    literals.add(type_annotation)
+
+            self._nodes[id(node)] = node
+            self._children[id(node)] = children
+            self._literals[id(node)] = literals
+            stack.extend(children)
+
+    def get_children_typed_dicts(self, typed_dict: TypeTypedDict) -> Set[TypeTypedDict]:
+        """
+        Get typed dicts used by `typed_dict` attributes.
+
+        Same as `TypeTypedDict.get_children_typed_dicts`.
+        """
+        self.add(typed_dict)
+        return self._children[id(typed_dict)]
+
+    def iterate_reachable(self, typed_dicts: Iterable[TypeTypedDict]) -> Iterable[TypeTypedDict]:
+        """
+        Iterate over `typed_dicts` and all typed dicts reachable from them once.
+        """
+        visited: Set[int] = set()
+        stack: List[TypeTypedDict] = list(typed_dicts)
+        stack.reverse()
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                continue
+
+            visited.add(id(node))
+            yield node
+            stack.extend(self.get_children_typed_dicts(node))
+
+    def get_literals(self, typed_dicts: Iterable[TypeTypedDict]) -> Set[TypeLiteral]:
+        """
+        Get literals used by `typed_dicts` and all typed dicts reachable from them.
+        """
+        result: Set[TypeLiteral] = set()
+        for typed_dict in self.iterate_reachable(typed_dicts):
+            result.update(self._literals[id(typed_dict)])
+        return result
+
+    def replace_self_references(self, typed_dict: TypeTypedDict) -> None:
+        """
+        Replace self references with `Dict[str, Any]` to avoid circular dependencies.
+        """
+        for child in self.get_children_typed_dicts(typed_dict):
+            if child is typed_dict:
+                child.replace_with_dict.add(typed_dict.name)
+                continue
+            for sub_child in self.get_children_typed_dicts(child):
+                if sub_child.replace_with_dict:
+                    continue
+                if sub_child is typed_dict:
+                    sub_child.replace_with_dict.add(child.name)
+                    continue
+
+        typed_dict.invalidate()
@@ -16,6 +16,8 @@ class ExternalImport(FakeAnnotation):
         alias -- Import local name.
     """
 
+    __slots__ = ("source", "name", "alias", "import_record")
+
     def __init__(
         self,
         source: ImportString,
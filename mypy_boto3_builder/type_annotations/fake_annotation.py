@@ -2,17 +2,85 @@
 Parent class for all type annotation wrappers.
 """
 from abc import ABC, abstractmethod
-from typing import Any, Set
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Set, Tuple, TypeVar
 
 from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 
+_R = TypeVar("_R")
+
 
 class FakeAnnotation(ABC):
     """
     Parent class for all type annotation wrappers.
+
+    In frozen mode render output and hash are computed once per annotation
+    and invalidated explicitly on mutation, see `FakeAnnotation.frozen`.
+
+    All subclasses define `__slots__`, as a full service parse creates
+    tens of thousands of annotations.
     """
 
+    __slots__ = ("_memo_generation", "_memo")
+
+    _memo_generation: int
+    _memo: Dict[str, Any]
+
+    _frozen = False
+    _generation = 0
+
+    @classmethod
+    @contextmanager
+    def frozen(cls) -> Iterator[None]:
+        """
+        Memoize render output and hash of all annotations within context.
+        """
+        frozen = FakeAnnotation._frozen
+        FakeAnnotation._frozen = True
+        FakeAnnotation.invalidate()
+        try:
+            yield
+        finally:
+            FakeAnnotation._frozen = frozen
+            FakeAnnotation.invalidate()
+
+    @staticmethod
+    def invalidate() -> None:
+        """
+        Invalidate memoized values of all annotations.
+
+        Parent annotations memoize render output of children,
+        so any mutation invalidates all memoized values.
+        """
+        FakeAnnotation._generation += 1
+
+    def _memoize(self, key: str, getter: Callable[[], _R]) -> _R:
+        if not FakeAnnotation._frozen:
+            return getter()
+
+        if getattr(self, "_memo_generation", -1) != FakeAnnotation._generation:
+            self._memo_generation = FakeAnnotation._generation
+            self._memo = {}
+        if key not in self._memo:
+            self._memo[key] = getter()
+        return self._memo[key]
+
+    def __getstate__(self) -> Tuple[None, Dict[str, Any]]:
+        """
+        Get slot values for pickling, memoized values are dropped.
+        """
+        state: Dict[str, Any] = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name in FakeAnnotation.__slots__ or not hasattr(self, name):
+                    continue
+                state[name] = getattr(self, name)
+        return None, state
+
     def __hash__(self) -> int:
+        return self._memoize("hash", self._get_hash)
+
+    def _get_hash(self) -> int:
         return hash(self.render())
 
     def __eq__(self, other: Any) -> bool:
@@ -40,7 +108,7 @@ class FakeAnnotation(ABC):
         return str(self)
 
     def __str__(self) -> str:
-        return self.render()
+        return self._memoize("render", self.render)
 
     @abstractmethod
     def render(self, parent_name: str = "") -> str:
@@ -21,6 +21,8 @@ class InternalImport(FakeAnnotation):
         use_alias -- Use name alias.
     """
 
+    __slots__ = ("name", "service_name", "module_name", "stringify", "use_alias")
+
     def __init__(
         self,
         name: str,
@@ -92,6 +94,8 @@ class AliasInternalImport(InternalImport):
         service_name -- Service that import belongs to.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, service_name: Optional[ServiceName] = None) -> None:
         super().__init__(
             name=name,
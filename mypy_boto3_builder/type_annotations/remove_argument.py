@@ -10,6 +10,8 @@ class RemoveArgument(FakeAnnotation):
     Annotation to mark argument for removal.
     """
 
+    __slots__ = ()
+
     def render(self, parent_name: str = "") -> str:
         """
         Not used.
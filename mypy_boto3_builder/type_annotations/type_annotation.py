@@ -30,6 +30,8 @@ class TypeAnnotation(FakeAnnotation):
         wrapped_type -- Original type annotation.
     """
 
+    __slots__ = ("wrapped_type",)
+
     supported_types: Tuple[Any, ...] = (
         Union,
         Any,
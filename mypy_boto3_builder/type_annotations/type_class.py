@@ -18,6 +18,8 @@ class TypeClass(FakeAnnotation):
         alias -- Local name.
     """
 
+    __slots__ = ("value", "alias")
+
     def __init__(self, value: Any, alias: str = "") -> None:
         self.value: Any = value
         self.alias: str = alias
@@ -15,6 +15,8 @@ class TypeConstant(FakeAnnotation):
         value -- Constant value.
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: Any) -> None:
         self.value: Any = value
 
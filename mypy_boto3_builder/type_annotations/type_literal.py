@@ -21,6 +21,8 @@ class TypeLiteral(FakeAnnotation):
         inline -- Render literal inline.
     """
 
+    __slots__ = ("children", "name")
+
     def __init__(self, name: str, children: Iterable[Any]) -> None:
         self.children: Set[Any] = set(children)
         self.name: str = self._find_name(name)
@@ -16,6 +16,8 @@ class TypeSubscript(FakeAnnotation):
         children -- Children type annotations.
     """
 
+    __slots__ = ("parent", "children")
+
     def __init__(
         self,
         parent: FakeAnnotation,
@@ -24,7 +26,7 @@ class TypeSubscript(FakeAnnotation):
         self.parent: FakeAnnotation = parent
         self.children: List[FakeAnnotation] = list(children)
 
-    def __hash__(self) -> int:
+    def _get_hash(self) -> int:
         return hash(f"{self.parent}.{self.children}")
 
     def render(self, parent_name: str = "") -> str:
@@ -35,10 +37,13 @@ class TypeSubscript(FakeAnnotation):
             A string with a valid type annotation.
         """
         if not self.children:
-            return f"{self.parent.render()}"
+            return str(self.parent)
 
-        children = ", ".join([i.render(parent_name) for i in self.children])
-        return f"{self.parent.render()}[{children}]"
+        if parent_name:
+            children = ", ".join([i.render(parent_name) for i in self.children])
+        else:
+            children = ", ".join([str(i) for i in self.children])
+        return f"{self.parent}[{children}]"
 
     def get_import_record(self) -> ImportRecord:
         """
@@ -60,6 +65,7 @@ class TypeSubscript(FakeAnnotation):
         Add new child to Substcript.
         """
         self.children.append(child)
+        self.invalidate()
 
     def is_dict(self) -> bool:
         """
@@ -8,7 +8,6 @@ from mypy_boto3_builder.import_helpers.import_record import ImportRecord
 from mypy_boto3_builder.import_helpers.internal_import_record import InternalImportRecord
 from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type import Type
-from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
 
 
 class TypedDictAttribute:
@@ -21,6 +20,8 @@ class TypedDictAttribute:
         required -- Whether the attribute has to be set.
     """
 
+    __slots__ = ("name", "type_annotation", "required")
+
     def __init__(self, name: str, type_annotation: FakeAnnotation, required: bool):
         self.name = name
         self.type_annotation = type_annotation
@@ -48,6 +49,8 @@ class TypeTypedDict(FakeAnnotation):
         replace_with_dict -- Render Dict[str, Any] instead to avoid circular dependencies.
     """
 
+    __slots__ = ("name", "children", "docstring", "stringify", "replace_with_dict")
+
     def __init__(
         self,
         name: str,
@@ -68,7 +71,7 @@ class TypeTypedDict(FakeAnnotation):
         """
         return self.name
 
-    def __hash__(self) -> int:
+    def _get_hash(self) -> int:
         children = "".join(i.name for i in self.children)
         hash_str = f"{self.name} {children}"
         return hash(hash_str)
@@ -123,6 +126,7 @@ class TypeTypedDict(FakeAnnotation):
             required -- Whether argument has to be set.
         """
         self.children.append(TypedDictAttribute(name, type_annotation, required))
+        self.invalidate()
 
     def is_dict(self) -> bool:
         """
@@ -229,38 +233,6 @@ class TypeTypedDict(FakeAnnotation):
 
         return result
 
-    def get_children_literals(
-        self, processed: Iterable["TypeTypedDict"] = tuple()
-    ) -> Set[TypeLiteral]:
-        """
-        Extract required TypeLiteral list from attributes.
-        """
-        result: Set[TypeLiteral] = set()
-        if self in processed:
-            return result
-        children_types = self.get_children_types()
-        for type_annotation in children_types:
-            if isinstance(type_annotation, TypeLiteral):
-                result.add(type_annotation)
-            if isinstance(type_annotation, TypeTypedDict):
-                result.update(type_annotation.get_children_literals((self, *processed)))
-        return result
-
-    def replace_self_references(self) -> None:
-        """
-        Replace self refenrences with `Dict[str, Any]` to avoid circular dependencies.
-        """
-        for child in self.get_children_typed_dicts():
-            if child is self:
-                child.replace_with_dict.add(self.name)
-                continue
-            for sub_child in child.get_children_typed_dicts():
-                if sub_child.replace_with_dict:
-                    continue
-                if sub_child is self:
-                    sub_child.replace_with_dict.add(child.name)
-                    continue
-
     @property
     def requires_safe_render(self) -> bool:
         """
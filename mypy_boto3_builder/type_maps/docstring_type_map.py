@@ -10,7 +10,9 @@ from mypy_boto3_builder.type_annotations.external_import import ExternalImport
 from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.internal_import import AliasInternalImport
 from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_annotation import TypeAnnotation
 from mypy_boto3_builder.type_annotations.type_class import TypeClass
+from mypy_boto3_builder.type_annotations.type_constant import TypeConstant
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 
 DOCSTRING_TYPE_MAP: Dict[str, FakeAnnotation] = {
@@ -463,6 +465,11 @@ def get_type_from_docstring(type_str: str) -> FakeAnnotation:
         ValueError -- If type_str not found in map.
     """
     try:
-        return DOCSTRING_TYPE_MAP[type_str].copy()
+        type_annotation = DOCSTRING_TYPE_MAP[type_str]
     except KeyError as e:
         raise ValueError(f"Unknown type: {type_str}") from e
+
+    # immutable leaf annotations are shared instead of copied
+    if isinstance(type_annotation, (TypeAnnotation, TypeClass, TypeConstant, ExternalImport)):
+        return type_annotation
+    return type_annotation.copy()
@@ -0,0 +1,62 @@
+"""
+Helpers for botocore data files of a service.
+"""
+import hashlib
+from pathlib import Path
+from typing import List
+
+from boto3.session import Session
+from botocore.exceptions import DataNotFoundError
+
+from mypy_boto3_builder.constants import SERVICE_MODEL_TYPES
+from mypy_boto3_builder.service_name import ServiceName
+
+
+def get_service_model_paths(session: Session, service_name: ServiceName) -> List[Path]:
+    """
+    Get paths to botocore and boto3 data files for `service_name`.
+
+    Includes latest API version of each type from `SERVICE_MODEL_TYPES`
+    with SDK extras from all loader search paths.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+
+    Returns:
+        A sorted list of existing file paths.
+    """
+    loader = session._loader  # type: ignore
+    result: List[Path] = []
+    for type_name in SERVICE_MODEL_TYPES:
+        try:
+            api_version = loader.determine_latest_version(service_name.boto3_name, type_name)
+        except DataNotFoundError:
+            continue
+
+        for search_path in loader.search_paths:
+            model_path = Path(search_path) / service_name.boto3_name / api_version
+            if not model_path.is_dir():
+                continue
+            result.extend(i for i in model_path.glob(f"{type_name}.*") if i.is_file())
+
+    result.sort()
+    return result
+
+
+def get_service_model_hash(session: Session, service_name: ServiceName) -> str:
+    """
+    Get content hash of botocore and boto3 data files for `service_name`.
+
+    Arguments:
+        session -- boto3 session.
+        service_name -- Target service name.
+
+    Returns:
+        SHA256 hex digest.
+    """
+    hasher = hashlib.sha256()
+    for path in get_service_model_paths(session, service_name):
+        hasher.update(path.name.encode())
+        hasher.update(path.read_bytes())
+    return hasher.hexdigest()
@@ -0,0 +1,129 @@
+"""
+Helpers for on-disk cache directories.
+"""
+import filecmp
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.nice_path import NicePath
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write `data` to `path` via a temporary file, so readers never see partial content.
+
+    Arguments:
+        path -- Target file path.
+        data -- File content.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+class AtomicTextWriter:
+    """
+    Write text to a temporary file and replace target file on commit.
+
+    Keeps size and SHA256 hash of written content.
+
+    Arguments:
+        path -- Target file path.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.size = 0
+        self._hasher = hashlib.sha256()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        self.temp_path = Path(temp_name)
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, text: str) -> None:
+        """
+        Append `text` to temporary file.
+        """
+        data = text.encode()
+        self._file.write(data)
+        self._hasher.update(data)
+        self.size += len(data)
+
+    def get_hash(self) -> str:
+        """
+        Get SHA256 hex digest of written content.
+        """
+        return self._hasher.hexdigest()
+
+    def commit(self, compare: bool = True) -> bool:
+        """
+        Replace target file with written content.
+
+        Arguments:
+            compare -- Keep target file if it has the same content.
+
+        Returns:
+            True if target file has been changed.
+        """
+        self._file.close()
+        if compare and self.path.exists() and filecmp.cmp(self.temp_path, self.path, shallow=False):
+            self.temp_path.unlink()
+            return False
+
+        os.chmod(self.temp_path, self.get_default_mode())
+        os.replace(self.temp_path, self.path)
+        return True
+
+    @staticmethod
+    def get_default_mode() -> int:
+        """
+        Get mode of new files, temporary files are private by default.
+        """
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+    def abort(self) -> None:
+        """
+        Remove temporary file and keep target file intact.
+        """
+        self._file.close()
+        self.temp_path.unlink(missing_ok=True)
+
+
+def evict_least_recently_used(path: Path, pattern: str, max_size: int) -> None:
+    """
+    Remove least recently used files until their total size fits `max_size`.
+
+    Access time is tracked by file modification time, touch files on cache hit.
+
+    Arguments:
+        path -- Cache directory.
+        pattern -- Glob pattern of cache entries.
+        max_size -- Size limit in bytes.
+    """
+    logger = get_logger()
+    entries = []
+    for entry_path in path.glob(pattern):
+        try:
+            stat = entry_path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+    total_size = sum(i[1] for i in entries)
+    for _, size, entry_path in sorted(entries):
+        if total_size <= max_size:
+            break
+        logger.debug(f"Evicting {NicePath(entry_path)}")
+        entry_path.unlink(missing_ok=True)
+        total_size -= size
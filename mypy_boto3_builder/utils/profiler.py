@@ -0,0 +1,184 @@
+"""
+Process-wide profiler of builder phases.
+"""
+import csv
+import io
+import json
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+from mypy_boto3_builder.utils.disk_cache import write_atomic
+
+__all__ = ("Profiler", "PhaseStats")
+
+
+class PhaseStats:
+    """
+    Wall time, CPU time and allocated memory blocks of a phase.
+
+    Timings are inclusive, nested phases are also counted in outer phases.
+
+    Arguments:
+        scope -- Service name or `Profiler.BUILDER_SCOPE`.
+        name -- Phase name.
+    """
+
+    def __init__(self, scope: str, name: str) -> None:
+        self.scope = scope
+        self.name = name
+        self.calls = 0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.blocks = 0
+
+    def add(self, other: "PhaseStats") -> None:
+        """
+        Add statistics of `other` to self.
+        """
+        self.calls += other.calls
+        self.wall_time += other.wall_time
+        self.cpu_time += other.cpu_time
+        self.blocks += other.blocks
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        Get report row.
+        """
+        return {
+            "scope": self.scope,
+            "phase": self.name,
+            "calls": self.calls,
+            "wall_time": round(self.wall_time, 6),
+            "cpu_time": round(self.cpu_time, 6),
+            "blocks": self.blocks,
+        }
+
+    def render(self) -> str:
+        """
+        Render statistics to a log-friendly string.
+        """
+        return (
+            f"{self.scope} {self.name} {self.calls}x {self.wall_time:.3f}s wall"
+            f" {self.cpu_time:.3f}s cpu {self.blocks:+} blocks"
+        )
+
+
+class Profiler:
+    """
+    Process-wide profiler of builder phases per service.
+
+    Disabled until `Profiler.enable` is called, phases cost one context switch otherwise.
+    Allocations are measured as a change of allocated memory blocks count.
+    """
+
+    BUILDER_SCOPE = "builder"
+
+    enabled = False
+    scope = BUILDER_SCOPE
+    stats: Dict[Tuple[str, str], PhaseStats] = {}
+
+    @classmethod
+    def enable(cls) -> None:
+        """
+        Start collecting statistics.
+        """
+        cls.enabled = True
+
+    @classmethod
+    @contextmanager
+    def service(cls, name: str) -> Iterator[None]:
+        """
+        Attribute phases in context to service `name`.
+        """
+        scope = cls.scope
+        cls.scope = name
+        try:
+            yield
+        finally:
+            cls.scope = scope
+
+    @classmethod
+    @contextmanager
+    def phase(cls, name: str) -> Iterator[None]:
+        """
+        Measure phase `name` in current service.
+        """
+        if not cls.enabled:
+            yield
+            return
+
+        scope = cls.scope
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        blocks_start = sys.getallocatedblocks()
+        try:
+            yield
+        finally:
+            key = (scope, name)
+            if key not in cls.stats:
+                cls.stats[key] = PhaseStats(scope, name)
+            stats = cls.stats[key]
+            stats.calls += 1
+            stats.wall_time += time.perf_counter() - wall_start
+            stats.cpu_time += time.process_time() - cpu_start
+            stats.blocks += sys.getallocatedblocks() - blocks_start
+
+    @classmethod
+    def pop_stats(cls) -> List[PhaseStats]:
+        """
+        Get and clear collected statistics to pass them from worker processes.
+        """
+        result = list(cls.stats.values())
+        cls.stats = {}
+        return result
+
+    @classmethod
+    def add_stats(cls, stats: List[PhaseStats]) -> None:
+        """
+        Add statistics from worker processes.
+        """
+        for item in stats:
+            key = (item.scope, item.name)
+            if key not in cls.stats:
+                cls.stats[key] = PhaseStats(item.scope, item.name)
+            cls.stats[key].add(item)
+
+    @classmethod
+    def get_phase_totals(cls) -> List[PhaseStats]:
+        """
+        Get statistics of each phase summed over all services sorted by wall time.
+        """
+        totals: Dict[str, PhaseStats] = {}
+        for item in cls.stats.values():
+            if item.name not in totals:
+                totals[item.name] = PhaseStats("total", item.name)
+            totals[item.name].add(item)
+        return sorted(totals.values(), key=lambda x: x.wall_time, reverse=True)
+
+    @classmethod
+    def get_top(cls, size: int) -> List[PhaseStats]:
+        """
+        Get `size` slowest phases of services.
+        """
+        return sorted(cls.stats.values(), key=lambda x: x.wall_time, reverse=True)[:size]
+
+    @classmethod
+    def write_report(cls, path: Path) -> None:
+        """
+        Write collected statistics to CSV if `path` is `*.csv` or to JSON otherwise.
+        """
+        rows = [cls.stats[key].to_dict() for key in sorted(cls.stats)]
+        if path.suffix == ".csv":
+            output = io.StringIO()
+            writer = csv.DictWriter(
+                output, fieldnames=list(PhaseStats("", "").to_dict()), lineterminator="\n"
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+            content = output.getvalue()
+        else:
+            content = json.dumps({"phases": rows}, indent=4)
+        write_atomic(path, content.encode())
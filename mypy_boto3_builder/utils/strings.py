@@ -2,10 +2,11 @@
 Multiple string utils collection.
 """
 import builtins
+import inspect
 import keyword
 import textwrap
 import typing
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 from unittest.mock import MagicMock
 
 from botocore.utils import get_service_module_name
@@ -107,35 +108,29 @@ def is_reserved(word: str) -> bool:
     return word in RESERVED_NAMES
 
 
-def get_short_docstring(doc: str) -> str:
+def _get_short_docstring_lines(doc: str) -> Tuple[List[str], bool]:
     """
-    Create a short docstring from boto3 documentation.
-
-    Trims docstring to 300 chars.
-    Removes double and trible backticks.
-    Ensures that backticks are closed.
-    Wraps docstring to 80 chars.
+    Get lines of the first sentence and whether the sentence end was found.
     """
-    doc = str(doc)
-    if len(doc) > MAX_DOCSTRING_LENGTH:
-        doc = f"{doc[:MAX_DOCSTRING_LENGTH - 3]}..."
-    result = []
-    if not doc:
-        return ""
+    result: List[str] = []
     for line in doc.splitlines():
         line = line.strip().rstrip("::")
         if line.startswith(":"):
-            break
+            return result, True
         if not line:
             continue
         if ". " in line:
             result.append(line.split(". ")[0])
-            break
+            return result, True
         result.append(line)
         if line.endswith("."):
-            break
+            return result, True
+
+    return result, False
 
-    result_str = " ".join(result).replace("```", "`").replace("``", "`").strip()
+
+def _render_short_docstring(lines: Iterable[str]) -> str:
+    result_str = " ".join(lines).replace("```", "`").replace("``", "`").strip()
     if result_str.count("`") % 2:
         result_str = f"{result_str}`"
     if result_str and not result_str.endswith("."):
@@ -144,6 +139,54 @@ def get_short_docstring(doc: str) -> str:
     return "\n".join(textwrap.wrap(result_str, width=80))
 
 
+def get_short_docstring(doc: str) -> str:
+    """
+    Create a short docstring from boto3 documentation.
+
+    Trims docstring to 300 chars.
+    Removes double and trible backticks.
+    Ensures that backticks are closed.
+    Wraps docstring to 80 chars.
+    """
+    doc = str(doc)
+    if len(doc) > MAX_DOCSTRING_LENGTH:
+        doc = f"{doc[:MAX_DOCSTRING_LENGTH - 3]}..."
+    if not doc:
+        return ""
+    lines, _ = _get_short_docstring_lines(doc)
+    return _render_short_docstring(lines)
+
+
+def get_short_docstring_from_prefix(prefix: str) -> Optional[str]:
+    """
+    Create a short docstring from the beginning of raw boto3 documentation.
+
+    Arguments:
+        prefix -- Leading lines of raw documentation, ending with a new line.
+
+    Returns:
+        The same value as `get_short_docstring` for the cleaned full documentation
+        or None if the result depends on the rest of documentation.
+    """
+    lines = prefix.expandtabs().splitlines()
+    if not prefix.endswith("\n"):
+        return None
+    # cleaned prefix is a prefix of cleaned full documentation only without common indent
+    if not any(line and not line[0].isspace() for line in lines[1:]):
+        return None
+
+    doc = inspect.cleandoc(prefix)
+    if len(doc) > MAX_DOCSTRING_LENGTH:
+        return get_short_docstring(doc)
+    if len(doc) > MAX_DOCSTRING_LENGTH - 3:
+        return None
+
+    short_lines, is_complete = _get_short_docstring_lines(doc)
+    if not is_complete:
+        return None
+    return _render_short_docstring(short_lines)
+
+
 def get_botocore_class_name(metadata: Dict[str, str]) -> str:
     """
     Get Botocore class name from Service metadata.
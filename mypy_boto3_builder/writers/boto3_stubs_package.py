@@ -9,6 +9,7 @@ from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.output_sink import OutputSink
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -24,7 +25,6 @@ def write_boto3_stubs_package(
     """
     Generate stubs for boto3-stubs package.
     """
-    logger = get_logger()
     setup_path = output_path / "boto3_stubs_package"
     if generate_setup:
         package_path = setup_path / package.name
@@ -32,6 +32,7 @@ def write_boto3_stubs_package(
         package_path = output_path / "boto3"
 
     package_path.mkdir(exist_ok=True, parents=True)
+    sink = OutputSink(setup_path if generate_setup else package_path)
 
     templates_path = Path("boto3-stubs")
     module_templates_path = templates_path / "boto3-stubs"
@@ -69,25 +70,14 @@ def write_boto3_stubs_package(
             content = insert_md_toc(content)
             content = fix_pypi_headers(content)
             content = format_md(content)
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+        sink.write(file_path, content)
 
-    static_paths = []
     for static_path in BOTO3_STUBS_STATIC_PATH.glob("**/*.pyi"):
         relative_output_path = static_path.relative_to(BOTO3_STUBS_STATIC_PATH)
         file_path = package_path / relative_output_path
-        static_paths.append(file_path)
-        file_path.parent.mkdir(exist_ok=True)
-        content = static_path.read_text()
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+        sink.write(file_path, static_path.read_text())
 
-    valid_paths = (*dict(file_paths).keys(), *static_paths)
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    sink.close()
 
 
 def write_boto3_stubs_docs(package: Boto3StubsPackage, output_path: Path) -> None:
@@ -5,9 +5,8 @@ from pathlib import Path
 from typing import List, Tuple
 
 from mypy_boto3_builder.constants import BOTOCORE_STUBS_NAME, BOTOCORE_STUBS_STATIC_PATH
-from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
-from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.output_sink import OutputSink
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -25,7 +24,6 @@ def write_botocore_stubs_package(output_path: Path, generate_setup: bool) -> Non
         output_path -- Path to output folder.
         generate_setup -- Generate ready-to-install or to-use package.
     """
-    logger = get_logger()
     setup_path = output_path / "botocore_stubs_package"
     if generate_setup:
         package_path = setup_path / BOTOCORE_STUBS_NAME
@@ -33,6 +31,7 @@ def write_botocore_stubs_package(output_path: Path, generate_setup: bool) -> Non
         package_path = output_path / "botocore"
 
     package_path.mkdir(exist_ok=True, parents=True)
+    sink = OutputSink(setup_path if generate_setup else package_path)
 
     templates_path = Path("botocore-stubs")
     module_templates_path = templates_path / "botocore-stubs"
@@ -66,22 +65,11 @@ def write_botocore_stubs_package(output_path: Path, generate_setup: bool) -> Non
             content = insert_md_toc(content)
             content = fix_pypi_headers(content)
             content = format_md(content)
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+        sink.write(file_path, content)
 
-    static_paths = []
     for static_path in BOTOCORE_STUBS_STATIC_PATH.glob("**/*.pyi"):
         relative_output_path = static_path.relative_to(BOTOCORE_STUBS_STATIC_PATH)
         file_path = package_path / relative_output_path
-        static_paths.append(file_path)
-        file_path.parent.mkdir(exist_ok=True)
-        content = static_path.read_text()
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+        sink.write(file_path, static_path.read_text())
 
-    valid_paths = (*dict(file_paths).keys(), *static_paths)
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    sink.close()
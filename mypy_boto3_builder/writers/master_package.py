@@ -4,10 +4,9 @@ Master package writer.
 from pathlib import Path
 from typing import List, Tuple
 
-from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
-from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.output_sink import OutputSink
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -26,7 +25,6 @@ def write_master_package(package: MasterPackage, output_path: Path, generate_set
         output_path -- Path to output folder.
         generate_setup -- Generate ready-to-install or to-use package.
     """
-    logger = get_logger()
     setup_path = output_path / "master_package"
     if generate_setup:
         package_path = setup_path / package.name
@@ -34,6 +32,7 @@ def write_master_package(package: MasterPackage, output_path: Path, generate_set
         package_path = output_path / package.name
 
     package_path.mkdir(exist_ok=True, parents=True)
+    sink = OutputSink(setup_path if generate_setup else package_path)
 
     templates_path = Path("master")
     module_templates_path = templates_path / "master"
@@ -85,11 +84,6 @@ def write_master_package(package: MasterPackage, output_path: Path, generate_set
             content = fix_pypi_headers(content)
             content = format_md(content)
 
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
+        sink.write(file_path, content)
 
-    valid_paths = dict(file_paths).keys()
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+    sink.close()
@@ -0,0 +1,177 @@
+"""
+Output files writer with a manifest of written files.
+"""
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from mypy_boto3_builder.logger import get_logger
+from mypy_boto3_builder.utils.disk_cache import AtomicTextWriter, write_atomic
+from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.profiler import Profiler
+
+__all__ = ("OutputRecord", "OutputSink")
+
+
+@dataclass
+class OutputRecord:
+    """
+    Manifest record of a written file.
+    """
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class OutputSink:
+    """
+    Output files writer with a manifest of written files.
+
+    Manifest keeps size, modification time and content hash of every written file.
+    Manifests are stored in a directory keyed by `root_path` hash, so no files
+    are added to output or installed packages. Disabled until `OutputSink.enable` is called.
+    Files that match their record are not read back, files missing from a new manifest
+    are deleted as stale. Without a previous manifest falls back to reading files back
+    and walking `root_path` for unknown files.
+
+    Arguments:
+        root_path -- Directory with all output files.
+    """
+
+    manifests_path: Optional[Path] = None
+    suffix = ".json"
+
+    def __init__(self, root_path: Path) -> None:
+        self.root_path = root_path
+        self.manifest_path = self.get_manifest_path(root_path)
+        self.previous: Optional[Dict[str, OutputRecord]] = self._load()
+        self.records: Dict[str, OutputRecord] = {}
+
+    @classmethod
+    def enable(cls, path: Path) -> None:
+        """
+        Store manifests of written files in `path`.
+
+        Arguments:
+            path -- Manifests directory.
+        """
+        cls.manifests_path = path
+
+    @classmethod
+    def get_manifest_path(cls, root_path: Path) -> Optional[Path]:
+        """
+        Get manifest path for `root_path`, if manifests are enabled.
+        """
+        if cls.manifests_path is None:
+            return None
+
+        key = hashlib.sha256(root_path.as_posix().encode()).hexdigest()
+        return cls.manifests_path / f"{key}{cls.suffix}"
+
+    def _load(self) -> Optional[Dict[str, OutputRecord]]:
+        if self.manifest_path is None or not self.manifest_path.exists():
+            return None
+
+        try:
+            data = json.loads(self.manifest_path.read_text())
+            return {key: OutputRecord(**value) for key, value in data["files"].items()}
+        except (ValueError, KeyError, TypeError):
+            get_logger().warning(
+                f"Invalid output manifest {NicePath(self.manifest_path)}, ignoring"
+            )
+            return None
+
+    def _get_key(self, path: Path) -> str:
+        return path.relative_to(self.root_path).as_posix()
+
+    def open(self, path: Path) -> AtomicTextWriter:
+        """
+        Start writing `path` in chunks, call `OutputSink.commit` when done.
+
+        Arguments:
+            path -- Output file path inside `root_path`.
+        """
+        return AtomicTextWriter(path)
+
+    def commit(self, writer: AtomicTextWriter) -> bool:
+        """
+        Replace target file with content of `writer` if it has changed.
+
+        Returns:
+            True if target file has been changed.
+        """
+        key = self._get_key(writer.path)
+        sha256 = writer.get_hash()
+        previous_record = self.previous.get(key) if self.previous is not None else None
+        is_intact = previous_record is not None and self._is_intact(writer.path, previous_record)
+        if previous_record is not None and is_intact and previous_record.sha256 == sha256:
+            writer.abort()
+            self.records[key] = previous_record
+            return False
+
+        with Profiler.phase("write"):
+            changed = writer.commit(compare=not is_intact)
+            stat = writer.path.stat()
+        self.records[key] = OutputRecord(
+            size=stat.st_size, mtime_ns=stat.st_mtime_ns, sha256=sha256
+        )
+        if changed:
+            get_logger().debug(f"Updated {NicePath(writer.path)}")
+        return changed
+
+    @staticmethod
+    def _is_intact(path: Path, record: OutputRecord) -> bool:
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == record.size and stat.st_mtime_ns == record.mtime_ns
+
+    def write(self, path: Path, content: str) -> bool:
+        """
+        Write `content` to `path` if it has changed.
+
+        Arguments:
+            path -- Output file path inside `root_path`.
+            content -- File content.
+
+        Returns:
+            True if target file has been changed.
+        """
+        writer = self.open(path)
+        try:
+            writer.write(content)
+        except BaseException:
+            writer.abort()
+            raise
+        return self.commit(writer)
+
+    def close(self) -> None:
+        """
+        Delete stale files and save manifest.
+        """
+        logger = get_logger()
+        if self.previous is None:
+            valid_paths = [self.root_path / i for i in self.records]
+            for unknown_path in NicePath(self.root_path).walk(valid_paths):
+                unknown_path.unlink()
+                logger.debug(f"Deleted {NicePath(unknown_path)}")
+        else:
+            for key in sorted(self.previous.keys() - self.records.keys()):
+                stale_path = self.root_path / key
+                if stale_path.exists():
+                    stale_path.unlink()
+                    logger.debug(f"Deleted {NicePath(stale_path)}")
+
+        if self.manifest_path is None:
+            return
+
+        data = {
+            "root_path": self.root_path.as_posix(),
+            "files": {key: asdict(self.records[key]) for key in sorted(self.records)},
+        }
+        write_atomic(self.manifest_path, json.dumps(data, indent=4).encode())
+        self.previous = dict(self.records)
@@ -2,7 +2,7 @@
 Processors for parsing and writing modules.
 """
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from boto3.session import Session
 
@@ -10,11 +10,14 @@ from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.parsers.boto3_stubs_package import parse_boto3_stubs_package
 from mypy_boto3_builder.parsers.master_package import parse_master_package
 from mypy_boto3_builder.parsers.service_package import parse_service_package
+from mypy_boto3_builder.parsers.service_package_registry import ServicePackageRegistry
 from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.service_package_cache import ServicePackageCache
 from mypy_boto3_builder.structures.boto3_stubs_package import Boto3StubsPackage
 from mypy_boto3_builder.structures.master_package import MasterPackage
 from mypy_boto3_builder.structures.service_package import ServicePackage
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.utils.profiler import Profiler
 from mypy_boto3_builder.writers.boto3_stubs_package import (
     write_boto3_stubs_docs,
     write_boto3_stubs_package,
@@ -29,6 +32,7 @@ def process_boto3_stubs(
     output_path: Path,
     service_names: List[ServiceName],
     generate_setup: bool,
+    registry: Optional[ServicePackageRegistry] = None,
 ) -> Boto3StubsPackage:
     """
     Parse and write stubs package `boto3_stubs`.
@@ -38,13 +42,16 @@ def process_boto3_stubs(
         output_path -- Package output path.
         service_names -- List of known service names.
         generate_setup -- Generate ready-to-install or to-use package.
+        registry -- Already parsed service packages.
 
     Return:
         Parsed Boto3StubsPackage.
     """
     logger = get_logger()
     logger.debug("Parsing boto3 stubs")
-    boto3_stubs_package = parse_boto3_stubs_package(session=session, service_names=service_names)
+    boto3_stubs_package = parse_boto3_stubs_package(
+        session=session, service_names=service_names, registry=registry
+    )
     logger.debug(f"Writing boto3 stubs to {NicePath(output_path)}")
 
     write_boto3_stubs_package(boto3_stubs_package, output_path, generate_setup=generate_setup)
@@ -73,6 +80,7 @@ def process_master(
     output_path: Path,
     service_names: List[ServiceName],
     generate_setup: bool,
+    registry: Optional[ServicePackageRegistry] = None,
 ) -> MasterPackage:
     """
     Parse and write master package `mypy_boto3`.
@@ -82,13 +90,14 @@ def process_master(
         output_path -- Package output path.
         service_names -- List of known service names.
         generate_setup -- Generate ready-to-install or to-use package.
+        registry -- Already parsed service packages.
 
     Return:
         Parsed MasterPackage.
     """
     logger = get_logger()
     logger.debug("Parsing master")
-    master_package = parse_master_package(session, service_names)
+    master_package = parse_master_package(session, service_names, registry)
     logger.debug(f"Writing master to {NicePath(output_path)}")
 
     write_master_package(master_package, output_path=output_path, generate_setup=generate_setup)
@@ -100,6 +109,9 @@ def process_service(
     service_name: ServiceName,
     output_path: Path,
     generate_setup: bool,
+    cache: Optional[ServicePackageCache] = None,
+    format_once: bool = False,
+    skip_isort: bool = False,
 ) -> ServicePackage:
     """
     Parse and write service package `mypy_boto3_*`.
@@ -109,18 +121,31 @@ def process_service(
         service_name -- Target service name.
         output_path -- Package output path.
         generate_setup -- Generate ready-to-install or to-use package.
+        cache -- Cache of parsed service packages.
+        format_once -- Write `.pyi`-formatted content to `.py` twins.
+        skip_isort -- Rely on pre-sorted import sections instead of `isort`.
 
     Return:
         Parsed ServicePackage.
     """
     logger = get_logger()
-    logger.debug(f"Parsing {service_name.boto3_name}")
-    service_module = parse_service_package(session, service_name)
-    for typed_dict in service_module.typed_dicts:
-        typed_dict.replace_self_references()
-    logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
-
-    write_service_package(service_module, output_path=output_path, generate_setup=generate_setup)
+    with Profiler.service(service_name.name):
+        service_module = cache.get(session, service_name) if cache is not None else None
+        if service_module is None:
+            logger.debug(f"Parsing {service_name.boto3_name}")
+            service_module = parse_service_package(session, service_name)
+            service_module.replace_self_references()
+            if cache is not None:
+                cache.set(session, service_module)
+        logger.debug(f"Writing {service_name.boto3_name} to {NicePath(output_path)}")
+
+        write_service_package(
+            service_module,
+            output_path=output_path,
+            generate_setup=generate_setup,
+            format_once=format_once,
+            skip_isort=skip_isort,
+        )
     return service_module
 
 
@@ -153,6 +178,7 @@ def process_boto3_stubs_docs(
     session: Session,
     output_path: Path,
     service_names: List[ServiceName],
+    registry: Optional[ServicePackageRegistry] = None,
 ) -> Boto3StubsPackage:
     """
     Parse and write master package docs.
@@ -161,13 +187,14 @@ def process_boto3_stubs_docs(
         session -- boto3 session.
         output_path -- Package output path.
         service_names -- List of known service names.
+        registry -- Already parsed service packages.
 
     Return:
         Parsed Boto3StubsPackage.
     """
     logger = get_logger()
     logger.debug("Parsing boto3 stubs")
-    boto3_stubs_package = parse_boto3_stubs_package(session, service_names)
+    boto3_stubs_package = parse_boto3_stubs_package(session, service_names, registry)
     logger.debug(f"Writing boto3 stubs to {NicePath(output_path)}")
 
     write_boto3_stubs_docs(boto3_stubs_package, output_path=output_path)
@@ -2,13 +2,17 @@
 Service package writer.
 """
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple
 
+from mypy_boto3_builder.constants import TYPE_DEFS_CHUNK_SIZE
 from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.logger import get_logger
 from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
 from mypy_boto3_builder.utils.markdown import fix_pypi_headers
 from mypy_boto3_builder.utils.nice_path import NicePath
+from mypy_boto3_builder.writers.output_sink import OutputSink
 from mypy_boto3_builder.writers.utils import (
     blackify,
     format_md,
@@ -18,16 +22,26 @@ from mypy_boto3_builder.writers.utils import (
 )
 
 
-def write_service_package(package: ServicePackage, output_path: Path, generate_setup: bool) -> None:
+def write_service_package(
+    package: ServicePackage,
+    output_path: Path,
+    generate_setup: bool,
+    format_once: bool = False,
+    skip_isort: bool = False,
+) -> None:
     """
     Create stubs files for service.
 
+    Each template is rendered once for `.py` and `.pyi` twins.
+    Type definitions are rendered, formatted and written in chunks.
+
     Arguments:
         package -- Service package.
         output_path -- Path to output folder.
         generate_setup -- Generate ready-to-install or to-use package.
+        format_once -- Write `.pyi`-formatted content to `.py` twins.
+        skip_isort -- Rely on pre-sorted import sections instead of `isort`.
     """
-    logger = get_logger()
     setup_path = output_path / f"{package.service_name.module_name}_package"
     if generate_setup:
         package_path = setup_path / package.name
@@ -35,7 +49,37 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
         package_path = output_path / package.name
 
     package_path.mkdir(exist_ok=True, parents=True)
+    sink = OutputSink(setup_path if generate_setup else package_path)
+
+    file_paths = _get_file_paths(package, setup_path, package_path, generate_setup)
+    type_defs_template_path = (
+        Path("service") / "service" / ServiceModuleName.type_defs.template_name
+    )
+    _write_files(
+        sink,
+        package,
+        [i for i in file_paths if i[1] != type_defs_template_path],
+        format_once,
+        skip_isort,
+    )
+
+    type_defs_paths = [path for path, i in file_paths if i == type_defs_template_path]
+    if type_defs_paths:
+        _write_type_defs(
+            sink, package, type_defs_template_path, type_defs_paths, format_once, skip_isort
+        )
+
+    sink.close()
+
 
+def _get_file_paths(
+    package: ServicePackage, setup_path: Path, package_path: Path, generate_setup: bool
+) -> List[Tuple[Path, Path]]:
+    """
+    Get output file paths with template paths.
+
+    Module templates are rendered to `.py` and `.pyi` twins.
+    """
     templates_path = Path("service")
     module_templates_path = templates_path / "service"
     file_paths: List[Tuple[Path, Path]] = []
@@ -53,104 +97,138 @@ def write_service_package(package: ServicePackage, output_path: Path, generate_s
             (package_path / "__init__.py", module_templates_path / "__init__.pyi.jinja2"),
             (package_path / "__main__.py", module_templates_path / "__main__.py.jinja2"),
             (package_path / "py.typed", module_templates_path / "py.typed.jinja2"),
-            (
-                package_path / ServiceModuleName.client.stub_file_name,
-                module_templates_path / ServiceModuleName.client.template_name,
-            ),
-            (
-                package_path / ServiceModuleName.client.file_name,
-                module_templates_path / ServiceModuleName.client.template_name,
-            ),
         ]
     )
-    if package.service_resource:
-        file_paths.extend(
-            (
-                (
-                    package_path / ServiceModuleName.service_resource.stub_file_name,
-                    module_templates_path / ServiceModuleName.service_resource.template_name,
-                ),
-                (
-                    package_path / ServiceModuleName.service_resource.file_name,
-                    module_templates_path / ServiceModuleName.service_resource.template_name,
-                ),
-            )
-        )
-    if package.paginators:
-        file_paths.extend(
-            (
-                (
-                    package_path / ServiceModuleName.paginator.stub_file_name,
-                    module_templates_path / ServiceModuleName.paginator.template_name,
-                ),
-                (
-                    package_path / ServiceModuleName.paginator.file_name,
-                    module_templates_path / ServiceModuleName.paginator.template_name,
-                ),
-            )
-        )
-    if package.waiters:
-        file_paths.extend(
-            (
-                (
-                    package_path / ServiceModuleName.waiter.stub_file_name,
-                    module_templates_path / ServiceModuleName.waiter.template_name,
-                ),
-                (
-                    package_path / ServiceModuleName.waiter.file_name,
-                    module_templates_path / ServiceModuleName.waiter.template_name,
-                ),
-            )
-        )
-    if package.literals:
-        file_paths.extend(
-            (
-                (
-                    package_path / ServiceModuleName.literals.stub_file_name,
-                    module_templates_path / ServiceModuleName.literals.template_name,
-                ),
-                (
-                    package_path / ServiceModuleName.literals.file_name,
-                    module_templates_path / ServiceModuleName.literals.template_name,
-                ),
-            )
-        )
-    if package.typed_dicts:
-        file_paths.extend(
-            (
-                (
-                    package_path / ServiceModuleName.type_defs.stub_file_name,
-                    module_templates_path / ServiceModuleName.type_defs.template_name,
-                ),
-                (
-                    package_path / ServiceModuleName.type_defs.file_name,
-                    module_templates_path / ServiceModuleName.type_defs.template_name,
-                ),
-            )
-        )
+    module_names = [
+        (ServiceModuleName.client, True),
+        (ServiceModuleName.service_resource, bool(package.service_resource)),
+        (ServiceModuleName.paginator, bool(package.paginators)),
+        (ServiceModuleName.waiter, bool(package.waiters)),
+        (ServiceModuleName.literals, bool(package.literals)),
+        (ServiceModuleName.type_defs, bool(package.typed_dicts)),
+    ]
+    for module_name, enabled in module_names:
+        if not enabled:
+            continue
+        template_path = module_templates_path / module_name.template_name
+        file_paths.append((package_path / module_name.stub_file_name, template_path))
+        file_paths.append((package_path / module_name.file_name, template_path))
+    return file_paths
+
+
+def _write_files(
+    sink: OutputSink,
+    package: ServicePackage,
+    file_paths: Sequence[Tuple[Path, Path]],
+    format_once: bool,
+    skip_isort: bool,
+) -> None:
+    """
+    Render each template once and format `.py` and `.pyi` twins once per suffix.
 
+    With `format_once` `.py` twins of stub templates get `.pyi`-formatted content.
+    """
+    stub_template_paths = {i for path, i in file_paths if path.suffix == ".pyi"}
+    rendered: Dict[Path, str] = {}
+    formatted: Dict[Tuple[Path, str], str] = {}
     for file_path, template_path in file_paths:
+        if template_path not in rendered:
+            rendered[template_path] = _render_service_template(
+                package, template_path, file_path, skip_isort
+            )
+        content = rendered[template_path]
+        if file_path.suffix in [".py", ".pyi"]:
+            format_path = file_path
+            if format_once and template_path in stub_template_paths:
+                format_path = file_path.with_suffix(".pyi")
+            format_key = (template_path, format_path.suffix)
+            if format_key not in formatted:
+                formatted[format_key] = blackify(content, format_path)
+            content = formatted[format_key]
+
+        sink.write(file_path, content)
+
+
+def _render_service_template(
+    package: ServicePackage, template_path: Path, file_path: Path, skip_isort: bool
+) -> str:
+    with FakeAnnotation.frozen():
         content = render_jinja2_template(
             template_path,
             package=package,
             service_name=package.service_name,
         )
-        if file_path.suffix in [".py", ".pyi"]:
-            content = sort_imports(content, package.service_name.module_name, extension="pyi")
-            content = blackify(content, file_path)
-        if file_path.suffix == ".md":
-            content = insert_md_toc(content)
-            content = fix_pypi_headers(content)
-            content = format_md(content)
+    if file_path.suffix in [".py", ".pyi"] and not skip_isort:
+        content = sort_imports(content, package.service_name.module_name, extension="pyi")
+    if file_path.suffix == ".md":
+        content = insert_md_toc(content)
+        content = fix_pypi_headers(content)
+        content = format_md(content)
+    return content
 
-        if not file_path.exists() or file_path.read_text() != content:
-            file_path.write_text(content)
-            logger.debug(f"Updated {NicePath(file_path)}")
 
-    valid_paths = dict(file_paths).keys()
-    for unknown_path in NicePath(setup_path if generate_setup else package_path).walk(valid_paths):
-        unknown_path.unlink()
-        logger.debug(f"Deleted {NicePath(unknown_path)}")
+def _write_type_defs(
+    sink: OutputSink,
+    package: ServicePackage,
+    template_path: Path,
+    file_paths: Sequence[Path],
+    format_once: bool,
+    skip_isort: bool,
+) -> None:
+    """
+    Write `type_defs` module twins without keeping the whole module in memory.
+
+    Typed dicts are rendered and formatted in chunks of `TYPE_DEFS_CHUNK_SIZE`,
+    module files are replaced only when content has changed.
+    """
+    format_paths = {
+        i: i.with_suffix(".pyi") if format_once and i.suffix == ".py" else i for i in file_paths
+    }
+    writers = {i: sink.open(i) for i in file_paths}
+    try:
+        header = _render_service_template(package, template_path, file_paths[0], skip_isort)
+        previous = {i: blackify(header, i) for i in set(format_paths.values())}
+        for file_path, writer in writers.items():
+            writer.write(previous[format_paths[file_path]])
+
+        for index in range(0, len(package.typed_dicts), TYPE_DEFS_CHUNK_SIZE):
+            typed_dicts = package.typed_dicts[index : index + TYPE_DEFS_CHUNK_SIZE]
+            chunk = _render_typed_dicts(package, typed_dicts)
+            formatted = {i: blackify(chunk, i) for i in previous}
+            for file_path, writer in writers.items():
+                format_path = format_paths[file_path]
+                writer.write(_get_chunk_separator(previous[format_path], format_path))
+                writer.write(formatted[format_path])
+            previous = formatted
+    except BaseException:
+        for writer in writers.values():
+            writer.abort()
+        raise
+
+    for writer in writers.values():
+        sink.commit(writer)
+
+
+def _render_typed_dicts(package: ServicePackage, typed_dicts: Sequence[TypeTypedDict]) -> str:
+    with FakeAnnotation.frozen():
+        return render_jinja2_template(
+            Path("common/typed_dicts.py.jinja2"),
+            package=package,
+            service_name=package.service_name,
+            typed_dicts=typed_dicts,
+        )
+
+
+def _get_chunk_separator(previous: str, format_path: Path) -> str:
+    """
+    Get blank lines between separately formatted chunks the same way `black` puts them.
+
+    `black` puts two blank lines after top-level blocks in `.py` files.
+    """
+    last_line = previous.rstrip("\n").rsplit("\n", 1)[-1]
+    if format_path.suffix == ".py" and last_line.startswith((" ", "\t")):
+        return "\n\n"
+    return "\n"
 
 
 def write_service_docs(package: ServicePackage, output_path: Path) -> None:
@@ -188,11 +266,12 @@ def write_service_docs(package: ServicePackage, output_path: Path) -> None:
         )
 
     for file_path, template_path in file_paths:
-        content = render_jinja2_template(
-            template_path,
-            package=package,
-            service_name=package.service_name,
-        )
+        with FakeAnnotation.frozen():
+            content = render_jinja2_template(
+                template_path,
+                package=package,
+                service_name=package.service_name,
+            )
         content = insert_md_toc(content)
         content = format_md(content)
         if not file_path.exists() or file_path.read_text() != content:
@@ -1,19 +1,113 @@
 """
 Jinja2 renderer and black formatter.
 """
+import hashlib
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Any, Iterable, Optional, Tuple
 
 import black
+import jinja2
 import mdformat
 from black import InvalidInput, NothingChanged
+from black import __version__ as black_version
+from isort import __version__ as isort_version
 from isort.api import Config, sort_code_string
 
-from mypy_boto3_builder.constants import LINE_LENGTH, TEMPLATES_PATH
+from mypy_boto3_builder.constants import LINE_LENGTH
 from mypy_boto3_builder.jinja_manager import JinjaManager
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.package import Package
+from mypy_boto3_builder.utils.disk_cache import evict_least_recently_used, write_atomic
 from mypy_boto3_builder.utils.markdown import TableOfContents
+from mypy_boto3_builder.utils.profiler import Profiler
+
+
+class FormatterCache:
+    """
+    Persistent cache of `black` and `isort` results keyed by input content hash.
+
+    Disabled until `FormatterCache.enable` is called.
+    """
+
+    path: Optional[Path] = None
+    suffix = ".txt"
+    hits = 0
+    misses = 0
+
+    @classmethod
+    def enable(cls, path: Path) -> None:
+        """
+        Store formatted content in `path`.
+
+        Arguments:
+            path -- Cache directory.
+        """
+        cls.path = path
+
+    @classmethod
+    def get_key(cls, *parts: str) -> str:
+        """
+        Get cache key for formatter settings and input content.
+        """
+        hasher = hashlib.sha256()
+        for part in parts:
+            hasher.update(part.encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    @classmethod
+    def get(cls, key: str) -> Optional[str]:
+        """
+        Get formatted content by `key`.
+        """
+        if cls.path is None:
+            return None
+
+        entry_path = cls.path / f"{key}{cls.suffix}"
+        try:
+            result = entry_path.read_bytes().decode("utf-8")
+        except (OSError, UnicodeDecodeError):
+            cls.misses += 1
+            return None
+
+        entry_path.touch()
+        cls.hits += 1
+        return result
+
+    @classmethod
+    def set(cls, key: str, content: str) -> None:
+        """
+        Store formatted `content` by `key`.
+        """
+        if cls.path is None:
+            return
+
+        write_atomic(cls.path / f"{key}{cls.suffix}", content.encode())
+
+    @classmethod
+    def evict(cls, max_size: int) -> None:
+        """
+        Remove least recently used entries until cache fits `max_size` bytes.
+        """
+        if cls.path is None or not cls.path.exists():
+            return
+
+        evict_least_recently_used(cls.path, f"*{cls.suffix}", max_size)
+
+    @classmethod
+    def get_counters(cls) -> Tuple[int, int]:
+        """
+        Get cache hits and misses.
+        """
+        return cls.hits, cls.misses
+
+    @classmethod
+    def add_counters(cls, hits: int, misses: int) -> None:
+        """
+        Add cache hits and misses from worker processes.
+        """
+        cls.hits += hits
+        cls.misses += misses
 
 
 def blackify(content: str, file_path: Path) -> str:
@@ -35,15 +129,24 @@ def blackify(content: str, file_path: Path) -> str:
     if file_path.suffix not in (".py", ".pyi"):
         return content
 
+    cache_key = FormatterCache.get_key(
+        "black", black_version, file_path.suffix, str(LINE_LENGTH), content
+    )
+    cached_content = FormatterCache.get(cache_key)
+    if cached_content is not None:
+        return cached_content
+
     file_mode = black.FileMode(is_pyi=file_path.suffix == ".pyi", line_length=LINE_LENGTH)
     try:
-        content = black.format_file_contents(content, fast=True, mode=file_mode)
+        with Profiler.phase("black"):
+            content = black.format_file_contents(content, fast=True, mode=file_mode)
     except NothingChanged:
         pass
     except (IndentationError, InvalidInput) as e:
         file_path.write_text(content)
         raise ValueError(f"Cannot parse {file_path}: {e}") from e
 
+    FormatterCache.set(cache_key, content)
     return content
 
 
@@ -71,23 +174,34 @@ def sort_imports(
     if module_name in known_third_party:
         known_third_party.remove(module_name)
 
-    result = sort_code_string(
-        code=content,
-        extension=extension,
-        config=Config(
-            profile="black",
-            known_first_party=[module_name],
-            known_third_party=known_third_party,
-            line_length=LINE_LENGTH,
-        ),
+    cache_key = FormatterCache.get_key(
+        "isort", isort_version, module_name, extension, *known_third_party, content
     )
-    return result or ""
+    cached_content = FormatterCache.get(cache_key)
+    if cached_content is not None:
+        return cached_content
+
+    with Profiler.phase("isort"):
+        result = sort_code_string(
+            code=content,
+            extension=extension,
+            config=Config(
+                profile="black",
+                known_first_party=[module_name],
+                known_third_party=known_third_party,
+                line_length=LINE_LENGTH,
+            ),
+        )
+    result = result or ""
+    FormatterCache.set(cache_key, result)
+    return result
 
 
 def render_jinja2_template(
     template_path: Path,
     package: Optional[Package] = None,
     service_name: Optional[ServiceName] = None,
+    **kwargs: Any,
 ) -> str:
     """
     Render Jinja2 template to a string.
@@ -96,16 +210,17 @@ def render_jinja2_template(
         template_path -- Relative path to template in `TEMPLATES_PATH`
         module -- Module record.
         service_name -- ServiceName instance.
+        kwargs -- Extra template variables.
 
     Returns:
         A rendered template.
     """
-    template_full_path = TEMPLATES_PATH / template_path
-    if not template_full_path.exists():
-        raise ValueError(f"Template {template_path} not found")
-
-    template = JinjaManager.get_environment().get_template(template_path.as_posix())
-    return template.render(package=package, service_name=service_name)
+    with Profiler.phase("jinja"):
+        try:
+            template = JinjaManager.get_environment().get_template(template_path.as_posix())
+        except jinja2.TemplateNotFound as e:
+            raise ValueError(f"Template {template_path} not found") from e
+        return template.render(package=package, service_name=service_name, **kwargs)
 
 
 def insert_md_toc(text: str) -> str:
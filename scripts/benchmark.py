@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+"""
+Benchmark of builder stages over a fixed basket of real botocore services.
+
+Uses installed boto3 and botocore data offline, all caches are disabled.
+Results are saved per git commit to `.benchmarks` and can be compared
+with results of another commit.
+"""
+import argparse
+import json
+import logging
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import boto3
+import botocore
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, ROOT_PATH.as_posix())
+
+from mypy_boto3_builder.constants import DUMMY_REGION  # noqa: E402
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName  # noqa: E402
+from mypy_boto3_builder.jinja_manager import JinjaManager  # noqa: E402
+from mypy_boto3_builder.logger import get_logger  # noqa: E402
+from mypy_boto3_builder.main import get_available_service_names  # noqa: E402
+from mypy_boto3_builder.parsers.method_memo import MethodMemo  # noqa: E402
+from mypy_boto3_builder.parsers.service_package import parse_service_package  # noqa: E402
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog  # noqa: E402
+from mypy_boto3_builder.structures.service_package import ServicePackage  # noqa: E402
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation  # noqa: E402
+from mypy_boto3_builder.utils.strings import get_anchor_link  # noqa: E402
+from mypy_boto3_builder.writers.processors import process_service  # noqa: E402
+from mypy_boto3_builder.writers.utils import blackify, render_jinja2_template  # noqa: E402
+
+BENCHMARKS_PATH = ROOT_PATH / ".benchmarks"
+SERVICE_NAMES = ["s3", "ec2", "dynamodb", "sagemaker", "iam", "sso"]
+CLIENT_TEMPLATE_PATH = Path("service") / "service" / ServiceModuleName.client.template_name
+BENCHMARKS = (
+    "parse_service_package",
+    "extract_typed_dicts",
+    "render_jinja2_template",
+    "blackify",
+    "process_service",
+)
+
+Results = Dict[str, Dict[str, float]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="Best of N runs.")
+    parser.add_argument(
+        "-b", "--benchmark", action="append", choices=list(BENCHMARKS), help="Run selected only."
+    )
+    parser.add_argument("--save", action="store_true", help="Save results for current commit.")
+    parser.add_argument("--compare", type=Path, help="Compare with saved results file.")
+    parser.add_argument("services", nargs="*", default=SERVICE_NAMES)
+    return parser.parse_args()
+
+
+def get_commit() -> str:
+    """
+    Get current git commit with a dirty tree marker.
+    """
+    commit = subprocess.check_output(
+        ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_PATH, text=True
+    ).strip()
+    status = subprocess.check_output(
+        ["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT_PATH, text=True
+    )
+    return f"{commit}-dirty" if status.strip() else commit
+
+
+def setup_globals() -> None:
+    """
+    Set Jinja globals the same way as `main.main` does.
+    """
+    JinjaManager.update_globals(
+        master_pypi_name="mypy-boto3",
+        master_module_name="mypy_boto3",
+        boto3_stubs_name="boto3-stubs",
+        boto3_version=boto3.__version__,
+        botocore_version=botocore.__version__,
+        build_version=boto3.__version__,
+        min_build_version=boto3.__version__,
+        botocore_build_version=botocore.__version__,
+        builder_version="benchmark",
+        get_anchor_link=get_anchor_link,
+        render_docstrings=True,
+        hasattr=hasattr,
+    )
+
+
+def measure(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Get best time of `repeat` runs.
+
+    `MethodMemo` is process-wide, it is cleared before each run.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        MethodMemo.clear()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_parse(session: boto3.Session, service_name: ServiceName) -> Callable[[], Any]:
+    return lambda: parse_service_package(session, service_name)
+
+
+def bench_extract_typed_dicts(package: ServicePackage) -> Callable[[], Any]:
+    def func() -> None:
+        package._typed_dict_graph = None
+        with FakeAnnotation.frozen():
+            package.extract_typed_dicts()
+
+    return func
+
+
+def bench_render(package: ServicePackage) -> Callable[[], Any]:
+    return lambda: render_jinja2_template(
+        CLIENT_TEMPLATE_PATH, package=package, service_name=package.service_name
+    )
+
+
+def bench_blackify(package: ServicePackage) -> Callable[[], Any]:
+    content = render_jinja2_template(
+        CLIENT_TEMPLATE_PATH, package=package, service_name=package.service_name
+    )
+    return lambda: blackify(content, Path(ServiceModuleName.client.stub_file_name))
+
+
+def bench_process_service(session: boto3.Session, service_name: ServiceName) -> Callable[[], Any]:
+    def func() -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            process_service(session, service_name, Path(output_dir), generate_setup=True)
+
+    return func
+
+
+def run(
+    session: boto3.Session, service_name: ServiceName, names: List[str], repeat: int
+) -> Dict[str, float]:
+    """
+    Run benchmarks for a service.
+    """
+    package = parse_service_package(session, service_name)
+    package.replace_self_references()
+    funcs: Dict[str, Callable[[], Any]] = {
+        "parse_service_package": bench_parse(session, service_name),
+        "extract_typed_dicts": bench_extract_typed_dicts(package),
+        "render_jinja2_template": bench_render(package),
+        "blackify": bench_blackify(package),
+        "process_service": bench_process_service(session, service_name),
+    }
+    return {name: measure(funcs[name], repeat) for name in names}
+
+
+def print_results(results: Results, previous: Optional[Results]) -> None:
+    names = [i for i in BENCHMARKS if any(i in times for times in results.values())]
+    print(f"{'service':<12}" + "".join(f"{i:>24}" for i in names))
+    for service_name, times in results.items():
+        cells: List[str] = []
+        for name in names:
+            cell = f"{times[name]:.3f}s"
+            old_time = (previous or {}).get(service_name, {}).get(name)
+            if old_time:
+                cell = f"{cell} {times[name] / old_time:5.2f}x"
+            cells.append(f"{cell:>24}")
+        print(f"{service_name:<12}" + "".join(cells))
+
+
+def main() -> None:
+    args = parse_args()
+    get_logger(level=logging.WARNING)
+    setup_globals()
+    session = boto3.Session(region_name=DUMMY_REGION)
+    get_available_service_names(session)
+    names = args.benchmark or list(BENCHMARKS)
+    results: Results = {}
+    for name in args.services:
+        results[name] = run(session, ServiceNameCatalog.find(name), names, args.repeat)
+
+    previous: Optional[Results] = None
+    if args.compare:
+        previous = json.loads(args.compare.read_text())["results"]
+    print_results(results, previous)
+
+    if args.save:
+        commit = get_commit()
+        data = {
+            "commit": commit,
+            "python": platform.python_version(),
+            "boto3": boto3.__version__,
+            "botocore": botocore.__version__,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        BENCHMARKS_PATH.mkdir(exist_ok=True)
+        output_path = BENCHMARKS_PATH / f"{commit}.json"
+        output_path.write_text(json.dumps(data, indent=4))
+        print(f"Saved to {output_path.relative_to(ROOT_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
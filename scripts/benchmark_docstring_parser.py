@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""
+Benchmark of hand-written docstring tokenizers against pyparsing grammars.
+
+Uses real boto3 resource method docstrings, checks that both paths
+produce the same request syntax and `:type` results.
+"""
+import argparse
+import inspect
+import re
+import sys
+import textwrap
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import boto3
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, ROOT_PATH.as_posix())
+
+from mypy_boto3_builder.parsers.docstring_parser.grammar_session import GrammarSession  # noqa: E402
+from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar  # noqa: E402
+from mypy_boto3_builder.parsers.docstring_parser.syntax_tokenizer import (  # noqa: E402
+    SyntaxTokenizer,
+)
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_grammar import (  # noqa: E402
+    TypeDocGrammar,
+)
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_tokenizer import (  # noqa: E402
+    TypeDocTokenizer,
+)
+from mypy_boto3_builder.utils.strings import get_line_with_indented  # noqa: E402
+
+RE_PARAM = re.compile("\n:param ")
+
+Inputs = Dict[str, List[str]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    parser.add_argument("services", nargs="*", default=["s3", "ec2", "iam", "dynamodb", "sqs"])
+    return parser.parse_args()
+
+
+def get_resource_docstrings(service_names: Iterable[str]) -> List[str]:
+    """
+    Get docstrings of resource actions and collections.
+    """
+    session = boto3.Session(region_name="us-east-1")
+    result: List[str] = []
+    for service_name in service_names:
+        service_resource = session.resource(service_name)  # type: ignore
+        resources: List[Any] = [service_resource]
+        for sub_resource in service_resource.meta.resource_model.subresources:
+            identifiers = ["id" for _ in sub_resource.resource.model.identifiers]
+            resources.append(getattr(service_resource, sub_resource.name)(*identifiers))
+        for resource in resources:
+            resource_model = resource.meta.resource_model
+            for action in resource_model.actions:
+                result.append(inspect.getdoc(getattr(resource, action.name)) or "")
+            for collection in resource_model.collections:
+                collection_manager = getattr(resource, collection.name)
+                result.append(inspect.getdoc(collection_manager.filter) or "")
+    return [textwrap.dedent(i) for i in result]
+
+
+def get_section(docstring: str, header: str) -> str:
+    """
+    Get section with indented lines the same way as `DocstringParser` does.
+    """
+    index = docstring.index(header)
+    while index > 0 and docstring[index - 1] == " ":
+        index -= 1
+    return get_line_with_indented(docstring[index:], True)
+
+
+def get_inputs(docstrings: Iterable[str]) -> Inputs:
+    """
+    Split docstrings to request syntax, `:type` and `:param` inputs.
+    """
+    result: Inputs = {"request_syntax": [], "type": [], "param": []}
+    for docstring in docstrings:
+        if "**Request Syntax**" in docstring:
+            result["request_syntax"].append(get_section(docstring, "**Request Syntax**"))
+        result["type"].extend(i for i in docstring.split("\n") if i.startswith(":type "))
+        for match in RE_PARAM.finditer(docstring):
+            result["param"].append(get_line_with_indented(docstring[match.start() + 1 :]))
+    return result
+
+
+def parse_request_syntax_grammar(text: str) -> Dict[str, Any]:
+    return SyntaxGrammar.request_syntax.parseString(text).asDict()
+
+
+def parse_type_grammar(text: str) -> Dict[str, Any]:
+    return TypeDocGrammar.type_definition.parseString(text).asDict()
+
+
+def parse_param_grammar(text: str) -> Dict[str, Any]:
+    TypeDocGrammar.reset()
+    return TypeDocGrammar.param_definition.parseString(text).asDict()
+
+
+PARSERS: Dict[str, Tuple[Callable[[str], Dict[str, Any]], Callable[[str], Dict[str, Any]]]] = {
+    "request_syntax": (parse_request_syntax_grammar, SyntaxTokenizer.parse_request_syntax),
+    "type": (parse_type_grammar, TypeDocTokenizer.parse_type_definition),
+    "param": (parse_param_grammar, TypeDocTokenizer.parse_param_definition),
+}
+
+
+def measure(
+    parser: Callable[[str], Dict[str, Any]], inputs: List[str], repeat: int
+) -> Tuple[float, List[Dict[str, Any]]]:
+    """
+    Get best time of `repeat` runs and parse results.
+    """
+    best = float("inf")
+    results: List[Dict[str, Any]] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parser(i) for i in inputs]
+        best = min(best, time.perf_counter() - start)
+    return best, results
+
+
+def get_mismatches(
+    name: str, grammar_results: List[Dict[str, Any]], tokenizer_results: List[Dict[str, Any]]
+) -> int:
+    """
+    Count different results.
+
+    With packrat cache enabled `indentedBlock` in `TypeDocGrammar.param_definition`
+    drops lines after a nested block, so only `name` and `description` are compared for `:param`.
+    """
+    if name == "param":
+        keys = ("name", "description")
+        grammar_results = [{k: i[k] for k in keys} for i in grammar_results]
+        tokenizer_results = [{k: i[k] for k in keys} for i in tokenizer_results]
+    return sum(1 for a, b in zip(grammar_results, tokenizer_results) if a != b)
+
+
+def main() -> None:
+    args = parse_args()
+    GrammarSession.enable()
+    docstrings = get_resource_docstrings(args.services)
+    inputs = get_inputs(docstrings)
+    print(f"{len(docstrings)} docstrings of {', '.join(args.services)} resources")
+    print(f"{'input':<16}{'count':>8}{'pyparsing':>12}{'tokenizer':>12}{'speedup':>10}{'diff':>6}")
+    for name, (grammar_parser, tokenizer_parser) in PARSERS.items():
+        grammar_time, grammar_results = measure(grammar_parser, inputs[name], args.repeat)
+        tokenizer_time, tokenizer_results = measure(tokenizer_parser, inputs[name], args.repeat)
+        mismatches = get_mismatches(name, grammar_results, tokenizer_results)
+        speedup = grammar_time / tokenizer_time if tokenizer_time else float("inf")
+        print(
+            f"{name:<16}{len(inputs[name]):>8}{grammar_time:>11.3f}s{tokenizer_time:>11.3f}s"
+            f"{speedup:>9.1f}x{mismatches:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
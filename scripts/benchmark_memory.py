@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+"""
+Benchmark of per-service peak memory usage.
+
+Each service is processed in a separate subprocess, the same way a parallel
+build worker does. Peak RSS is reported after imports and service discovery
+and after the service is processed. Results are saved per git commit to
+`.benchmarks` and can be compared with results of another commit.
+"""
+import argparse
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import boto3
+import botocore
+
+ROOT_PATH = Path(__file__).parent.parent.resolve()
+sys.path.insert(0, ROOT_PATH.as_posix())
+
+from benchmark import BENCHMARKS_PATH, SERVICE_NAMES, get_commit, setup_globals  # noqa: E402
+
+from mypy_boto3_builder.constants import DUMMY_REGION  # noqa: E402
+from mypy_boto3_builder.logger import get_logger  # noqa: E402
+from mypy_boto3_builder.main import get_available_service_names  # noqa: E402
+from mypy_boto3_builder.service_name import ServiceNameCatalog  # noqa: E402
+from mypy_boto3_builder.writers.processors import process_service  # noqa: E402
+
+METRICS = ("base_rss", "peak_rss", "service_rss")
+
+Results = Dict[str, Dict[str, float]]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(__file__)
+    parser.add_argument("--save", action="store_true", help="Save results for current commit.")
+    parser.add_argument("--compare", type=Path, help="Compare with saved results file.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("services", nargs="*", default=SERVICE_NAMES)
+    return parser.parse_args()
+
+
+def get_peak_rss() -> float:
+    """
+    Get peak RSS of current process in megabytes.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(name: str) -> None:
+    """
+    Process service and print peak RSS values as JSON.
+    """
+    get_logger(level=logging.WARNING)
+    setup_globals()
+    session = boto3.Session(region_name=DUMMY_REGION)
+    get_available_service_names(session)
+    base_rss = get_peak_rss()
+    with tempfile.TemporaryDirectory() as output_dir:
+        process_service(
+            session, ServiceNameCatalog.find(name), Path(output_dir), generate_setup=True
+        )
+    peak_rss = get_peak_rss()
+    print(
+        json.dumps({"base_rss": base_rss, "peak_rss": peak_rss, "service_rss": peak_rss - base_rss})
+    )
+
+
+def run(name: str) -> Dict[str, float]:
+    """
+    Run benchmark for a service in a subprocess.
+    """
+    output = subprocess.check_output(
+        [sys.executable, __file__, "--child", name], cwd=ROOT_PATH, text=True
+    )
+    return json.loads(output.splitlines()[-1])
+
+
+def print_results(results: Results, previous: Optional[Results]) -> None:
+    print(f"{'service':<12}" + "".join(f"{i:>20}" for i in METRICS))
+    for service_name, values in results.items():
+        cells: List[str] = []
+        for name in METRICS:
+            cell = f"{values[name]:.1f}MB"
+            old_value = (previous or {}).get(service_name, {}).get(name)
+            if old_value:
+                cell = f"{cell} {values[name] / old_value:5.2f}x"
+            cells.append(f"{cell:>20}")
+        print(f"{service_name:<12}" + "".join(cells))
+
+
+def main() -> None:
+    args = parse_args()
+    if args.child:
+        run_child(args.child)
+        return
+
+    results: Results = {}
+    for name in args.services:
+        results[name] = run(name)
+
+    previous: Optional[Results] = None
+    if args.compare:
+        previous = json.loads(args.compare.read_text())["results"]
+    print_results(results, previous)
+
+    if args.save:
+        commit = get_commit()
+        data = {
+            "commit": commit,
+            "python": platform.python_version(),
+            "boto3": boto3.__version__,
+            "botocore": botocore.__version__,
+            "results": results,
+        }
+        BENCHMARKS_PATH.mkdir(exist_ok=True)
+        output_path = BENCHMARKS_PATH / f"{commit}-memory.json"
+        output_path.write_text(json.dumps(data, indent=4))
+        print(f"Saved to {output_path.relative_to(ROOT_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
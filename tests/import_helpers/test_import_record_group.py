@@ -0,0 +1,62 @@
+from mypy_boto3_builder.import_helpers.import_record import ImportRecord
+from mypy_boto3_builder.import_helpers.import_record_group import ImportRecordGroup
+from mypy_boto3_builder.import_helpers.import_string import ImportString
+from mypy_boto3_builder.writers.utils import sort_imports
+
+
+class TestImportRecordGroup:
+    def test_render(self) -> None:
+        source = ImportString("typing")
+        assert (
+            ImportRecordGroup(source, [ImportRecord(source, "Any")]).render()
+            == "from typing import Any"
+        )
+        assert (
+            ImportRecordGroup(
+                source, [ImportRecord(source, "Any"), ImportRecord(source, "IO")]
+            ).render()
+            == "from typing import Any, IO"
+        )
+        names = [f"LongTypeName{i}" for i in range(10)]
+        assert ImportRecordGroup(
+            source, [ImportRecord(source, name) for name in names]
+        ).render().splitlines() == ["from typing import (", *[f"    {i}," for i in names], ")"]
+
+    def test_get_sections(self) -> None:
+        import_records = [
+            ImportRecord(ImportString.parent() + ImportString("literals"), "MyType"),
+            ImportRecord(ImportString("typing"), "overload"),
+            ImportRecord(ImportString("typing"), "Dict"),
+            ImportRecord(ImportString("typing"), "IO"),
+            ImportRecord(ImportString("sys")),
+            ImportRecord(ImportString("botocore", "client"), "BaseClient"),
+            ImportRecord(
+                ImportString("boto3", "resources", "base"), "ServiceResource", "Boto3Resource"
+            ),
+            ImportRecord(ImportString("boto3", "resources", "base"), "ResourceModel"),
+            ImportRecord(ImportString("mypy_boto3_s3"), "S3Client"),
+            ImportRecord(ImportString("datetime"), "datetime"),
+            ImportRecord(
+                ImportString("typing"),
+                "Literal",
+                fallback=ImportRecord(ImportString("typing_extensions"), "Literal"),
+            ),
+        ]
+        sections = ImportRecordGroup.get_sections(import_records, "mypy_boto3_s3")
+        content = "\n\n".join(
+            "\n".join(group.render() for group in section) for section in sections
+        )
+        assert content == (
+            "import sys\n"
+            "from datetime import datetime\n"
+            "from typing import IO, Dict, overload\n"
+            "\n"
+            "from boto3.resources.base import ResourceModel\n"
+            "from boto3.resources.base import ServiceResource as Boto3Resource\n"
+            "from botocore.client import BaseClient\n"
+            "\n"
+            "from mypy_boto3_s3 import S3Client\n"
+            "\n"
+            "from .literals import MyType"
+        )
+        assert sort_imports(f"{content}\n", "mypy_boto3_s3", extension="pyi") == f"{content}\n"
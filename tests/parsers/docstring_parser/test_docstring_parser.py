@@ -1,6 +1,8 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from mypy_boto3_builder.parsers.docstring_parser.docstring_parser import DocstringParser
+from mypy_boto3_builder.parsers.docstring_parser.syntax_tokenizer import SyntaxTokenizerError
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_tokenizer import TypeDocTokenizerError
 from mypy_boto3_builder.type_annotations.type import Type
 
 
@@ -92,3 +94,32 @@ class TestDocstringParser:
         assert len(result) == 1
         assert result[0].name == "name"
         assert result[0].type_annotation == Type.str
+
+    @patch("mypy_boto3_builder.parsers.docstring_parser.docstring_parser.TypeDocTokenizer")
+    @patch("mypy_boto3_builder.parsers.docstring_parser.docstring_parser.SyntaxTokenizer")
+    def test_get_arguments_fallback(
+        self, SyntaxTokenizerMock: MagicMock, TypeDocTokenizerMock: MagicMock
+    ) -> None:
+        SyntaxTokenizerMock.parse_request_syntax.side_effect = SyntaxTokenizerError("error")
+        TypeDocTokenizerMock.parse_type_definition.side_effect = TypeDocTokenizerError("error")
+        TypeDocTokenizerMock.parse_param_definition.side_effect = TypeDocTokenizerError("error")
+        input_string = """
+        **Request Syntax**
+        ::
+
+            response = client.get(
+                Name='string',
+                Count=123
+            )
+
+        :type Name: string
+        :param Name: **[REQUIRED]** Name.
+        """
+        service_name_mock = MagicMock()
+        docstring_parser = DocstringParser(service_name_mock, "ClassName", "method_name", [])
+        result = docstring_parser.get_arguments(input_string)
+        assert [i.name for i in result] == ["Name", "Count"]
+        assert result[0].type_annotation == Type.str
+        assert result[0].default is None
+        assert result[1].type_annotation == Type.int
+        SyntaxTokenizerMock.parse_request_syntax.assert_called_once()
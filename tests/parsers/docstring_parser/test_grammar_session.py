@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.parsers.docstring_parser.grammar_session import GrammarSession, GrammarStats
+
+
+class TestGrammarStats:
+    def test_render(self) -> None:
+        stats = GrammarStats("SyntaxGrammar.request_syntax")
+        assert stats.render() == "SyntaxGrammar.request_syntax 0x 0.000s"
+        stats.calls = 2
+        stats.time = 1.5
+        stats.cache_hits = 1
+        stats.cache_misses = 3
+        assert stats.render() == "SyntaxGrammar.request_syntax 2x 1.500s 1/4 cache hits"
+
+
+class TestGrammarSession:
+    @patch("mypy_boto3_builder.parsers.docstring_parser.grammar_session.ParserElement")
+    def test_enable(self, ParserElementMock: MagicMock) -> None:
+        with patch.object(GrammarSession, "enabled", False):
+            GrammarSession.enable()
+            GrammarSession.enable()
+            ParserElementMock.enablePackrat.assert_called_once_with(cache_size_limit=64)
+
+    @patch("mypy_boto3_builder.parsers.docstring_parser.grammar_session.ParserElement")
+    def test_measure(self, ParserElementMock: MagicMock) -> None:
+        ParserElementMock.packrat_cache_stats = [0, 0]
+        with patch.object(GrammarSession, "enabled", True):
+            GrammarSession.reset_stats()
+            with GrammarSession.measure("fast"):
+                pass
+            with GrammarSession.measure("slow"):
+                ParserElementMock.packrat_cache_stats = [2, 3]
+            with pytest.raises(ValueError):
+                with GrammarSession.measure("slow"):
+                    raise ValueError("error")
+
+        assert GrammarSession.stats["fast"].calls == 1
+        assert GrammarSession.stats["slow"].calls == 2
+        assert GrammarSession.stats["slow"].cache_hits == 2
+        assert GrammarSession.stats["slow"].cache_misses == 3
+        assert GrammarSession.render_stats().startswith("slow 2x")
+        GrammarSession.reset_stats()
+        assert GrammarSession.render_stats() == ""
@@ -0,0 +1,84 @@
+import pytest
+
+from mypy_boto3_builder.parsers.docstring_parser.grammar_session import GrammarSession
+from mypy_boto3_builder.parsers.docstring_parser.syntax_grammar import SyntaxGrammar
+from mypy_boto3_builder.parsers.docstring_parser.syntax_tokenizer import (
+    SyntaxTokenizer,
+    SyntaxTokenizerError,
+)
+
+REQUEST_SYNTAX = """
+**Request Syntax**
+::
+
+  response = bucket.put_object(
+      ACL='private'|'public-read',
+      Body=b'bytes'|file,
+      CopySource='string' or {'Bucket': 'string', 'VersionId': 'string'},
+      Expires=datetime(2015, 1, 1),
+      Metadata={
+          'string': 'string'
+      },
+      Tags=[
+          {
+              'Key': 'string',
+              'Value': 123
+          },
+      ],
+      Empty=[...],
+      EmptyDict={},
+      Recursive={'... recursive ...'},
+      Flag=True|False
+  )
+"""
+
+RESPONSE_SYNTAX = """
+**Response Syntax**
+::
+
+    {
+        'Body': StreamingBody(),
+        'Items': [
+            'string',
+        ],
+        'Nested': [
+            [
+                123,
+            ],
+        ]
+    }
+"""
+
+
+class TestSyntaxTokenizer:
+    def test_parse_request_syntax(self) -> None:
+        GrammarSession.enable()
+        expected = SyntaxGrammar.request_syntax.parseString(REQUEST_SYNTAX).asDict()
+        result = SyntaxTokenizer.parse_request_syntax(REQUEST_SYNTAX)
+        assert result == expected
+        assert [i["name"] for i in result["arguments"]][:3] == ["ACL", "Body", "CopySource"]
+        assert result["arguments"][3]["value"] == {
+            "func_call": {
+                "name": "datetime",
+                "args": [{"value": "2015"}, {"value": "1"}, {"value": "1"}],
+            }
+        }
+        assert SyntaxTokenizer.parse_request_syntax("**Request Syntax**\n::\n  client.get()") == {}
+
+    def test_parse_response_syntax(self) -> None:
+        GrammarSession.enable()
+        expected = SyntaxGrammar.response_syntax.parseString(RESPONSE_SYNTAX).asDict()
+        assert SyntaxTokenizer.parse_response_syntax(RESPONSE_SYNTAX) == expected
+
+    def test_errors(self) -> None:
+        header = "**Request Syntax**\n::\n  "
+        with pytest.raises(SyntaxTokenizerError):
+            SyntaxTokenizer.parse_request_syntax("**Response Syntax**\n::\n  client.get()")
+        with pytest.raises(SyntaxTokenizerError):
+            SyntaxTokenizer.parse_request_syntax(f"{header}get(Key='value)")
+        with pytest.raises(SyntaxTokenizerError):
+            SyntaxTokenizer.parse_request_syntax(f"{header}get(Key_1='value')")
+        with pytest.raises(SyntaxTokenizerError):
+            SyntaxTokenizer.parse_request_syntax(f"{header}get(Key={{'a': 'b'}} or 'c')")
+        with pytest.raises(SyntaxTokenizerError):
+            SyntaxTokenizer.parse_response_syntax("**Response Syntax**\n::\n  {'string'}")
@@ -0,0 +1,96 @@
+import inspect
+import textwrap
+
+import pyparsing
+import pytest
+from boto3.session import Session
+from pyparsing import ParserElement
+
+from mypy_boto3_builder.parsers.docstring_parser.docstring_parser import DocstringParser
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_grammar import TypeDocGrammar
+from mypy_boto3_builder.parsers.docstring_parser.type_doc_tokenizer import (
+    TypeDocTokenizer,
+    TypeDocTokenizerError,
+)
+from mypy_boto3_builder.utils.strings import get_line_with_indented
+
+PARAM_DEFINITION = """:param Config: **[REQUIRED]**
+
+  The configuration.
+
+
+  - **Name** *(string) --*
+
+    Name.
+"""
+
+
+class TestTypeDocTokenizer:
+    def test_parse_type_definition(self) -> None:
+        for type_string in (":type Bucket: string", ":type  Bucket : dict  ", ":type Body: "):
+            TypeDocGrammar.reset()
+            expected = TypeDocGrammar.type_definition.parseString(type_string).asDict()
+            assert TypeDocTokenizer.parse_type_definition(type_string) == expected
+
+        with pytest.raises(TypeDocTokenizerError):
+            TypeDocTokenizer.parse_type_definition(":type Bucket")
+        with pytest.raises(TypeDocTokenizerError):
+            TypeDocTokenizer.parse_type_definition(":rtype: string")
+
+    def test_parse_param_definition(self) -> None:
+        result = TypeDocTokenizer.parse_param_definition(PARAM_DEFINITION)
+        assert result["name"] == "Config"
+        assert result["description"] == "**[REQUIRED]**"
+        assert result["indented"] == [
+            {"line": ["The configuration."]},
+            {
+                "name": "Name",
+                "type_name": "string",
+                "description": "",
+                "line": ["-", " ", "**", "Name", "**", " ", "*(", "string", ")", " ", "--*", ""],
+                "indented": [{"line": ["Name."]}],
+            },
+        ]
+        nested_result = TypeDocTokenizer.parse_param_definition(
+            ":param Name: \n  - *(list) --*\n\n    - *(dict) --*\n\n      Rule.\n  Name."
+        )
+        assert [i.get("type_name") for i in nested_result["indented"]] == ["list", None]
+        assert nested_result["indented"][0]["indented"][0]["type_name"] == "dict"
+        assert TypeDocTokenizer.parse_param_definition(":param Name: Name.") == {
+            "name": "Name",
+            "description": "Name.",
+        }
+
+        with pytest.raises(TypeDocTokenizerError):
+            TypeDocTokenizer.parse_param_definition(":param Name\n  description: text")
+        with pytest.raises(TypeDocTokenizerError):
+            TypeDocTokenizer.parse_param_definition(":param Name: \n    line\n  line")
+        with pytest.raises(TypeDocTokenizerError):
+            TypeDocTokenizer.parse_param_definition(":param Name: \n  - **Key-Name** *(string) --*")
+
+    @pytest.mark.skipif(
+        not pyparsing.__version__.startswith("2."),
+        reason="TypeDocGrammar key lines are parsed by locked pyparsing 2",
+    )
+    def test_parse_param_definition_grammar(self) -> None:
+        client = Session(region_name="us-east-1").client("s3")
+        param_strings = []
+        for method_name in ("delete_objects", "put_bucket_lifecycle_configuration", "put_object"):
+            docstring = textwrap.dedent(inspect.getdoc(getattr(client, method_name)) or "")
+            for match in DocstringParser.RE_PARAM.finditer(docstring):
+                param_strings.append(get_line_with_indented(docstring[match.start() + 1 :]))
+        assert param_strings
+
+        # packrat cache memoizes `indentedBlock` results regardless of indent stack
+        packrat_enabled = ParserElement._packratEnabled
+        parse = ParserElement._parse
+        ParserElement._packratEnabled = False
+        ParserElement._parse = ParserElement._parseNoCache
+        try:
+            for param_string in param_strings:
+                TypeDocGrammar.reset()
+                expected = TypeDocGrammar.param_definition.parseString(param_string).asDict()
+                assert TypeDocTokenizer.parse_param_definition(param_string) == expected
+        finally:
+            ParserElement._packratEnabled = packrat_enabled
+            ParserElement._parse = parse
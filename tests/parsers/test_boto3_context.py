@@ -0,0 +1,43 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import DataNotFoundError, UnknownServiceError
+
+from mypy_boto3_builder.parsers.boto3_context import Boto3Context
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestBoto3Context:
+    service_name = ServiceName("s3", "S3")
+
+    def test_init(self) -> None:
+        session_mock = MagicMock()
+        context = Boto3Context(session_mock, self.service_name)
+        session_mock.client.assert_called_once_with("s3")
+        assert context.client == session_mock.client()
+        assert context.service_model == session_mock.client().meta.service_model
+        assert context.client_exceptions == session_mock.client().exceptions
+        assert context.waiter_model == session_mock._session.get_waiter_model()
+
+    def test_resource(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.determine_latest_version.return_value = "2006-03-01"
+        session_mock._loader.load_service_model.return_value = {"service": {}, "resources": {}}
+        context = Boto3Context(session_mock, self.service_name)
+        resource_class_mock = session_mock.resource_factory.load_from_definition.return_value
+        assert context.resource == resource_class_mock.return_value
+        resource_class_mock.assert_called_once_with(client=context.client)
+        assert context.resource == resource_class_mock.return_value
+        session_mock.resource.assert_not_called()
+        session_mock.client.assert_called_once_with("s3")
+
+    def test_no_resource(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.load_service_model.side_effect = UnknownServiceError(
+            service_name="s3", known_service_names="ec2"
+        )
+        session_mock._session.get_waiter_model.side_effect = DataNotFoundError(data_path="s3")
+        context = Boto3Context(session_mock, self.service_name)
+        assert context.resource is None
+        assert context.resource_model is None
+        assert context.waiter_model is None
+        assert context.get_service_context().resource_json_definitions == {}
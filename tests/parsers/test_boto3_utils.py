@@ -0,0 +1,50 @@
+from unittest.mock import MagicMock
+
+from botocore.exceptions import DataNotFoundError, UnknownServiceError
+
+from mypy_boto3_builder.parsers.boto3_utils import (
+    get_boto3_paginator_names,
+    get_boto3_waiter_names,
+    has_boto3_resource,
+)
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestBoto3Utils:
+    service_name = ServiceName("s3", "S3")
+
+    def test_get_boto3_waiter_names(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.determine_latest_version.return_value = "2006-03-01"
+        session_mock._loader.load_service_model.return_value = {
+            "waiters": {"ObjectExists": {}, "BucketExists": {}}
+        }
+        assert get_boto3_waiter_names(session_mock, self.service_name) == [
+            "bucket_exists",
+            "object_exists",
+        ]
+        session_mock._loader.load_service_model.assert_called_with("s3", "waiters-2", "2006-03-01")
+
+        session_mock._loader.load_service_model.side_effect = DataNotFoundError(data_path="s3")
+        assert get_boto3_waiter_names(session_mock, self.service_name) == []
+
+    def test_get_boto3_paginator_names(self) -> None:
+        session_mock = MagicMock()
+        session_mock._loader.load_service_model.return_value = {
+            "pagination": {"ListObjects": {}, "ListBuckets": {}}
+        }
+        assert get_boto3_paginator_names(session_mock, self.service_name) == [
+            "ListBuckets",
+            "ListObjects",
+        ]
+
+        session_mock._loader.load_service_model.side_effect = UnknownServiceError(
+            service_name="s3", known_service_names="ec2"
+        )
+        assert get_boto3_paginator_names(session_mock, self.service_name) == []
+
+    def test_has_boto3_resource(self) -> None:
+        session_mock = MagicMock()
+        session_mock.get_available_resources.return_value = ["ec2", "s3"]
+        assert has_boto3_resource(session_mock, self.service_name)
+        assert not has_boto3_resource(session_mock, ServiceName("sqs", "SQS"))
@@ -0,0 +1,44 @@
+from mypy_boto3_builder.parsers.method_memo import MethodMemo
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.structures.argument import Argument
+from mypy_boto3_builder.structures.method import Method
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+
+
+class TestMethodMemo:
+    def setup_method(self) -> None:
+        MethodMemo.clear()
+
+    def teardown_method(self) -> None:
+        MethodMemo.clear()
+
+    def test_get_set(self) -> None:
+        def close(self: object) -> None:
+            pass
+
+        key = MethodMemo.get_key("Client", "close", close, "Close client.")  # type: ignore
+        assert key != MethodMemo.get_key("Client", "close", close, "Other.")  # type: ignore
+        method = Method(
+            "close",
+            [Argument("self", None), Argument("names", TypeSubscript(Type.List, [Type.str]))],
+            Type.none,
+        )
+        assert MethodMemo.get(key) is None
+        MethodMemo.set(key, method)
+        assert MethodMemo.get(key) is None
+        MethodMemo.set(key, method)
+
+        result = MethodMemo.get(key)
+        assert result is not None
+        assert result is not method
+        assert [i.render() for i in result.arguments] == [i.render() for i in method.arguments]
+        assert result.arguments[1].type_annotation is not method.arguments[1].type_annotation
+        assert result.return_type is Type.none
+        assert MethodMemo.get_counters() == (1, 2)
+        MethodMemo.add_counters(2, 3)
+        assert MethodMemo.get_counters() == (3, 5)
+
+    def test_is_supported(self) -> None:
+        assert MethodMemo.is_supported(ServiceNameCatalog.add("sqs", "SQS"))
+        assert not MethodMemo.is_supported(ServiceNameCatalog.ec2)
@@ -1,18 +1,39 @@
 from unittest.mock import MagicMock, patch
 
+from boto3.session import Session
+
 from mypy_boto3_builder.parsers.service_package import parse_service_package
-from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.utils.profiler import Profiler
 
 
 class TestBoto3StubsPackage:
-    @patch("mypy_boto3_builder.parsers.client.ClientExceptionsFactory")
-    def test_parse_boto3_stubs_package(self, ClientExceptionsFactoryMock: MagicMock) -> None:
+    def test_parse_boto3_stubs_package(self) -> None:
         session_mock = MagicMock()
         service_name_mock = MagicMock()
-        session_mock.resource().meta.service_name = "s3"
-        session_mock.resource().meta.client.meta.service_model.service_name = "s3"
         service_name_mock.boto3_name = "s3"
-        ClientExceptionsFactoryMock.create_client_exceptions.return_value = []
 
         result = parse_service_package(session_mock, service_name=service_name_mock)
         assert result.service_name == service_name_mock
+
+    def test_parse_service_package_subset(self) -> None:
+        session = Session(region_name="us-east-1")
+        with patch.object(Profiler, "enabled", True), patch.object(Profiler, "stats", {}):
+            result = parse_service_package(
+                session, ServiceNameCatalog.s3, operation_names=["ListObjects", "HeadBucket"]
+            )
+            phase_calls = {i.name: i.calls for i in Profiler.pop_stats()}
+        assert phase_calls["load_models"] == 2
+        assert phase_calls["client"] == 1
+        method_names = {i.name for i in result.client.methods}
+        assert {"list_objects", "head_bucket", "can_paginate", "get_paginator"} <= method_names
+        assert "get_object" not in method_names
+        assert result.service_resource is None
+        assert [i.name for i in result.paginators] == ["ListObjectsPaginator"]
+        assert [i.name for i in result.waiters] == [
+            "BucketExistsWaiter",
+            "BucketNotExistsWaiter",
+        ]
+        typed_dict_names = {i.name for i in result.typed_dicts}
+        assert "ListObjectsOutputTypeDef" in typed_dict_names
+        assert "GetObjectOutputTypeDef" not in typed_dict_names
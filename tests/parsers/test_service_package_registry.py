@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.parsers.service_package_registry import ServicePackageRegistry
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.paginator import Paginator
+from mypy_boto3_builder.structures.service_package import ServicePackage
+from mypy_boto3_builder.structures.service_resource import ServiceResource
+from mypy_boto3_builder.structures.waiter import Waiter
+
+
+class TestServicePackageRegistry:
+    def test_add(self) -> None:
+        service_name = ServiceName("s3", "S3")
+        package = ServicePackage(
+            name="mypy_boto3_s3",
+            pypi_name="mypy-boto3-s3",
+            service_name=service_name,
+            client=Client("S3Client", service_name, MagicMock()),
+            service_resource=ServiceResource("S3ServiceResource", service_name, MagicMock()),
+            waiters=[Waiter("BucketExistsWaiter", "bucket_exists", service_name)],
+            paginators=[
+                Paginator("ListObjectsPaginator", "ListObjects", "list_objects", service_name)
+            ],
+        )
+        registry = ServicePackageRegistry()
+        registry.add(package)
+        assert service_name in registry
+
+        session_mock = MagicMock()
+        result = registry.get(session_mock, service_name)
+        assert result is not package
+        assert result.client.name == "S3Client"
+        with pytest.raises(ValueError):
+            result.client.boto3_client
+        assert result.service_resource
+        assert result.service_resource.boto3_service_resource is None
+        assert result.waiters[0].name == "BucketExistsWaiter"
+        assert result.paginators[0].operation_name == "list_objects"
+        session_mock.client.assert_not_called()
+
+    @patch("mypy_boto3_builder.parsers.service_package_registry.parse_fake_service_package")
+    def test_get(self, parse_fake_service_package_mock: MagicMock) -> None:
+        service_name = ServiceName("s3", "S3")
+        session_mock = MagicMock()
+        registry = ServicePackageRegistry()
+        assert service_name not in registry
+        result = registry.get(session_mock, service_name)
+        assert result == parse_fake_service_package_mock.return_value
+        registry.get(session_mock, service_name)
+        parse_fake_service_package_mock.assert_called_once_with(session_mock, service_name)
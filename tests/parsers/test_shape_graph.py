@@ -0,0 +1,75 @@
+from botocore.model import ServiceModel
+
+from mypy_boto3_builder.parsers.shape_graph import ShapeGraph
+
+
+class TestShapeGraph:
+    def setup_method(self) -> None:
+        self.service_model = ServiceModel(
+            {
+                "metadata": {},
+                "operations": {
+                    "GetStatement": {
+                        "input": {"shape": "GetStatementRequest"},
+                        "output": {"shape": "Statement"},
+                    },
+                    "Ping": {},
+                },
+                "shapes": {
+                    "GetStatementRequest": {
+                        "type": "structure",
+                        "members": {"Name": {"shape": "String"}},
+                    },
+                    "Statement": {
+                        "type": "structure",
+                        "members": {
+                            "Name": {"shape": "String"},
+                            "Statements": {"shape": "Statements"},
+                            "Self": {"shape": "Statement"},
+                        },
+                    },
+                    "Statements": {"type": "list", "member": {"shape": "Statement"}},
+                    "Tags": {
+                        "type": "map",
+                        "key": {"shape": "String"},
+                        "value": {"shape": "Tag"},
+                    },
+                    "Tag": {"type": "structure", "members": {"Tag": {"shape": "Tag"}}},
+                    "String": {"type": "string"},
+                },
+            }
+        )
+        self.graph = ShapeGraph(self.service_model)
+
+    def test_init(self) -> None:
+        assert len(self.graph) == 6
+        assert "Statement" in self.graph
+        assert "Unknown" not in self.graph
+
+    def test_get_children(self) -> None:
+        assert self.graph.get_children("Statement") == ("String", "Statements", "Statement")
+        assert self.graph.get_children("Tags") == ("String", "Tag")
+        assert self.graph.get_children("String") == ()
+        assert self.graph.get_children("Unknown") == ()
+
+    def test_get_operation_shape_names(self) -> None:
+        assert self.graph.get_operation_shape_names("GetStatement") == [
+            "GetStatementRequest",
+            "Statement",
+        ]
+        assert self.graph.get_operation_shape_names("Ping") == []
+
+    def test_get_reachable(self) -> None:
+        assert self.graph.get_reachable(["Tags"]) == {"Tags", "String", "Tag"}
+        assert self.graph.get_operations_reachable(["GetStatement"]) == {
+            "GetStatementRequest",
+            "Statement",
+            "Statements",
+            "String",
+        }
+        assert self.graph.get_operations_reachable(["Ping"]) == set()
+
+    def test_get_recursive_shape_names(self) -> None:
+        assert self.graph.get_recursive_shape_names() == {"Statement", "Statements", "Tag"}
+        assert self.graph.is_recursive("Tag")
+        assert not self.graph.is_recursive("Tags")
@@ -1,8 +1,10 @@
 from unittest.mock import MagicMock, patch
 
+import pytest
 from botocore.exceptions import UnknownServiceError
+from botocore.model import ListShape, ServiceModel, StringShape
 
-from mypy_boto3_builder.parsers.shape_parser import ShapeParser
+from mypy_boto3_builder.parsers.shape_parser import ShapeParser, ShapeParserError
 
 
 class TestShapeParser:
@@ -118,3 +120,56 @@ class TestShapeParser:
         assert result.arguments[1].is_kwflag()
         assert result.arguments[2].name == "optional_arg"
         assert result.arguments[3].name == "InputToken"
+
+    def test_parse_shape_cache(self) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        shape_parser = ShapeParser(session_mock, service_name_mock)
+        shape = StringShape("MyEnum", {"type": "string", "enum": ["a", "b"]})
+        list_shape = ListShape("MyEnumList", {"type": "list", "member": {"shape": "MyEnum"}})
+        list_shape.member = shape  # type: ignore
+        result = shape_parser._parse_shape(list_shape)
+        assert result.render() == "List[MyEnumType]"
+        assert shape_parser._parse_shape(list_shape) is result
+        assert shape_parser._parse_shape(list_shape, output_child=True) is not result
+        assert shape_parser._parse_shape(shape) is result.children[0]  # type: ignore
+
+    def test_operation_names(self) -> None:
+        session_mock = MagicMock()
+        service_name_mock = MagicMock()
+        session_mock._loader.load_service_model.return_value = {
+            "pagination": {"GetStatement": {}, "ListStatements": {}}
+        }
+        service_model = ServiceModel(
+            {
+                "metadata": {},
+                "operations": {
+                    "GetStatement": {"name": "GetStatement", "output": {"shape": "Statement"}},
+                    "ListStatements": {"name": "ListStatements"},
+                },
+                "shapes": {
+                    "Statement": {
+                        "type": "structure",
+                        "members": {"Statements": {"shape": "Statements"}},
+                    },
+                    "Statements": {"type": "list", "member": {"shape": "Statement"}},
+                },
+            }
+        )
+        shape_parser = ShapeParser(
+            session_mock, service_name_mock, service_model, operation_names=["GetStatement"]
+        )
+        assert shape_parser.get_paginator_names() == ["GetStatement"]
+        assert shape_parser.get_recursive_typed_dict_names() == set()
+        result = shape_parser.get_client_method_map()
+        assert "get_statement" in result
+        assert "list_statements" not in result
+        assert shape_parser.get_recursive_typed_dict_names() == {"StatementTypeDef"}
+        with pytest.raises(ShapeParserError):
+            shape_parser._parse_shape(StringShape("Name", {"type": "string"}))
+
+        shape_parser = ShapeParser(
+            session_mock, service_name_mock, service_model, operation_names=["Unknown"]
+        )
+        with pytest.raises(ShapeParserError):
+            shape_parser.get_client_method_map()
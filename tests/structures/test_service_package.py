@@ -1,5 +1,6 @@
 import pytest
 
+from mypy_boto3_builder.enums.service_module_name import ServiceModuleName
 from mypy_boto3_builder.service_name import ServiceName
 from mypy_boto3_builder.structures.client import Client
 from mypy_boto3_builder.structures.paginator import Paginator
@@ -60,6 +61,37 @@ class TestServicePackage:
     def test_get_literals_required_import_records(self) -> None:
         assert len(self.service_package.get_literals_required_import_records()) == 2
 
+    def test_build_index(self) -> None:
+        service_package = self.service_package
+        import_records = {
+            i: service_package.get_module_required_import_records(i) for i in ServiceModuleName
+        }
+        service_package.build_index()
+        for module_name, module_import_records in import_records.items():
+            assert (
+                service_package.get_module_required_import_records(module_name)
+                == module_import_records
+            )
+        assert service_package.get_client_required_import_records() is (
+            service_package.get_module_required_import_records(ServiceModuleName.client)
+        )
+        assert service_package.get_module_types(ServiceModuleName.literals) == {
+            service_package.literals[0]
+        }
+        assert service_package.get_module_types(ServiceModuleName.client).issubset(
+            service_package.get_types()
+        )
+
+        type_defs_import_records = service_package.get_type_defs_required_import_records()
+        assert service_package.get_type_defs_required_import_records() is type_defs_import_records
+        service_package.typed_dicts = []
+        assert service_package.get_type_defs_required_import_records() == []
+
+        literals_types = service_package.get_module_types(ServiceModuleName.literals)
+        assert service_package.get_module_types(ServiceModuleName.literals) is literals_types
+        service_package.literals = []
+        assert service_package.get_module_types(ServiceModuleName.literals) == set()
+
     def test_validate(self) -> None:
         self.service_package.validate()
         with pytest.raises(ValueError):
@@ -70,3 +102,20 @@ class TestServicePackage:
             service_package = self.service_package
             service_package.literals[0].name = "MyTypedDict"
             service_package.validate()
+
+    def test_replace_self_references(self) -> None:
+        service_package = self.service_package
+        typed_dict = service_package.typed_dicts[0]
+        typed_dict.add_attribute("self", typed_dict, False)
+        service_package.recursive_typed_dict_names = set()
+        service_package.replace_self_references()
+        assert typed_dict.replace_with_dict == set()
+
+        import_records = service_package.get_type_defs_required_import_records()
+
+        service_package.recursive_typed_dict_names = None
+        service_package.replace_self_references()
+        assert typed_dict.replace_with_dict == {"MyTypedDict"}
+        assert len(service_package.get_type_defs_required_import_records()) == (
+            len(import_records) + 2
+        )
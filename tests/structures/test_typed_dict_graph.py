@@ -0,0 +1,44 @@
+from mypy_boto3_builder.structures.typed_dict_graph import TypedDictGraph
+from mypy_boto3_builder.type_annotations.type import Type
+from mypy_boto3_builder.type_annotations.type_literal import TypeLiteral
+from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
+from mypy_boto3_builder.type_annotations.type_typed_dict import TypeTypedDict
+
+
+class TestTypedDictGraph:
+    def setup_method(self) -> None:
+        self.literal = TypeLiteral("MyLiteral", ["a", "b"])
+        self.parent = TypeTypedDict("Parent")
+        self.child = TypeTypedDict("Child")
+        self.parent.add_attribute("child", TypeSubscript(Type.List, [self.child]), True)
+        self.parent.add_attribute("self", self.parent, False)
+        self.child.add_attribute("parent", self.parent, False)
+        self.child.add_attribute("literal", self.literal, True)
+        self.graph = TypedDictGraph([self.parent])
+
+    def test_init(self) -> None:
+        assert len(self.graph) == 2
+        assert self.child in self.graph
+        assert TypeTypedDict("Child") not in self.graph
+
+    def test_get_children_typed_dicts(self) -> None:
+        assert self.graph.get_children_typed_dicts(self.parent) == {self.parent, self.child}
+        assert self.graph.get_children_typed_dicts(self.child) == {self.parent}
+
+        other = TypeTypedDict("Other", [])
+        assert self.graph.get_children_typed_dicts(other) == set()
+        assert other in self.graph
+
+    def test_iterate_reachable(self) -> None:
+        assert list(self.graph.iterate_reachable([self.child])) == [self.child, self.parent]
+
+    def test_get_literals(self) -> None:
+        assert self.graph.get_literals([self.parent]) == {self.literal}
+        assert self.graph.get_literals([self.child]) == {self.literal}
+        assert self.graph.get_literals([]) == set()
+
+    def test_replace_self_references(self) -> None:
+        self.graph.replace_self_references(self.child)
+        assert self.child.replace_with_dict == {"Parent"}
+        self.graph.replace_self_references(self.parent)
+        assert "Parent" in self.parent.replace_with_dict
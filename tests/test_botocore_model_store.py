@@ -0,0 +1,69 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from boto3.session import Session
+from botocore.loaders import Loader
+
+from mypy_boto3_builder.botocore_model_store import BotocoreModelStore, StoreFileLoader
+
+
+class TestBotocoreModelStore:
+    def setup_method(self) -> None:
+        BotocoreModelStore.path = None
+        BotocoreModelStore.hits = 0
+        BotocoreModelStore.misses = 0
+
+    def teardown_method(self) -> None:
+        self.setup_method()
+
+    def test_load(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir) / "service-2.json"
+            data_path.write_text(json.dumps({"metadata": {"serviceId": "S3"}}))
+            loader = StoreFileLoader()
+            assert loader.load_file(str(data_path)[: -len(".json")]) == {
+                "metadata": {"serviceId": "S3"}
+            }
+            assert BotocoreModelStore.get_counters() == (0, 0)
+
+            BotocoreModelStore.enable(Path(temp_dir) / "store")
+            decode_mock = MagicMock(return_value={"key": "value"})
+            assert BotocoreModelStore.load(str(data_path), decode_mock) == {"key": "value"}
+            assert BotocoreModelStore.load(str(data_path), decode_mock) == {"key": "value"}
+            decode_mock.assert_called_once_with()
+            assert BotocoreModelStore.get_counters() == (1, 1)
+
+            data_path.write_text(json.dumps({"metadata": {}}))
+            os.utime(data_path, ns=(0, 0))
+            assert loader.load_file(str(data_path)[: -len(".json")]) == {"metadata": {}}
+            assert BotocoreModelStore.get_counters() == (1, 2)
+            assert loader.load_file(str(Path(temp_dir) / "unknown")) is None
+
+            BotocoreModelStore.evict(0)
+            assert list((Path(temp_dir) / "store").iterdir()) == []
+
+    def test_load_service_model(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir) / "myservice" / "2021-01-01" / "service-2.json"
+            data_path.parent.mkdir(parents=True)
+            data_path.write_text(json.dumps({"metadata": {"serviceId": "MyService"}}))
+            BotocoreModelStore.enable(Path(temp_dir) / "store")
+            for _ in range(2):
+                loader = Loader(
+                    extra_search_paths=[temp_dir],
+                    file_loader=StoreFileLoader(),
+                    include_default_search_paths=False,
+                )
+                assert loader.load_service_model("myservice", "service-2") == {
+                    "metadata": {"serviceId": "MyService"}
+                }
+            assert BotocoreModelStore.get_counters() == (1, 1)
+
+    def test_install(self) -> None:
+        session = Session(region_name="us-east-1")
+        BotocoreModelStore.install(session)
+        loader = session._session.get_component("data_loader")  # type: ignore
+        assert isinstance(loader.file_loader, StoreFileLoader)
@@ -0,0 +1,31 @@
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.build_manifest import BuildManifest, get_builder_hash
+from mypy_boto3_builder.service_name import ServiceName
+
+
+class TestBuildManifest:
+    def test_get_builder_hash(self) -> None:
+        assert get_builder_hash("1.2.3") == get_builder_hash("1.2.3")
+        assert get_builder_hash("1.2.3") != get_builder_hash("1.2.4")
+
+    def test_load_save(self) -> None:
+        service_name = ServiceName("s3", "S3")
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            manifest = BuildManifest.load(output_path, "hash")
+            assert manifest.is_changed(service_name, "model")
+            manifest.add(service_name, "model")
+            manifest.save()
+
+            manifest = BuildManifest.load(output_path, "hash")
+            assert not manifest.is_changed(service_name, "model")
+            assert manifest.is_changed(service_name, "new_model")
+
+            manifest = BuildManifest.load(output_path, "new_hash")
+            assert manifest.is_changed(service_name, "model")
+
+            manifest.path.write_text("invalid")
+            manifest = BuildManifest.load(output_path, "hash")
+            assert manifest.is_changed(service_name, "model")
@@ -1,6 +1,9 @@
+import argparse
 from unittest.mock import MagicMock, patch
 
-from mypy_boto3_builder.cli_parser import get_absolute_path, parse_args
+import pytest
+
+from mypy_boto3_builder.cli_parser import get_absolute_path, get_positive_int, parse_args
 
 
 class TestCLIParser:
@@ -14,3 +17,17 @@ class TestCLIParser:
         result = get_absolute_path("test/output")
         PathMock.assert_called_with("test/output")
         assert result == PathMock().absolute()
+
+    def test_get_positive_int(self) -> None:
+        assert get_positive_int("4") == 4
+        with pytest.raises(argparse.ArgumentTypeError):
+            get_positive_int("0")
+        with pytest.raises(argparse.ArgumentTypeError):
+            get_positive_int("-1")
+        with pytest.raises(argparse.ArgumentTypeError):
+            get_positive_int("many")
+
+    def test_parse_args_jobs(self) -> None:
+        assert parse_args(["output", "-j", "2"]).jobs == 2
+        with pytest.raises(SystemExit):
+            parse_args(["output", "-j", "0"])
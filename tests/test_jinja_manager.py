@@ -0,0 +1,30 @@
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.jinja_manager import JinjaManager
+
+
+class TestJinjaManager:
+    def teardown_method(self) -> None:
+        JinjaManager.bytecode_cache_path = None
+        JinjaManager.get_environment().bytecode_cache = None
+
+    def test_update_globals(self) -> None:
+        JinjaManager.update_globals(test_global="value")
+        assert JinjaManager.get_environment().globals["test_global"] == "value"
+
+    def test_enable_bytecode_cache(self) -> None:
+        environment = JinjaManager.get_environment()
+        assert not environment.auto_reload
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = Path(temp_dir) / "jinja"
+            JinjaManager.enable_bytecode_cache(cache_path)
+            assert JinjaManager.bytecode_cache_path == cache_path
+            assert environment.cache is not None
+            environment.cache.clear()
+            environment.get_template("common/literal.py.jinja2")
+            assert len(list(cache_path.iterdir())) == 1
+
+            environment.cache.clear()
+            environment.get_template("common/literal.py.jinja2")
+            assert len(list(cache_path.iterdir())) == 1
@@ -4,7 +4,13 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 from mypy_boto3_builder.cli_parser import Namespace
-from mypy_boto3_builder.main import generate_docs, generate_stubs, get_available_service_names, main
+from mypy_boto3_builder.main import (
+    generate_docs,
+    generate_service_stubs,
+    generate_stubs,
+    get_available_service_names,
+    main,
+)
 from mypy_boto3_builder.service_name import ServiceName
 
 
@@ -77,3 +83,43 @@ class TestMain:
             process_boto3_stubs_mock.assert_called()
             process_master_mock.assert_called()
             process_service_mock.assert_called()
+
+    @patch("mypy_boto3_builder.main.get_service_model_hash")
+    @patch("mypy_boto3_builder.main.process_service")
+    def test_generate_service_stubs_incremental(
+        self, process_service_mock: MagicMock, get_service_model_hash_mock: MagicMock
+    ) -> None:
+        get_service_model_hash_mock.return_value = "model_hash"
+        service_name = ServiceName("s3", "S3")
+        with tempfile.TemporaryDirectory() as output_dir:
+            namespace = Namespace(
+                log_level=0,
+                output_path=Path(output_dir),
+                service_names=["s3"],
+                build_version="1.2.3.post4",
+                installed=False,
+                skip_master=False,
+                skip_services=False,
+                builder_version="1.2.3",
+                generate_docs=False,
+                list_services=False,
+                incremental=True,
+            )
+            generate_service_stubs(namespace, [service_name], MagicMock(), MagicMock())
+            process_service_mock.assert_called_once()
+            generate_service_stubs(namespace, [service_name], MagicMock(), MagicMock())
+            process_service_mock.assert_called_once()
+
+            get_service_model_hash_mock.return_value = "new_model_hash"
+            generate_service_stubs(namespace, [service_name], MagicMock(), MagicMock())
+            assert len(process_service_mock.mock_calls) == 2
+            generate_service_stubs(namespace, [service_name], MagicMock(), MagicMock())
+            assert len(process_service_mock.mock_calls) == 2
+
+            namespace.format_once = True
+            generate_service_stubs(namespace, [service_name], MagicMock(), MagicMock())
+            assert len(process_service_mock.mock_calls) == 3
+
+            namespace.skip_isort = True
+            generate_service_stubs(namespace, [service_name], MagicMock(), MagicMock())
+            assert len(process_service_mock.mock_calls) == 4
@@ -0,0 +1,64 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.parallel import (
+    ParallelBuildError,
+    init_worker,
+    process_service_worker,
+    process_services_parallel,
+)
+from mypy_boto3_builder.service_name import ServiceName, ServiceNameCatalog
+
+
+class TestParallel:
+    def test_init_worker(self) -> None:
+        init_worker(0, [("s3", "S3")], {"test_global": "value"})
+        assert ServiceNameCatalog.find("s3").class_name == "S3"
+
+    @patch("mypy_boto3_builder.parallel.get_fake_service_package")
+    @patch("mypy_boto3_builder.parallel.process_service")
+    @patch("mypy_boto3_builder.parallel._WorkerState")
+    def test_process_service_worker(
+        self,
+        _WorkerStateMock: MagicMock,
+        process_service_mock: MagicMock,
+        get_fake_service_package_mock: MagicMock,
+    ) -> None:
+        result = process_service_worker("s3", Path("my_path"), True)
+        assert result == (get_fake_service_package_mock.return_value, (0, 0), (0, 0), (0, 0), [])
+        get_fake_service_package_mock.assert_called_with(process_service_mock.return_value)
+        process_service_mock.assert_called_with(
+            session=_WorkerStateMock.get_session(),
+            service_name=ServiceNameCatalog.s3,
+            output_path=Path("my_path"),
+            generate_setup=True,
+            cache=None,
+            format_once=False,
+            skip_isort=False,
+        )
+        assert ServiceNameCatalog.s3.boto3_version == ServiceName.LATEST
+
+    @patch("mypy_boto3_builder.parallel.ProcessPoolExecutor", ThreadPoolExecutor)
+    @patch("mypy_boto3_builder.parallel.init_worker")
+    @patch("mypy_boto3_builder.parallel.get_fake_service_package")
+    @patch("mypy_boto3_builder.parallel.process_service")
+    def test_process_services_parallel(
+        self,
+        process_service_mock: MagicMock,
+        _get_fake_service_package_mock: MagicMock,
+        _init_worker_mock: MagicMock,
+    ) -> None:
+        result = process_services_parallel(
+            [ServiceNameCatalog.s3, ServiceNameCatalog.ec2], Path("my_path"), True, 2
+        )
+        assert len(process_service_mock.mock_calls) == 2
+        assert len(result) == 2
+
+        process_service_mock.side_effect = ValueError("test")
+        with pytest.raises(ParallelBuildError):
+            process_services_parallel(
+                [ServiceNameCatalog.s3, ServiceNameCatalog.ec2], Path("my_path"), True, 2
+            )
@@ -0,0 +1,49 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.service_metadata_index import ServiceMetadataIndex
+
+
+class TestServiceMetadataIndex:
+    def _get_session(self, search_path: Path) -> MagicMock:
+        session_mock = MagicMock()
+        session_mock._loader.search_paths = [str(search_path)]
+        session_mock._loader.determine_latest_version.return_value = "2006-03-01"
+        session_mock._session.get_service_data.return_value = {
+            "metadata": {"serviceAbbreviation": "Amazon S3", "serviceId": "S3"}
+        }
+        return session_mock
+
+    def test_get_record(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_path = Path(temp_dir) / "data" / "s3" / "2006-03-01" / "service-2.json"
+            data_path.parent.mkdir(parents=True)
+            data_path.write_text("{}")
+            index_path = Path(temp_dir) / "services.json"
+            session_mock = self._get_session(data_path.parents[2])
+
+            index = ServiceMetadataIndex(session_mock, index_path)
+            record = index.get_record("s3")
+            assert record.class_name == "S3"
+            assert record.api_version == "2006-03-01"
+            index.save()
+            assert index_path.exists()
+
+            session_mock._session.get_service_data.reset_mock()
+            index = ServiceMetadataIndex(session_mock, index_path)
+            assert index.get_record("s3") == record
+            session_mock._session.get_service_data.assert_not_called()
+
+            data_path.write_text('{"metadata": {}}')
+            assert index.get_record("s3").fingerprint != record.fingerprint
+            session_mock._session.get_service_data.assert_called_once_with("s3")
+
+    @patch("mypy_boto3_builder.service_metadata_index.get_logger")
+    def test_invalid_index(self, get_logger_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "services.json"
+            index_path.write_text("{}")
+            index = ServiceMetadataIndex(self._get_session(Path(temp_dir)), index_path)
+            assert index.records == {}
+            get_logger_mock().warning.assert_called_once()
@@ -0,0 +1,64 @@
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mypy_boto3_builder.service_name import ServiceNameCatalog
+from mypy_boto3_builder.service_package_cache import ServicePackageCache
+from mypy_boto3_builder.structures.client import Client
+from mypy_boto3_builder.structures.service_package import ServicePackage
+
+
+class TestServicePackageCache:
+    def _get_package(self) -> ServicePackage:
+        return ServicePackage(
+            name="mypy_boto3_s3",
+            pypi_name="mypy-boto3-s3",
+            service_name=ServiceNameCatalog.s3,
+            client=Client("S3Client", ServiceNameCatalog.s3, MagicMock()),
+        )
+
+    @patch("mypy_boto3_builder.service_package_cache.get_service_model_hash")
+    def test_get_set(self, get_service_model_hash_mock: MagicMock) -> None:
+        get_service_model_hash_mock.return_value = "model_hash"
+        session_mock = MagicMock()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ServicePackageCache(Path(cache_dir), "hash", 1024 * 1024)
+            assert cache.get(session_mock, ServiceNameCatalog.s3) is None
+
+            cache.set(session_mock, self._get_package())
+            result = cache.get(session_mock, ServiceNameCatalog.s3)
+            assert result is not None
+            assert result.name == "mypy_boto3_s3"
+            assert result.service_name is ServiceNameCatalog.s3
+            assert result.client.service_name is ServiceNameCatalog.s3
+            with pytest.raises(ValueError):
+                result.client.boto3_client
+
+            get_service_model_hash_mock.return_value = "new_model_hash"
+            assert cache.get(session_mock, ServiceNameCatalog.s3) is None
+
+            cache.get_entry_path(session_mock, ServiceNameCatalog.s3).write_bytes(b"invalid")
+            assert cache.get(session_mock, ServiceNameCatalog.s3) is None
+            assert not cache.get_entry_path(session_mock, ServiceNameCatalog.s3).exists()
+
+    @patch("mypy_boto3_builder.service_package_cache.get_service_model_hash")
+    def test_evict(self, get_service_model_hash_mock: MagicMock) -> None:
+        session_mock = MagicMock()
+        entry_size = len(pickle.dumps(self._get_package(), protocol=pickle.HIGHEST_PROTOCOL))
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = ServicePackageCache(Path(cache_dir), "hash", entry_size * 2)
+            for index, model_hash in enumerate(("first", "second", "third")):
+                get_service_model_hash_mock.return_value = model_hash
+                cache.set(session_mock, self._get_package())
+                entry_path = cache.get_entry_path(session_mock, ServiceNameCatalog.s3)
+                os.utime(entry_path, (index, index))
+
+            assert len(list(cache.path.glob("*.pickle"))) == 2
+            get_service_model_hash_mock.return_value = "first"
+            assert cache.get(session_mock, ServiceNameCatalog.s3) is None
+            get_service_model_hash_mock.return_value = "third"
+            assert cache.get(session_mock, ServiceNameCatalog.s3) is not None
@@ -1,3 +1,4 @@
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_subscript import TypeSubscript
 
@@ -28,6 +29,17 @@ class TestTypeSubscript:
         assert len(self.result.children) == 3
         assert self.result.children[-1] == Type.bool
 
+    def test_frozen(self) -> None:
+        parent = TypeSubscript(Type.List, [self.result])
+        with FakeAnnotation.frozen():
+            assert str(parent) == "List[Dict[str, int]]"
+            parent_hash = hash(parent)
+            assert hash(parent) == parent_hash
+            self.result.add_child(Type.bool)
+            assert str(parent) == "List[Dict[str, int, bool]]"
+            assert str(self.result) == "Dict[str, int, bool]"
+        assert str(parent) == "List[Dict[str, int, bool]]"
+
     def test_is_dict(self) -> None:
         assert self.result.is_dict()
         assert not TypeSubscript(Type.List).is_dict()
@@ -1,5 +1,8 @@
+import pickle
+
 import pytest
 
+from mypy_boto3_builder.type_annotations.fake_annotation import FakeAnnotation
 from mypy_boto3_builder.type_annotations.type import Type
 from mypy_boto3_builder.type_annotations.type_typed_dict import TypedDictAttribute, TypeTypedDict
 
@@ -63,6 +66,27 @@ class TestTypeTypedDict:
         self.result.add_attribute("third", Type.int, False)
         assert len(self.result.children) == 3
 
+    def test_frozen(self) -> None:
+        with FakeAnnotation.frozen():
+            result_hash = hash(self.result)
+            assert str(self.result) == "MyDict"
+            self.result.stringify = True
+            assert str(self.result) == "MyDict"
+            self.result.invalidate()
+            assert str(self.result) == '"MyDict"'
+            self.result.add_attribute("third", Type.int, False)
+            assert hash(self.result) != result_hash
+
+    def test_pickle(self) -> None:
+        with FakeAnnotation.frozen():
+            assert str(self.result) == "MyDict"
+            _, state = self.result.__getstate__()
+            assert "_memo" not in state
+            result = pickle.loads(pickle.dumps(self.result))
+        assert not hasattr(self.result, "__dict__")
+        assert result.name == "MyDict"
+        assert result.render_class() == self.result.render_class()
+
     def test_is_dict(self) -> None:
         assert self.result.is_dict()
 
@@ -144,10 +168,3 @@ class TestTypeTypedDict:
 
     def test_get_children_typed_dicts(self) -> None:
         assert len(self.result.get_children_typed_dicts()) == 0
-
-    def test_get_children_literals(self) -> None:
-        assert len(self.result.get_children_literals()) == 0
-        assert len(self.result.get_children_literals([self.result])) == 0
-
-    def test_replace_self_references(self) -> None:
-        self.result.replace_self_references()
@@ -6,6 +6,8 @@ from mypy_boto3_builder.type_maps.docstring_type_map import get_type_from_docstr
 class TestDocstringTypeMap:
     def test_get_type_from_docstring(self) -> None:
         assert get_type_from_docstring("bytes")
+        assert get_type_from_docstring("bytes") is get_type_from_docstring("bytes")
+        assert get_type_from_docstring("list") is not get_type_from_docstring("list")
 
         with pytest.raises(ValueError):
             get_type_from_docstring("unknown")
@@ -0,0 +1,34 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from botocore.exceptions import DataNotFoundError
+
+from mypy_boto3_builder.service_name import ServiceName
+from mypy_boto3_builder.utils.botocore_models import get_service_model_hash, get_service_model_paths
+
+
+class TestBotocoreModels:
+    def test_get_service_model_paths(self) -> None:
+        service_name = ServiceName("s3", "S3")
+        with tempfile.TemporaryDirectory() as data_dir:
+            model_path = Path(data_dir) / "s3" / "2006-03-01"
+            model_path.mkdir(parents=True)
+            (model_path / "service-2.json").write_text("{}")
+            (model_path / "service-2.sdk-extras.json").write_text("{}")
+            (model_path / "examples-1.json").write_text("{}")
+            session_mock = MagicMock()
+            session_mock._loader.search_paths = [data_dir, "/nonexistent"]
+            session_mock._loader.determine_latest_version.return_value = "2006-03-01"
+            assert get_service_model_paths(session_mock, service_name) == [
+                model_path / "service-2.json",
+                model_path / "service-2.sdk-extras.json",
+            ]
+            model_hash = get_service_model_hash(session_mock, service_name)
+            (model_path / "service-2.json").write_text("{ }")
+            assert get_service_model_hash(session_mock, service_name) != model_hash
+
+            session_mock._loader.determine_latest_version.side_effect = DataNotFoundError(
+                data_path="s3"
+            )
+            assert get_service_model_paths(session_mock, service_name) == []
@@ -0,0 +1,45 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from mypy_boto3_builder.utils.disk_cache import AtomicTextWriter, write_atomic
+
+
+class TestDiskCache:
+    def test_write_atomic(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = Path(output_dir) / "sub" / "file.txt"
+            write_atomic(path, b"data")
+            assert path.read_bytes() == b"data"
+            assert [i.name for i in path.parent.iterdir()] == ["file.txt"]
+
+
+class TestAtomicTextWriter:
+    def test_commit(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = Path(output_dir) / "file.py"
+            writer = AtomicTextWriter(path)
+            writer.write("a = 1\n")
+            writer.write("b = 2\n")
+            assert not path.exists()
+            assert writer.commit()
+            assert path.read_text() == "a = 1\nb = 2\n"
+            assert path.stat().st_mode & 0o777 == AtomicTextWriter.get_default_mode()
+
+            writer = AtomicTextWriter(path)
+            writer.write("a = 1\nb = 2\n")
+            assert not writer.commit()
+            assert [i.name for i in path.parent.iterdir()] == ["file.py"]
+
+    def test_abort(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            path = Path(output_dir) / "file.py"
+            path.write_text("old")
+            writer = AtomicTextWriter(path)
+            writer.write("new")
+            writer.abort()
+            assert path.read_text() == "old"
+            assert [i.name for i in path.parent.iterdir()] == ["file.py"]
+            with pytest.raises(ValueError):
+                writer.write("new")
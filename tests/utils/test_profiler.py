@@ -0,0 +1,60 @@
+import csv
+import json
+import tempfile
+from pathlib import Path
+
+from mypy_boto3_builder.utils.profiler import PhaseStats, Profiler
+
+
+class TestProfiler:
+    def setup_method(self) -> None:
+        Profiler.enabled = False
+        Profiler.stats = {}
+
+    def teardown_method(self) -> None:
+        self.setup_method()
+
+    def test_phase(self) -> None:
+        with Profiler.phase("black"):
+            pass
+        assert Profiler.stats == {}
+
+        Profiler.enable()
+        with Profiler.service("s3"):
+            with Profiler.phase("black"):
+                pass
+            with Profiler.phase("black"):
+                pass
+        with Profiler.phase("jinja"):
+            pass
+        assert Profiler.stats[("s3", "black")].calls == 2
+        assert Profiler.stats[(Profiler.BUILDER_SCOPE, "jinja")].calls == 1
+        assert Profiler.scope == Profiler.BUILDER_SCOPE
+
+    def test_pop_add_stats(self) -> None:
+        stats = PhaseStats("s3", "black")
+        stats.calls = 2
+        stats.wall_time = 1.5
+        Profiler.add_stats([stats])
+        Profiler.add_stats([stats])
+        assert Profiler.stats[("s3", "black")].calls == 4
+        assert Profiler.stats[("s3", "black")].wall_time == 3.0
+        assert [i.render() for i in Profiler.get_top(1)] == [
+            "s3 black 4x 3.000s wall 0.000s cpu +0 blocks"
+        ]
+        assert [i.name for i in Profiler.get_phase_totals()] == ["black"]
+        assert len(Profiler.pop_stats()) == 1
+        assert Profiler.stats == {}
+
+    def test_write_report(self) -> None:
+        Profiler.add_stats([PhaseStats("s3", "black"), PhaseStats("ec2", "isort")])
+        with tempfile.TemporaryDirectory() as output_dir:
+            json_path = Path(output_dir) / "profile.json"
+            Profiler.write_report(json_path)
+            data = json.loads(json_path.read_text())
+            assert [i["scope"] for i in data["phases"]] == ["ec2", "s3"]
+
+            csv_path = Path(output_dir) / "profile.csv"
+            Profiler.write_report(csv_path)
+            rows = list(csv.DictReader(csv_path.read_text().splitlines()))
+            assert [i["phase"] for i in rows] == ["isort", "black"]
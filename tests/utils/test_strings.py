@@ -4,6 +4,7 @@ from mypy_boto3_builder.utils.strings import (
     get_line_with_indented,
     get_min_build_version,
     get_short_docstring,
+    get_short_docstring_from_prefix,
     is_reserved,
 )
 
@@ -55,6 +56,20 @@ class TestStrings:
             == "This action aborts a multipart upload."
         )
 
+    def test_get_short_docstring_from_prefix(self) -> None:
+        prefix = "\n\nAccepts a transfer. For more information, see docs.\n\nSee also: link\n"
+        assert get_short_docstring_from_prefix(prefix) == "Accepts a transfer."
+        assert get_short_docstring_from_prefix(prefix) == get_short_docstring(
+            f"{prefix}**Request Syntax**"
+        )
+        assert get_short_docstring_from_prefix("\n\nAccepts a transfer\n\nSee also\n") is None
+        assert get_short_docstring_from_prefix("\n\nAccepts a transfer.") is None
+        assert get_short_docstring_from_prefix("\n\n  Accepts a transfer.\n") is None
+        long_prefix = f"\n\nAccepts {'a ' * 200}transfer\n"
+        assert get_short_docstring_from_prefix(long_prefix) == get_short_docstring(
+            f"{long_prefix}**Request Syntax**".strip()
+        )
+
     def test_get_min_build_version(self):
         assert get_min_build_version("1.22.36") == "1.22.31"
         assert get_min_build_version("1.22.48.post13") == "1.22.43"
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mypy_boto3_builder.writers.output_sink import OutputSink
+
+
+class TestOutputSink:
+    def setup_method(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.manifests_path = Path(self.cache_dir.name) / "outputs"
+        self.patcher = patch.object(OutputSink, "manifests_path", self.manifests_path)
+        self.patcher.start()
+
+    def teardown_method(self) -> None:
+        self.patcher.stop()
+        self.cache_dir.cleanup()
+
+    def test_get_manifest_path(self) -> None:
+        manifest_path = OutputSink.get_manifest_path(Path("/output/package"))
+        assert manifest_path is not None
+        assert manifest_path.parent == self.manifests_path
+        assert manifest_path.suffix == ".json"
+        assert manifest_path != OutputSink.get_manifest_path(Path("/output/package2"))
+        with patch.object(OutputSink, "manifests_path", None):
+            assert OutputSink.get_manifest_path(Path("/output/package")) is None
+
+    def test_write(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            root_path = Path(output_dir) / "package"
+            root_path.mkdir()
+            (root_path / "unknown.txt").touch()
+            sink = OutputSink(root_path)
+            assert sink.manifest_path == OutputSink.get_manifest_path(root_path)
+            assert sink.previous is None
+            assert sink.write(root_path / "package" / "module.py", "a = 1\n")
+            assert sink.write(root_path / "README.md", "# README\n")
+            sink.close()
+            assert not (root_path / "unknown.txt").exists()
+            assert sorted(i.name for i in Path(output_dir).iterdir()) == ["package"]
+            assert (root_path / "package" / "module.py").read_text() == "a = 1\n"
+            assert sink.manifest_path is not None
+            manifest = json.loads(sink.manifest_path.read_text())
+            assert manifest["root_path"] == root_path.as_posix()
+            assert list(manifest["files"]) == ["README.md", "package/module.py"]
+            assert manifest["files"]["README.md"]["size"] == 9
+
+            (root_path / "unknown.txt").touch()
+            sink = OutputSink(root_path)
+            assert sink.previous is not None
+            with patch("mypy_boto3_builder.utils.disk_cache.filecmp") as filecmp_mock:
+                assert not sink.write(root_path / "package" / "module.py", "a = 1\n")
+                filecmp_mock.cmp.assert_not_called()
+            sink.close()
+            assert not (root_path / "README.md").exists()
+            assert (root_path / "unknown.txt").exists()
+            assert sorted(i.name for i in root_path.iterdir()) == ["package", "unknown.txt"]
+
+    def test_write_disabled(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir, patch.object(
+            OutputSink, "manifests_path", None
+        ):
+            root_path = Path(output_dir) / "package"
+            root_path.mkdir()
+            (root_path / "unknown.txt").touch()
+            sink = OutputSink(root_path)
+            assert sink.manifest_path is None
+            assert sink.write(root_path / "module.py", "a = 1\n")
+            sink.close()
+            assert sink.previous is None
+            assert sorted(i.name for i in Path(output_dir).iterdir()) == ["package"]
+            assert sorted(i.name for i in root_path.iterdir()) == ["module.py"]
+
+    def test_write_changed(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            root_path = Path(output_dir) / "package"
+            module_path = root_path / "module.py"
+            sink = OutputSink(root_path)
+            sink.write(module_path, "a = 1\n")
+            sink.close()
+
+            assert sink.write(module_path, "a = 2\n")
+            assert module_path.read_text() == "a = 2\n"
+
+            module_path.write_text("b = 3\n")
+            os.utime(module_path, ns=(0, 0))
+            assert sink.write(module_path, "a = 2\n")
+            assert module_path.read_text() == "a = 2\n"
+
+    def test_commit(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            root_path = Path(output_dir) / "package"
+            sink = OutputSink(root_path)
+            writer = sink.open(root_path / "module.py")
+            writer.write("a = 1\n")
+            writer.write("b = 2\n")
+            assert sink.commit(writer)
+            assert (root_path / "module.py").read_text() == "a = 1\nb = 2\n"
+            assert sink.records["module.py"].size == 12
+
+    @patch("mypy_boto3_builder.writers.output_sink.get_logger")
+    def test_invalid_manifest(self, get_logger_mock: MagicMock) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            root_path = Path(output_dir) / "package"
+            manifest_path = OutputSink.get_manifest_path(root_path)
+            assert manifest_path is not None
+            manifest_path.parent.mkdir()
+            manifest_path.write_text("{}")
+            assert OutputSink(root_path).previous is None
+            get_logger_mock().warning.assert_called_once()
@@ -29,7 +29,7 @@ class TestProcessors:
             generate_setup=True,
         )
         parse_boto3_stubs_package_mock.assert_called_with(
-            session=session_mock, service_names=[service_name_mock]
+            session=session_mock, service_names=[service_name_mock], registry=None
         )
         assert result == parse_boto3_stubs_package_mock()
 
@@ -49,7 +49,7 @@ class TestProcessors:
             output_path=Path("my_path"),
             generate_setup=True,
         )
-        parse_master_package_mock.assert_called_with(session_mock, [service_name_mock])
+        parse_master_package_mock.assert_called_with(session_mock, [service_name_mock], None)
         assert result == parse_master_package_mock()
 
     @patch("mypy_boto3_builder.writers.processors.parse_service_package")
@@ -67,6 +67,8 @@ class TestProcessors:
             result,
             output_path=Path("my_path"),
             generate_setup=True,
+            format_once=False,
+            skip_isort=False,
         )
         parse_service_package_mock.assert_called_with(session_mock, service_name_mock)
         assert result == parse_service_package_mock()
@@ -102,7 +104,7 @@ class TestProcessors:
             result,
             output_path=Path("my_path"),
         )
-        parse_boto3_stubs_package_mock.assert_called_with(session_mock, [service_name_mock])
+        parse_boto3_stubs_package_mock.assert_called_with(session_mock, [service_name_mock], None)
         assert result == parse_boto3_stubs_package_mock()
 
     @patch("mypy_boto3_builder.writers.processors.write_botocore_stubs_package")
@@ -31,8 +31,9 @@ class TestServicePackage:
                 package=package_mock,
                 service_name=package_mock.service_name,
             )
+            assert len(render_jinja2_template_mock.mock_calls) == 12
             assert len(blackify_mock.mock_calls) == 17
-            assert len(sort_imports_mock.mock_calls) == 17
+            assert len(sort_imports_mock.mock_calls) == 10
             blackify_mock.reset_mock()
             sort_imports_mock.reset_mock()
 
@@ -47,7 +48,17 @@ class TestServicePackage:
                 service_name=package_mock.service_name,
             )
             assert len(blackify_mock.mock_calls) == 16
-            assert len(sort_imports_mock.mock_calls) == 16
+            assert len(sort_imports_mock.mock_calls) == 9
+            blackify_mock.reset_mock()
+            sort_imports_mock.reset_mock()
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            write_service_package(
+                package_mock, output_path, False, format_once=True, skip_isort=True
+            )
+            assert len(blackify_mock.mock_calls) == 9
+            assert not sort_imports_mock.mock_calls
 
     def test_write_service_docs(self) -> None:
         package_mock = MagicMock()
@@ -59,3 +70,45 @@ class TestServicePackage:
             (output_path / "module").mkdir(parents=True, exist_ok=True)
             (output_path / "module" / "unknown.txt").touch()
             write_service_docs(package_mock, output_path)
+
+    @patch("mypy_boto3_builder.writers.service_package.TYPE_DEFS_CHUNK_SIZE", 2)
+    @patch("mypy_boto3_builder.writers.service_package.sort_imports")
+    @patch("mypy_boto3_builder.writers.service_package.blackify")
+    @patch("mypy_boto3_builder.writers.service_package.render_jinja2_template")
+    def test_write_service_package_type_defs(
+        self,
+        render_jinja2_template_mock: MagicMock,
+        blackify_mock: MagicMock,
+        sort_imports_mock: MagicMock,
+    ) -> None:
+        package_mock = MagicMock()
+        package_mock.name = "package"
+        package_mock.typed_dicts = ["typed_dict"] * 5
+        render_jinja2_template_mock.return_value = "render"
+        sort_imports_mock.side_effect = lambda content, *_args, **_kwargs: content
+        blackify_mock.side_effect = lambda _content, path: (
+            "class A:\n    pass\n" if path.suffix == ".py" else "A = 1\n"
+        )
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            output_path = Path(output_dir)
+            write_service_package(package_mock, output_path, False)
+            render_jinja2_template_mock.assert_called_with(
+                Path("common/typed_dicts.py.jinja2"),
+                package=package_mock,
+                service_name=package_mock.service_name,
+                typed_dicts=["typed_dict"],
+            )
+            type_defs_path = output_path / "package" / "type_defs.pyi"
+            assert type_defs_path.read_text() == "A = 1\n\n" * 3 + "A = 1\n"
+            type_defs_path = output_path / "package" / "type_defs.py"
+            assert (
+                type_defs_path.read_text()
+                == "class A:\n    pass\n\n\n" * 3 + "class A:\n    pass\n"
+            )
+            assert sorted(
+                i.name for i in type_defs_path.parent.iterdir() if "type_defs" in i.name
+            ) == [
+                "type_defs.py",
+                "type_defs.pyi",
+            ]
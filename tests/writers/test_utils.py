@@ -1,9 +1,13 @@
+import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from black import NothingChanged
+from jinja2 import TemplateNotFound
 
 from mypy_boto3_builder.writers.utils import (
+    FormatterCache,
     blackify,
     insert_md_toc,
     render_jinja2_template,
@@ -36,6 +40,37 @@ class TestUtils:
         black_mock.format_file_contents.side_effect = NothingChanged()
         assert blackify("my content", file_path_mock) == "my content"
 
+    @patch("mypy_boto3_builder.writers.utils.sort_code_string")
+    @patch("mypy_boto3_builder.writers.utils.black")
+    def test_formatter_cache(self, black_mock: MagicMock, sort_code_string_mock: MagicMock):
+        black_mock.format_file_contents.return_value = "black"
+        sort_code_string_mock.return_value = "isort"
+        with tempfile.TemporaryDirectory() as cache_dir:
+            with patch.object(FormatterCache, "path", Path(cache_dir)), patch.object(
+                FormatterCache, "hits", 0
+            ), patch.object(FormatterCache, "misses", 0):
+                assert blackify("content", Path("test.py")) == "black"
+                assert blackify("content", Path("test.py")) == "black"
+                assert blackify("content", Path("test.pyi")) == "black"
+                black_mock.format_file_contents.assert_called()
+                assert len(black_mock.format_file_contents.mock_calls) == 2
+                assert sort_imports("content", "module") == "isort"
+                assert sort_imports("content", "module") == "isort"
+                assert len(sort_code_string_mock.mock_calls) == 1
+                assert FormatterCache.get_counters() == (2, 3)
+
+                FormatterCache.evict(0)
+                assert not list(Path(cache_dir).iterdir())
+                assert blackify("content", Path("test.py")) == "black"
+                assert FormatterCache.get_counters() == (2, 4)
+
+                FormatterCache.set("unicode", "\u00e9\u2014")
+                with patch("locale.getpreferredencoding", return_value="ascii"):
+                    assert FormatterCache.get("unicode") == "\u00e9\u2014"
+                (Path(cache_dir) / f"invalid{FormatterCache.suffix}").write_bytes(b"\xff")
+                assert FormatterCache.get("invalid") is None
+                assert FormatterCache.get_counters() == (3, 5)
+
     @patch("mypy_boto3_builder.writers.utils.sort_code_string")
     def test_sort_imports(self, sort_code_string_mock: MagicMock):
         sort_code_string_mock.return_value = "output"
@@ -43,11 +78,8 @@ class TestUtils:
         sort_code_string_mock.assert_called()
         assert sort_imports("test", "boto3") == "output"
 
-    @patch("mypy_boto3_builder.writers.utils.TEMPLATES_PATH")
     @patch("mypy_boto3_builder.writers.utils.JinjaManager")
-    def test_render_jinja2_template(
-        self, JinjaManagerMock: MagicMock, TEMPLATES_PATH_MOCK: MagicMock
-    ) -> None:
+    def test_render_jinja2_template(self, JinjaManagerMock: MagicMock) -> None:
         template_path_mock = MagicMock()
         package_mock = MagicMock()
         service_name_mock = MagicMock()
@@ -61,7 +93,7 @@ class TestUtils:
         )
         assert result == JinjaManagerMock.get_environment().get_template().render()
 
-        TEMPLATES_PATH_MOCK.__truediv__().exists.return_value = False
+        JinjaManagerMock.get_environment().get_template.side_effect = TemplateNotFound("name")
         with pytest.raises(ValueError):
             render_jinja2_template(template_path_mock, package_mock, service_name_mock)
 